@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+VERSION = "20261017.1700"
+
+
+
+### SECTION :: Module Imports ############################################################
+import contextlib
+import io
+import json
+import os
+import random
+import re
+import shutil
+import sys
+import tempfile
+import time
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(script_dir)
+sys.path.insert(0, project_dir)
+sys.path.insert(0, os.path.join(project_dir, "tools"))
+
+import analyze
+
+
+
+### SECTION :: Configuration #############################################################
+# Usage: analyze_bench.py [lines] [directory]
+LINE_COUNT = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+LEGACY_SCRIPTS = ["battery_check.py", "link_check.py"]
+DEVICES = [f"Sensor_{i:02d}" for i in range(40)]
+
+
+
+### FUNCTION :: Write Synthetic Log ######################################################
+def write_synthetic_log(log_path: str, line_count: int, json_lines: bool = False) -> None:
+    """Writes Event Received lines with a create job every 50 lines, as text or JSON lines."""
+    random.seed(1)
+    write_line = _json_line if json_lines else _text_line
+    with open(log_path, 'w', encoding='utf-8') as log_file:
+        for i in range(line_count):
+            second, millis = divmod(i * 37, 1000)
+            timestamp = f"2026-10-17 {(second // 3600) % 24:02d}:{(second // 60) % 60:02d}:{second % 60:02d}.{millis:03d}"
+            device = random.choice(DEVICES)
+            if i % 50 == 0:
+                log_file.write(write_line(timestamp, "[APP]", "Event Actioned", {"mqtt_topic": f"mqtt/{device}", "action": "single", "event_mode": "create"}))
+                log_file.write(write_line(timestamp, "[DAV]", "Event Created ", {"mqtt_topic": f"mqtt/{device}", "action": "single",
+                                                                                 "event_path": f"https://example.com/cal/{i}.ics", "latency_ms": 85}))
+            else:
+                log_file.write(write_line(timestamp, "[APP]", "Event Received", {"mqtt_topic": f"mqtt/{device}", "battery": random.randint(1, 100),
+                                                                                 "linkquality": random.randint(1, 255), "temperature": 21.4}))
+
+
+def _text_line(timestamp: str, prefix: str, title: str, data: dict) -> str:
+    return f"info  {timestamp} {prefix} {title} | " + ", ".join(f"{key}='{value}'" for key, value in data.items()) + "\n"
+
+
+def _json_line(timestamp: str, prefix: str, title: str, data: dict) -> str:
+    data = dict(data)
+    record = {"ts": timestamp, "level": "info", "prefix": prefix, "event": title.strip(), "topic": data.pop("mqtt_topic")}
+    for name in ("action", "event_path", "latency_ms"):
+        if name in data:
+            record[name] = data.pop(name)
+    record["data"] = data
+    return json.dumps(record) + "\n"
+
+
+
+### FUNCTION :: Run Legacy Script ########################################################
+def run_legacy_script(script_name: str, log_path: str, last_lines: int) -> None:
+    """Runs one of the per-report tools against log_path, output discarded."""
+    script_path = os.path.join(project_dir, "tools", script_name)
+    with open(script_path, 'r', encoding='utf-8') as script_file:
+        source = script_file.read()
+    source = re.sub(r'^log_file_path = .*$', f'log_file_path = {log_path!r}', source, count=1, flags=re.M)
+    source = re.sub(r'^default_log_lines = .*$', f'default_log_lines = {last_lines}', source, count=1, flags=re.M)
+    with contextlib.redirect_stdout(io.StringIO()):
+        try:
+            exec(compile(source, script_path, 'exec'), {"__name__": "__bench__", "__file__": script_path})
+        except SystemExit:
+            pass
+
+
+
+### MAIN #################################################################################
+if __name__ == "__main__":
+    bench_dir = tempfile.mkdtemp(prefix="analyze_bench_", dir=sys.argv[2] if len(sys.argv) > 2 else None)
+    log_path = os.path.join(bench_dir, "mqtt2caldav.log")
+    try:
+        write_synthetic_log(log_path, LINE_COUNT)
+        print(f"Synthetic log: {LINE_COUNT} lines, {os.path.getsize(log_path) / 1024 / 1024:.1f} MB")
+        print(f"{'scenario':<44} | {'time':>8}")
+        print('-' * 56)
+
+        start = time.perf_counter()
+        for script_name in LEGACY_SCRIPTS:
+            run_legacy_script(script_name, log_path, LINE_COUNT)
+        legacy_elapsed = time.perf_counter() - start
+        print(f"{' + '.join(LEGACY_SCRIPTS) + ' (battery, link)':<44} | {legacy_elapsed:>6.3f} s")
+
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            analyze.print_report(analyze.analyze(log_path))
+        analyze_elapsed = time.perf_counter() - start
+        print(f"{'analyze.py (all reports, one pass)':<44} | {analyze_elapsed:>6.3f} s")
+
+        write_synthetic_log(log_path, LINE_COUNT, json_lines=True)
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            analyze.print_report(analyze.analyze(log_path))
+        json_elapsed = time.perf_counter() - start
+        print(f"{'analyze.py, JSON-lines log':<44} | {json_elapsed:>6.3f} s")
+    finally:
+        shutil.rmtree(bench_dir, ignore_errors=True)
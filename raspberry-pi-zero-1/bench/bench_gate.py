@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+VERSION = "20261017.2300"
+
+
+
+### SECTION :: Module Imports ############################################################
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+from datetime import datetime
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(script_dir)
+sys.path.insert(0, project_dir)
+
+
+
+### SECTION :: Configuration #############################################################
+E2E_BENCH_PATH = os.path.join(script_dir, "e2e_bench.py")
+MAIN_PATH = os.path.join(project_dir, "main.py")
+DEFAULT_RESULTS_DIR = os.path.join(script_dir, "results")
+DEFAULT_RUNS = 5
+DEFAULT_NOISE_FACTOR = 3.0
+# Scaling of the median absolute deviation to a standard deviation for normal noise
+MAD_SCALE = 1.4826
+# name, path in a scenario result, True when higher is better, smallest change that counts in percent
+METRICS = [
+    ("msg/s", ("messages_per_second",), True, 5.0),
+    ("events/s", ("events_per_second",), True, 5.0),
+    ("e2e p50 ms", ("e2e_ms", "p50"), False, 10.0),
+    ("e2e p95 ms", ("e2e_ms", "p95"), False, 10.0),
+    ("callback p95 ms", ("callback_ms", "p95"), False, 10.0),
+    ("recovery s", ("recovery_seconds",), False, 10.0),
+    ("peak rss MB", ("peak_rss_bytes",), False, 5.0),
+]
+VERDICT_REGRESSED = "REGRESSED"
+VERDICT_IMPROVED = "improved"
+VERDICT_NOISE = "~"
+
+
+
+### FUNCTION :: App Version ##############################################################
+def app_version() -> str:
+    """Returns VERSION from main.py without importing it."""
+    with open(MAIN_PATH, 'r', encoding='utf-8') as main_file:
+        for line in main_file:
+            match = re.match(r'VERSION\s*=\s*["\']([^"\']+)["\']', line)
+            if match:
+                return match.group(1)
+    raise ValueError(f"VERSION not found in '{MAIN_PATH}'")
+
+
+def host_key(host: dict) -> str:
+    """Returns a directory name for the CPU a result was measured on."""
+    return re.sub(r'[^A-Za-z0-9.]+', '_', f"{host.get('cpu_model', 'unknown')} {host.get('machine', '')}").strip('_')
+
+
+
+### FUNCTION :: Result History ###########################################################
+def record_path(results_dir: str, host: str, version: str) -> str:
+    return os.path.join(results_dir, host, f"{version}.json")
+
+
+def load_record(results_dir: str, host: str, version: str):
+    """Returns the stored runs of one version on one host, None when there are none."""
+    path = record_path(results_dir, host, version)
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as record_file:
+        return json.load(record_file)
+
+
+def save_record(results_dir: str, record: dict) -> str:
+    path = record_path(results_dir, record['host_key'], record['app_version'])
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as record_file:
+        json.dump(record, record_file, indent=2)
+    os.replace(temp_path, path)
+    return path
+
+
+def stored_versions(results_dir: str, host: str) -> list:
+    """Returns the versions stored for a host, oldest first."""
+    host_dir = os.path.join(results_dir, host)
+    if not os.path.isdir(host_dir):
+        return []
+    return sorted(file_name[:-5] for file_name in os.listdir(host_dir) if file_name.endswith(".json"))
+
+
+
+### FUNCTION :: Run Benchmark ############################################################
+def run_bench(runs: int, bench_args: list) -> list:
+    """Runs e2e_bench.py in a fresh interpreter per run and returns the parsed results."""
+    results = []
+    with tempfile.TemporaryDirectory(prefix="bench_gate_") as temp_dir:
+        for run in range(1, runs + 1):
+            output_path = os.path.join(temp_dir, f"run_{run}.json")
+            print(f"[RUN {run}/{runs}] {os.path.basename(E2E_BENCH_PATH)} {' '.join(bench_args)}".rstrip(), file=sys.stderr)
+            subprocess.run([sys.executable, E2E_BENCH_PATH, "--output", output_path] + bench_args, check=True)
+            with open(output_path, 'r', encoding='utf-8') as output_file:
+                results.append(json.load(output_file))
+    return results
+
+
+
+### FUNCTION :: Compare Runs #############################################################
+def median(values: list) -> float:
+    ordered = sorted(values)
+    middle = len(ordered) // 2
+    return ordered[middle] if len(ordered) % 2 else (ordered[middle - 1] + ordered[middle]) / 2
+
+
+def mad(values: list) -> float:
+    """Returns the median absolute deviation scaled to a standard deviation."""
+    center = median(values)
+    return MAD_SCALE * median([abs(value - center) for value in values])
+
+
+def metric_values(record: dict, scenario: str, path: tuple) -> list:
+    values = []
+    for run in record['runs']:
+        value = run['scenarios'].get(scenario, {})
+        for key in path:
+            value = value.get(key) if isinstance(value, dict) else None
+        if isinstance(value, (int, float)):
+            values.append(float(value))
+    return values
+
+
+def compare(baseline: dict, candidate: dict, noise_factor: float, min_change_pct: float = None) -> list:
+    """Returns one row per scenario and metric measured in both records.
+
+    A change is a regression when the medians differ in the worse direction by more than
+    noise_factor times the larger MAD of the two versions and by more than the metric's
+    smallest change that counts.
+    """
+    rows = []
+    baseline_scenarios = set().union(*(run['scenarios'] for run in baseline['runs']))
+    candidate_scenarios = set().union(*(run['scenarios'] for run in candidate['runs']))
+    for scenario in [name for name in candidate['runs'][0]['scenarios'] if name in baseline_scenarios]:
+        # A Candidate That Did Not Finish Its Jobs Fails Regardless of the Numbers
+        undrained = sum(1 for run in candidate['runs'] if not run['scenarios'].get(scenario, {}).get('drained', True))
+        if undrained:
+            rows.append({"scenario": scenario, "metric": "drained", "baseline": None, "candidate": None, "change_pct": None,
+                         "noise_pct": None, "verdict": VERDICT_REGRESSED, "note": f"{undrained} run(s) not drained"})
+
+        for name, path, higher_is_better, default_min_pct in METRICS:
+            baseline_values = metric_values(baseline, scenario, path)
+            candidate_values = metric_values(candidate, scenario, path)
+            if not baseline_values or not candidate_values:
+                continue
+            baseline_median, candidate_median = median(baseline_values), median(candidate_values)
+            noise = noise_factor * max(mad(baseline_values), mad(candidate_values))
+            difference = candidate_median - baseline_median
+            change_pct = 100.0 * difference / baseline_median if baseline_median else 0.0
+            noise_pct = 100.0 * noise / baseline_median if baseline_median else 0.0
+            threshold_pct = default_min_pct if min_change_pct is None else min_change_pct
+            worse = difference < 0 if higher_is_better else difference > 0
+
+            verdict = VERDICT_NOISE
+            if abs(difference) > noise and abs(change_pct) > threshold_pct:
+                verdict = VERDICT_REGRESSED if worse else VERDICT_IMPROVED
+            scale = 1 / 1048576 if path == ("peak_rss_bytes",) else 1
+            rows.append({"scenario": scenario, "metric": name, "baseline": round(baseline_median * scale, 3), "candidate": round(candidate_median * scale, 3),
+                         "change_pct": round(change_pct, 2), "noise_pct": round(noise_pct, 2), "verdict": verdict, "note": ""})
+    for scenario in sorted(candidate_scenarios - baseline_scenarios):
+        rows.append({"scenario": scenario, "metric": "-", "baseline": None, "candidate": None, "change_pct": None,
+                     "noise_pct": None, "verdict": VERDICT_NOISE, "note": "not in baseline"})
+    return rows
+
+
+
+### FUNCTION :: Text Output ##############################################################
+def print_table(baseline: dict, candidate: dict, rows: list) -> None:
+    """Prints the diff table of the compared versions."""
+    print(f"[COMPARE] {baseline['app_version']} ({len(baseline['runs'])} runs) -> {candidate['app_version']} ({len(candidate['runs'])} runs) | {candidate['host_key']}")
+    if baseline.get('bench_args') != candidate.get('bench_args'):
+        print(f"  [WARN] Benchmark arguments differ: {baseline.get('bench_args')} vs {candidate.get('bench_args')}")
+    if min(len(baseline['runs']), len(candidate['runs'])) < 3:
+        print("  [WARN] Fewer than 3 runs, noise cannot be estimated and only the smallest change thresholds apply")
+    print(f"  {'scenario':<13} {'metric':<16} {'baseline':>10} {'candidate':>10} {'change':>8} {'noise':>8}  verdict")
+    for row in rows:
+        if row['change_pct'] is None:
+            print(f"  {row['scenario']:<13} {row['metric']:<16} {'-':>10} {'-':>10} {'-':>8} {'-':>8}  {row['verdict']} {row['note']}".rstrip())
+            continue
+        print(f"  {row['scenario']:<13} {row['metric']:<16} {row['baseline']:>10.2f} {row['candidate']:>10.2f}"
+              f" {row['change_pct']:>+7.1f}% {row['noise_pct']:>7.1f}%  {row['verdict']}")
+
+
+
+### MAIN #################################################################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Runs the end-to-end benchmark, stores the results by app version and CPU and fails on regressions",
+                                     epilog="Arguments not listed here are passed on to e2e_bench.py, e.g. --scenario steady --duration 20")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help=f"benchmark runs per version (default: {DEFAULT_RUNS})")
+    parser.add_argument("--baseline", help="version to compare against (default: newest stored version before the candidate)")
+    parser.add_argument("--candidate", help="stored version to compare (default: VERSION of main.py)")
+    parser.add_argument("--no-run", action="store_true", help="compare stored results only")
+    parser.add_argument("--append", action="store_true", help="add the runs to the stored runs of the version instead of replacing them")
+    parser.add_argument("--host", help="CPU directory of the stored results (default: this host)")
+    parser.add_argument("--noise-factor", type=float, default=DEFAULT_NOISE_FACTOR, help=f"MADs a median has to move to count (default: {DEFAULT_NOISE_FACTOR:g})")
+    parser.add_argument("--min-change-pct", type=float, help="smallest change that counts, for every metric (default: 5%% throughput and memory, 10%% latency)")
+    parser.add_argument("--results-dir", default=DEFAULT_RESULTS_DIR, help="result history directory")
+    parser.add_argument("--json", action="store_true", help="print the comparison as JSON")
+    args, bench_args = parser.parse_known_args()
+
+    candidate_version = args.candidate or app_version()
+    candidate_host = args.host
+    if not args.no_run:
+        if args.runs < 1:
+            parser.error("--runs must be at least 1")
+        try:
+            runs = run_bench(args.runs, bench_args)
+        except (subprocess.CalledProcessError, OSError, ValueError) as e:
+            print(f"\n[ERROR] Benchmark run failed: {e}", file=sys.stderr)
+            sys.exit(2)
+        candidate_version = runs[0]['app_version']
+        candidate_host = candidate_host or host_key(runs[0]['host'])
+        record = load_record(args.results_dir, candidate_host, candidate_version) if args.append else None
+        if record is None or record.get('bench_args') != bench_args:
+            record = {"app_version": candidate_version, "host_key": candidate_host, "host": runs[0]['host'], "bench_args": bench_args, "runs": []}
+        record['runs'].extend({"timestamp": run['timestamp'], "bench_version": run['bench_version'], "settings": run['settings'],
+                               "scenarios": run['scenarios']} for run in runs)
+        record['updated'] = datetime.now().isoformat(timespec='seconds')
+        print(f"[STORED] {save_record(args.results_dir, record)} | {len(record['runs'])} runs", file=sys.stderr)
+
+    # Find the Host Directory When Comparing Stored Results Only
+    if candidate_host is None:
+        hosts = [name for name in sorted(os.listdir(args.results_dir)) if candidate_version in stored_versions(args.results_dir, name)] if os.path.isdir(args.results_dir) else []
+        if len(hosts) != 1:
+            print(f"\n[ERROR] Version {candidate_version} is stored for {len(hosts)} hosts, pick one with --host: {', '.join(hosts) or 'none'}", file=sys.stderr)
+            sys.exit(2)
+        candidate_host = hosts[0]
+
+    candidate = load_record(args.results_dir, candidate_host, candidate_version)
+    if candidate is None:
+        print(f"\n[ERROR] No results stored for version {candidate_version} on {candidate_host}", file=sys.stderr)
+        sys.exit(2)
+    baseline_version = args.baseline or next((version for version in reversed(stored_versions(args.results_dir, candidate_host)) if version < candidate_version), None)
+    baseline = load_record(args.results_dir, candidate_host, baseline_version) if baseline_version else None
+    if baseline is None:
+        print(f"[BASELINE] None stored for {candidate_host} before {candidate_version}, nothing to compare")
+        sys.exit(2 if args.baseline else 0)
+
+    comparison = compare(baseline, candidate, args.noise_factor, args.min_change_pct)
+    regressions = [row for row in comparison if row['verdict'] == VERDICT_REGRESSED]
+    if args.json:
+        print(json.dumps({"host_key": candidate_host, "baseline": baseline_version, "candidate": candidate_version,
+                          "regressions": len(regressions), "rows": comparison}, indent=2))
+    else:
+        print_table(baseline, candidate, comparison)
+        print(f"[RESULT] {len(regressions)} regression(s)" if regressions else "[RESULT] No significant regressions")
+    sys.exit(1 if regressions else 0)
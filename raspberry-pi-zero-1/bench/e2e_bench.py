@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+VERSION = "20261017.2300"
+
+
+
+### SECTION :: Module Imports ############################################################
+import argparse
+import json
+import os
+import platform
+import queue
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(script_dir)
+sys.path.insert(0, project_dir)
+
+from paho.mqtt.client import MQTTMessage
+
+import main
+from utils import logger
+from utils.caldav_registry import CaldavClientRegistry
+from utils.caldav_standin import CaldavStandin
+from utils.circuit_breaker import CircuitBreaker
+from utils.constants import CONFIG_DIR, EVENT_INDEX_FILE_NAME, LOG_FILE_NAME, OUTBOX_FILE_NAME, SETTINGS_FILE_NAME, TRACE_FILE_NAME
+from utils.event_index import EventIndex
+from utils.logger import RotatingGzipFileHandler
+from utils.outbox import Outbox
+from utils.rate_limiter import RequestLimiter
+from utils.retry_scheduler import RetryScheduler
+from utils.stats_publisher import resident_memory_bytes
+from utils.tracing import Tracer
+from utils.worker_pool import CaldavWorkerPool
+
+
+
+### SECTION :: Configuration #############################################################
+# rate 0 feeds every message at once, outage_at and outage_for are shares of the duration
+SCENARIOS = {
+    "steady": {"rate": 20, "duration": 30, "topics": 50, "match_ratio": 0.2, "delete_ratio": 0.0},
+    "burst": {"rate": 0, "messages": 1000, "topics": 50, "match_ratio": 0.5, "delete_ratio": 0.0},
+    "outage": {"rate": 10, "duration": 30, "topics": 20, "match_ratio": 0.5, "delete_ratio": 0.0, "outage_at": 0.2, "outage_for": 0.3},
+    "delete_heavy": {"rate": 10, "duration": 30, "topics": 20, "match_ratio": 1.0, "delete_ratio": 0.5},
+}
+CALDAV_USERNAME = "bench"
+CALDAV_PASSWORD = "bench"
+CALENDAR_NAME = "automation"
+DEFAULT_LATENCY_MS = 20.0
+DEFAULT_JITTER_MS = 10.0
+DRAIN_TIMEOUT_SECONDS = 120.0
+SAMPLE_INTERVAL_SECONDS = 0.1
+RANDOM_SEED = 1017
+# Settings the bench replaces in config/settings.json, everything else runs with the shipped values
+BENCH_APPLICATION_SETTINGS = {"LOG_LEVEL": "INFO", "METRICS_ENABLED": "False", "TELEMETRY_STORE": "False", "TRACE_SAMPLE_RATE": 0}
+
+
+
+### CLASS :: Collecting Tracer ###########################################################
+class CollectingTracer(Tracer):
+    """Traces every message and keeps finished traces in memory instead of writing them."""
+
+    def __init__(self, trace_path: str):
+        super().__init__(trace_path, 1.0)
+        self._finished_lock = threading.Lock()
+        self.started_count = 0
+        self.finished = []
+
+    def start(self, topic):
+        with self._finished_lock:
+            self.started_count += 1
+        return super().start(topic)
+
+    def finish(self, trace, outcome, event_mode=None):
+        with self._finished_lock:
+            self.finished.append((outcome, event_mode, list(trace.spans), time.monotonic()))
+
+    def finished_count(self) -> int:
+        with self._finished_lock:
+            return len(self.finished)
+
+
+
+### FUNCTION :: Host Info ################################################################
+def host_info() -> dict:
+    """Returns the CPU model and Python build the results were measured on."""
+    cpu_model = platform.processor() or platform.machine()
+    try:
+        with open("/proc/cpuinfo", 'r') as cpuinfo:
+            fields = dict(line.split(":", 1) for line in cpuinfo if ":" in line)
+        fields = {key.strip(): value.strip() for key, value in fields.items()}
+        cpu_model = fields.get("Model") or fields.get("model name") or fields.get("Hardware") or cpu_model
+    except OSError:
+        pass
+    return {"cpu_model": cpu_model, "machine": platform.machine(), "cpu_count": os.cpu_count(), "python": platform.python_version()}
+
+
+
+### FUNCTION :: Bench Configuration ######################################################
+def bench_settings(standin: CaldavStandin, overrides: dict) -> dict:
+    """Returns the shipped settings pointed at the stand-in, with CALDAV_SERVER overrides from the command line."""
+    with open(os.path.join(CONFIG_DIR, SETTINGS_FILE_NAME), 'r', encoding='utf-8') as settings_file:
+        shipped = json.load(settings_file)
+    caldav_settings = dict(shipped.get('CALDAV_SERVER', {}))
+    caldav_settings.update({"CALDAV_SERVER_ADDRESS": standin.url, "CALDAV_USERNAME": CALDAV_USERNAME, "CALDAV_PASSWORD": CALDAV_PASSWORD})
+    caldav_settings.update(overrides)
+    return {"APPLICATION_SETTINGS": {**shipped.get('APPLICATION_SETTINGS', {}), **BENCH_APPLICATION_SETTINGS}, "CALDAV_SERVER": caldav_settings}
+
+
+def parse_overrides(pairs: list) -> dict:
+    """Turns KEY=VALUE arguments into CALDAV_SERVER settings, values are read as JSON where possible."""
+    overrides = {}
+    for pair in pairs or []:
+        key, separator, value = pair.partition("=")
+        if not separator or not key:
+            raise SystemExit(f"--set expects KEY=VALUE, got {pair!r}")
+        try:
+            overrides[key] = json.loads(value)
+        except ValueError:
+            overrides[key] = value
+    return overrides
+
+
+def write_config(work_dir: str, standin: CaldavStandin, settings: dict, topics: int):
+    """Writes settings and triggers with one create and one delete trigger per topic and returns their paths."""
+    event_fields = {
+        "EVENT_CALENDAR": standin.calendar_url(CALENDAR_NAME), "EVENT_SUMMARY": "Bench Event", "EVENT_LOCATION": "Bench",
+        "EVENT_GEO": "0;0", "EVENT_CATEGORIES": "Bench", "EVENT_URL": "", "EVENT_TRANSP": "TRANSPARENT",
+        "EVENT_DESCRIPTION": "End-to-end benchmark event", "EVENT_TIMEZONE": "Europe/London", "EVENT_OFFSET": "",
+        "EVENT_TRIGGER": "0", "EVENT_SECONDS": "False", "EVENT_ROUNDING": "0", "EVENT_DURATION": "10"
+    }
+    triggers = []
+    for topic in topic_names(topics):
+        triggers.append({"MODE": "Create", "MQTT_TOPIC": topic, "MQTT_EVENT": {"action": "on"}, **event_fields})
+        triggers.append({"MODE": "Delete", "MQTT_TOPIC": topic, "MQTT_EVENT": {"action": "off"}})
+
+    settings_path = os.path.join(work_dir, "settings.json")
+    triggers_path = os.path.join(work_dir, "triggers.json")
+    with open(settings_path, 'w', encoding='utf-8') as settings_file:
+        json.dump(settings, settings_file)
+    with open(triggers_path, 'w', encoding='utf-8') as triggers_file:
+        json.dump(triggers, triggers_file)
+    return settings_path, triggers_path
+
+
+def topic_names(topics: int) -> list:
+    return [f"bench/device_{index:04d}" for index in range(max(1, topics))]
+
+
+
+### FUNCTION :: Start Pipeline ###########################################################
+def start_pipeline(work_dir: str, standin: CaldavStandin, settings: dict, topics: int, log_scan: bool) -> dict:
+    """Sets up the globals main.py sets up on start, against the stand-in and with files in work_dir.
+
+    Pool, queue, breaker and limits are sized from the settings the same way main.py sizes them.
+    """
+    log_handler = RotatingGzipFileHandler(os.path.join(work_dir, LOG_FILE_NAME), encoding='utf-8')
+    log_handler.setFormatter(logger.formatter)
+    for handler in list(logger.logger.handlers):
+        logger.logger.removeHandler(handler)
+    logger.logger.addHandler(log_handler)
+    logger.start_async_logging()
+
+    config = main.load_config(*write_config(work_dir, standin, settings, topics))
+    main.apply_log_settings(config)
+    caldav_settings = config['CALDAV_SERVER']
+    workers = int(caldav_settings.get('CALDAV_WORKER_COUNT', 2))
+    main.LOG_DIR = work_dir
+    main.caldav_client = main.connect_caldav(standin.url, CALDAV_USERNAME, CALDAV_PASSWORD)
+    if main.caldav_client is None:
+        raise RuntimeError(f"CalDAV stand-in not reachable at {standin.url}")
+    main.caldav_retry_scheduler = RetryScheduler(log_prefix=main.LOG_PREFIX_CALDAV)
+    main.caldav_retry_scheduler.start()
+    main.caldav_breaker = CircuitBreaker(int(caldav_settings.get('CALDAV_BREAKER_FAILURE_THRESHOLD', 5)),
+                                         float(caldav_settings.get('CALDAV_BREAKER_RESET_SECONDS', 60)), main.caldav_retry_scheduler,
+                                         int(caldav_settings.get('CALDAV_BREAKER_MAX_PARKED', 1000)), main.LOG_PREFIX_CALDAV)
+    main.caldav_limiter = RequestLimiter(main.parse_rate_limit(caldav_settings, 'CALDAV_SERVER', (0.0, 1, 0), "bench"),
+                                         main.parse_rate_limit(caldav_settings, 'CALDAV_CALENDAR', (0.0, 1, 0), "bench"),
+                                         config.get('CALENDAR_LIMITS', {}))
+    main.caldav_registry = CaldavClientRegistry(standin.url, CALDAV_USERNAME, CALDAV_PASSWORD, pool_size=workers, client=main.caldav_client)
+    main.caldav_worker_pool = CaldavWorkerPool(workers, int(caldav_settings.get('CALDAV_QUEUE_SIZE', 100)),
+                                               str(caldav_settings.get('CALDAV_QUEUE_FULL_POLICY', 'reject_new')).lower(), log_prefix=main.LOG_PREFIX_CALDAV)
+    main.caldav_worker_pool.start()
+    main.caldav_outbox = Outbox(os.path.join(work_dir, OUTBOX_FILE_NAME))
+    main.event_index = None if log_scan else EventIndex(os.path.join(work_dir, EVENT_INDEX_FILE_NAME))
+    main.tracer = CollectingTracer(os.path.join(work_dir, TRACE_FILE_NAME))
+    return config
+
+
+def stop_pipeline() -> None:
+    """Stops the pipeline threads and closes its files."""
+    main.caldav_retry_scheduler.shutdown()
+    main.caldav_worker_pool.shutdown(5.0)
+    main.caldav_outbox.close()
+    if main.event_index is not None:
+        main.event_index.close()
+    main.tracer.close()
+    logger.stop_async_logging()
+    for handler in list(logger.logger.handlers):
+        logger.logger.removeHandler(handler)
+        handler.close()
+    for name in ("caldav_client", "caldav_registry", "caldav_worker_pool", "event_index", "caldav_outbox",
+                 "caldav_retry_scheduler", "caldav_breaker", "caldav_limiter", "tracer"):
+        setattr(main, name, None)
+
+
+
+### FUNCTION :: Build Messages ###########################################################
+def build_messages(count: int, topics: int, match_ratio: float, delete_ratio: float, rng: random.Random) -> list:
+    """Returns (topic, payload) pairs: telemetry that matches no trigger, "on" creates and "off" deletes."""
+    names = topic_names(topics)
+    messages = []
+    for index in range(count):
+        topic = names[index % len(names)]
+        payload = {"battery": rng.randint(5, 100), "linkquality": rng.randint(0, 255), "voltage": rng.randint(2700, 3100)}
+        if rng.random() < match_ratio:
+            payload["action"] = "off" if rng.random() < delete_ratio else "on"
+        messages.append((topic, json.dumps(payload).encode('utf-8')))
+    return messages
+
+
+
+### FUNCTION :: Run Scenario #############################################################
+def run_scenario(name: str, scenario: dict, args, bench_root: str) -> dict:
+    """Feeds one scenario through on_message and returns its measurements."""
+    rate = scenario['rate'] if args.rate is None else args.rate
+    topics = scenario['topics'] if args.topics is None else args.topics
+    duration = scenario.get('duration', 0) if args.duration is None else args.duration
+    count = scenario['messages'] if rate == 0 else max(1, int(rate * duration))
+    messages = build_messages(count, topics, scenario['match_ratio'], scenario['delete_ratio'], random.Random(RANDOM_SEED))
+
+    work_dir = tempfile.mkdtemp(prefix=f"{name}_", dir=bench_root)
+    standin = CaldavStandin(CALDAV_USERNAME, CALDAV_PASSWORD, (CALENDAR_NAME,))
+    standin.start()
+    standin.set_faults(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, methods=("PUT", "DELETE"))
+    config = start_pipeline(work_dir, standin, bench_settings(standin, args.overrides), topics, args.log_scan)
+    tracer = main.tracer
+    standin.reset_stats()
+
+    # Sample Threads and Memory While the Scenario Runs
+    samples = {"peak_threads": threading.active_count(), "peak_rss_bytes": resident_memory_bytes()}
+    sampling = threading.Event()
+
+    def sample():
+        while not sampling.wait(SAMPLE_INTERVAL_SECONDS):
+            samples['peak_threads'] = max(samples['peak_threads'], threading.active_count())
+            samples['peak_rss_bytes'] = max(samples['peak_rss_bytes'], resident_memory_bytes())
+
+    # Deliver Messages on One Thread Like the paho Network Loop
+    inbox = queue.Queue()
+    callback_ms = []
+
+    def deliver():
+        while True:
+            mqtt_message = inbox.get()
+            if mqtt_message is None:
+                return
+            callback_start = time.perf_counter()
+            main.on_message(main.caldav_client, config, None, None, mqtt_message)
+            callback_ms.append((time.perf_counter() - callback_start) * 1000)
+
+    sampler = threading.Thread(target=sample, name="bench-sampler", daemon=True)
+    delivery = threading.Thread(target=deliver, name="bench-mqtt-loop", daemon=True)
+    sampler.start()
+    delivery.start()
+
+    outage_start = outage_end = None
+    started = time.monotonic()
+    for index, (topic, payload) in enumerate(messages):
+        if rate:
+            due = started + index / rate
+            now = time.monotonic()
+            if due > now:
+                time.sleep(due - now)
+            if outage_start is None and 'outage_at' in scenario and now - started >= scenario['outage_at'] * duration:
+                standin.outage(scenario['outage_for'] * duration)
+                outage_start, outage_end = now, now + scenario['outage_for'] * duration
+        mqtt_message = MQTTMessage(topic=topic.encode('utf-8'))
+        mqtt_message.payload = payload
+        mqtt_message.timestamp = time.monotonic()
+        inbox.put(mqtt_message)
+    inbox.put(None)
+    delivery.join()
+    delivered = time.monotonic()
+
+    # Wait for Every Message to Finish Its CalDAV Job
+    drain_deadline = delivered + DRAIN_TIMEOUT_SECONDS
+    while tracer.finished_count() < tracer.started_count and time.monotonic() < drain_deadline:
+        time.sleep(0.05)
+    drained_at = time.monotonic()
+    sampling.set()
+    sampler.join()
+
+    finished = list(tracer.finished)
+    job_traces = [trace for trace in finished if trace[0] != "no_job"]
+    outcomes = {}
+    for outcome, _, _, _ in finished:
+        outcomes[outcome] = outcomes.get(outcome, 0) + 1
+    stage_ms = {}
+    for _, _, spans, _ in job_traces:
+        for stage, duration_ms in spans:
+            stage_ms.setdefault(stage, []).append(duration_ms)
+    succeeded = outcomes.get(main.JOB_SUCCEEDED, 0)
+    succeeded_by_mode = {}
+    for outcome, event_mode, _, _ in job_traces:
+        if outcome == main.JOB_SUCCEEDED:
+            succeeded_by_mode[event_mode] = succeeded_by_mode.get(event_mode, 0) + 1
+    standin_stats = standin.stats()
+    last_finish = max((trace[3] for trace in job_traces), default=delivered)
+
+    result = {
+        "messages": len(messages),
+        "topics": topics,
+        "offered_rate": rate,
+        "messages_per_second": round(len(messages) / max(delivered - started, 1e-6), 1),
+        "caldav_jobs": len(job_traces),
+        "events_per_second": round(succeeded / max(last_finish - started, 1e-6), 2),
+        "outcomes": outcomes,
+        "callback_ms": summarize(callback_ms),
+        "e2e_ms": summarize([sum(duration_ms for _, duration_ms in spans) for _, _, spans, _ in job_traces]),
+        "stage_p95_ms": {stage: summarize(values)['p95'] for stage, values in stage_ms.items()},
+        "peak_threads": samples['peak_threads'],
+        "peak_rss_bytes": samples['peak_rss_bytes'],
+        "drained": tracer.finished_count() >= tracer.started_count,
+        "drain_seconds": round(drained_at - delivered, 2),
+        "standin": standin_stats
+    }
+    result["problems"] = validate(result, succeeded_by_mode)
+    result["valid"] = not result["problems"]
+    if outage_end is not None:
+        result["outage_seconds"] = round(outage_end - outage_start, 1)
+        result["recovery_seconds"] = round(max(0.0, last_finish - outage_end), 2)
+
+    stop_pipeline()
+    standin.stop()
+    shutil.rmtree(work_dir, ignore_errors=True)
+    return result
+
+
+def validate(result: dict, succeeded_by_mode: dict) -> list:
+    """Returns why the scenario's numbers cannot be trusted, an empty list when every job reached the stand-in."""
+    problems = []
+    jobs = result['caldav_jobs']
+    succeeded = result['outcomes'].get(main.JOB_SUCCEEDED, 0)
+    if not result['drained']:
+        problems.append(f"jobs still running {DRAIN_TIMEOUT_SECONDS:.0f}s after the last message")
+    if succeeded < jobs:
+        lost = {outcome: count for outcome, count in result['outcomes'].items() if outcome not in ("no_job", main.JOB_SUCCEEDED)}
+        problems.append(f"{succeeded} of {jobs} jobs succeeded, others {lost}")
+    # Extends rewrite an existing event, only creates and deletes change the count
+    expected_events = succeeded_by_mode.get("create", 0) - succeeded_by_mode.get("delete", 0)
+    if result['standin']['events'] < expected_events:
+        problems.append(f"stand-in holds {result['standin']['events']} events, expected {expected_events}")
+    return problems
+
+
+def summarize(values: list) -> dict:
+    """Returns p50/p95/p99/max of a list of milliseconds."""
+    if not values:
+        return {"count": 0, "p50": None, "p95": None, "p99": None, "max": None}
+    ordered = sorted(values)
+
+    def percentile(fraction):
+        return round(ordered[min(len(ordered) - 1, int(fraction * len(ordered)))], 2)
+    return {"count": len(ordered), "p50": percentile(0.5), "p95": percentile(0.95), "p99": percentile(0.99), "max": round(ordered[-1], 2)}
+
+
+
+### FUNCTION :: Text Output ##############################################################
+def print_result(name: str, result: dict) -> None:
+    """Prints the headline numbers of one scenario."""
+    e2e = result['e2e_ms']
+    line = (f"{name:<13} | {result['messages']:>6} msgs | {result['messages_per_second']:>8.1f} msg/s | {result['events_per_second']:>7.2f} ev/s"
+            f" | e2e p50 {e2e['p50'] or 0:>8.1f} p95 {e2e['p95'] or 0:>8.1f} p99 {e2e['p99'] or 0:>8.1f} ms"
+            f" | threads {result['peak_threads']:>3} | rss {result['peak_rss_bytes'] / 1048576:>6.1f} MB")
+    if "recovery_seconds" in result:
+        line += f" | recovery {result['recovery_seconds']:.1f}s"
+    if not result['drained']:
+        line += " | NOT DRAINED"
+    print(line, file=sys.stderr)
+    for problem in result['problems']:
+        print(f"{'':<13} | INVALID: {problem}", file=sys.stderr)
+
+
+
+### MAIN #################################################################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="End-to-end mqtt2caldav benchmark against the in-memory CalDAV stand-in")
+    parser.add_argument("--scenario", action="append", choices=list(SCENARIOS), help="scenario to run, repeatable (default: all)")
+    parser.add_argument("--rate", type=float, help="messages per second, 0 feeds all at once (default: per scenario)")
+    parser.add_argument("--duration", type=float, help="seconds per paced scenario (default: per scenario)")
+    parser.add_argument("--topics", type=int, help="distinct MQTT topics (default: per scenario)")
+    parser.add_argument("--set", dest="set_values", action="append", metavar="KEY=VALUE",
+                        help="override a CALDAV_SERVER setting of config/settings.json, repeatable, e.g. CALDAV_QUEUE_SIZE=1000")
+    parser.add_argument("--latency-ms", type=float, default=DEFAULT_LATENCY_MS, help="stand-in PUT and DELETE latency")
+    parser.add_argument("--jitter-ms", type=float, default=DEFAULT_JITTER_MS, help="stand-in latency jitter")
+    parser.add_argument("--log-scan", action="store_true", help="find events to delete by scanning the log instead of the event index")
+    parser.add_argument("--output", help="write the JSON results to this file instead of stdout")
+    args = parser.parse_args()
+    args.overrides = parse_overrides(args.set_values)
+
+    # load_config Only Reads Files Below the Project Directory
+    bench_root = tempfile.mkdtemp(prefix=".e2e_bench_", dir=script_dir)
+    results = {
+        "bench": "e2e",
+        "bench_version": VERSION,
+        "app_version": main.VERSION,
+        "timestamp": datetime.now().isoformat(timespec='seconds'),
+        "host": host_info(),
+        "settings": {"overrides": args.overrides, "latency_ms": args.latency_ms, "jitter_ms": args.jitter_ms, "log_scan": args.log_scan},
+        "scenarios": {}
+    }
+    try:
+        for scenario_name in args.scenario or list(SCENARIOS):
+            results['scenarios'][scenario_name] = run_scenario(scenario_name, SCENARIOS[scenario_name], args, bench_root)
+            print_result(scenario_name, results['scenarios'][scenario_name])
+    finally:
+        shutil.rmtree(bench_root, ignore_errors=True)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output_file:
+            json.dump(results, output_file, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+
+    # Results of Scenarios That Lost Jobs Are Not Comparable
+    if not all(result['valid'] for result in results['scenarios'].values()):
+        sys.exit(1)
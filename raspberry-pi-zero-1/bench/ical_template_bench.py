@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+VERSION = "20261017.1100"
+
+
+
+### SECTION :: Module Imports ############################################################
+import json
+import os
+import sys
+import timeit
+import uuid
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(script_dir)
+sys.path.insert(0, project_dir)
+
+from utils.ical_template import compile_trigger_template
+
+
+
+### SECTION :: Configuration #############################################################
+TRIGGERS_FILE = os.path.join(project_dir, "config", "triggers.json")
+EVENTS = 50000
+START_TIME = "20261017T120000"
+END_TIME = "20261017T121000"
+
+
+
+### FUNCTION :: Legacy Builder ###########################################################
+def build_legacy(event_details):
+    """Concatenates the payload the way create_caldav_event did before templates."""
+    start_time = event_details['start_time']
+    end_time = event_details['end_time']
+    main_event = "BEGIN:VCALENDAR\n" \
+            "VERSION:2.0\n" \
+            "PRODID:-//MQTT//EN\n" \
+            "CALSCALE:GREGORIAN\n" \
+            "BEGIN:VEVENT\n" \
+            f"DTSTART;TZID={event_details['event_timezone']}:{start_time}\n" \
+            f"DTEND;TZID={event_details['event_timezone']}:{end_time}\n" \
+            f"DTSTAMP:{start_time}\n" \
+            f"LOCATION:{event_details['event_location']}\n" \
+            f"DESCRIPTION:{event_details['event_description']}\n" \
+            f"URL;VALUE=URI:{event_details['event_url']}\n" \
+            f"SUMMARY:{event_details['event_summary']}\n" \
+            f"GEO:{event_details['event_geo']}\n" \
+            f"TRANSP:{event_details['event_transp']}\n" \
+            f"CATEGORIES:{event_details['event_categories']}\n" \
+            f"CREATED:{start_time}\n"
+    end_event = "END:VEVENT\n" \
+        "END:VCALENDAR\n"
+    alarm_event = ""
+    if event_details['event_trigger']:
+        alarm_event = "BEGIN:VALARM\n" \
+                           f"TRIGGER:-PT{event_details['event_trigger']}M\n" \
+                           "ATTACH;VALUE=URI:Chord\n" \
+                           "ACTION:AUDIO\n" \
+                           "END:VALARM\n"
+    return main_event + alarm_event + end_event
+
+
+
+### MAIN #################################################################################
+if __name__ == "__main__":
+    with open(TRIGGERS_FILE, 'r', encoding='utf-8') as f:
+        triggers = [trigger for trigger in json.load(f) if trigger.get('MODE', '').lower() == 'create']
+
+    print(f"{'trigger':<28} | {'legacy ev/s':>12} | {'template ev/s':>13} | {'speedup':>7}")
+    print('-' * 70)
+    for trigger in triggers:
+        event_details = {
+            'start_time': START_TIME, 'end_time': END_TIME,
+            'event_timezone': trigger['EVENT_TIMEZONE'], 'event_location': trigger['EVENT_LOCATION'],
+            'event_description': trigger['EVENT_DESCRIPTION'], 'event_url': trigger['EVENT_URL'],
+            'event_summary': trigger['EVENT_SUMMARY'], 'event_geo': trigger['EVENT_GEO'],
+            'event_transp': trigger['EVENT_TRANSP'], 'event_categories': trigger['EVENT_CATEGORIES'],
+            'event_trigger': trigger['EVENT_TRIGGER']
+        }
+        template = compile_trigger_template(trigger)
+        uid = str(uuid.uuid4())
+
+        legacy_rate = EVENTS / min(timeit.repeat(lambda: build_legacy(event_details), number=EVENTS, repeat=3))
+        template_rate = EVENTS / min(timeit.repeat(lambda: template.render(START_TIME, END_TIME, uid), number=EVENTS, repeat=3))
+        print(f"{trigger['EVENT_SUMMARY'][:28]:<28} | {legacy_rate:>12.0f} | {template_rate:>13.0f} | {template_rate / legacy_rate:>6.1f}x")
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+VERSION = "20261017.1500"
+
+
+
+### SECTION :: Module Imports ############################################################
+import os
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from itertools import islice
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(script_dir)
+sys.path.insert(0, project_dir)
+
+from utils.reverse_reader import read_lines_reverse
+
+
+
+### SECTION :: Configuration #############################################################
+# Usage: log_reader_bench.py [size in MB] [directory]
+LOG_SIZE_MB = int(sys.argv[1]) if len(sys.argv) > 1 else 1024
+LAST_LINES = 10000
+# readlines() needs several times the file size in RAM, skip it above this size
+READLINES_MAX_MB = 256
+RECEIVED_LINE = ("info  2026-10-17 12:00:00.000 [APP] Event Received | mqtt_topic='mqtt/Sensor_Living_Room', "
+                 "battery='87', linkquality='142', temperature='21.4', humidity='48', voltage='3000'\n")
+CREATED_LINE = ("info  2026-10-17 12:00:00.000 [DAV] Event Created  | mqtt_topic='mqtt/Button', action='single', "
+                "event_path='https://example.com/remote.php/dav/calendars/home/automation/1234.ics'\n")
+
+
+
+### FUNCTION :: Write Synthetic Log ######################################################
+def write_synthetic_log(log_path: str, size_mb: int) -> None:
+    """Writes size_mb of Event Received lines with one Event Created line near the middle."""
+    block = RECEIVED_LINE * 10000
+    target_size = size_mb * 1024 * 1024
+    with open(log_path, 'w', encoding='utf-8') as log_file:
+        written = 0
+        while written < target_size:
+            if written <= target_size // 2 < written + len(block):
+                log_file.write(CREATED_LINE)
+            log_file.write(block)
+            written += len(block)
+
+
+
+### FUNCTION :: Measure ##################################################################
+def measure(label: str, func) -> None:
+    """Runs func once and prints its wall time and the process peak RSS."""
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{label:<34} | {elapsed:>8.3f} s | {peak_mb:>9.0f} MB | {result}")
+
+
+def last_lines_readlines(log_path: str) -> int:
+    with open(log_path, 'r', encoding='utf-8') as log_file:
+        return len(log_file.readlines()[-LAST_LINES:])
+
+
+def last_lines_reverse(log_path: str, use_mmap: bool) -> int:
+    return len(list(islice(read_lines_reverse(log_path, use_mmap=use_mmap), LAST_LINES)))
+
+
+def last_created_reverse(log_path: str, use_mmap: bool) -> bool:
+    return next(read_lines_reverse(log_path, use_mmap=use_mmap, contains=b"Event Created"), None) is not None
+
+
+
+### MAIN #################################################################################
+if __name__ == "__main__":
+    bench_dir = tempfile.mkdtemp(prefix="log_reader_bench_", dir=sys.argv[2] if len(sys.argv) > 2 else None)
+    log_path = os.path.join(bench_dir, "mqtt2caldav.log")
+    try:
+        print(f"Writing {LOG_SIZE_MB} MB synthetic log to {log_path}")
+        write_synthetic_log(log_path, LOG_SIZE_MB)
+        print(f"{'scenario':<34} | {'time':>10} | {'peak RSS':>12} | result")
+        print('-' * 80)
+        measure(f"last {LAST_LINES} lines, blocks", lambda: last_lines_reverse(log_path, False))
+        measure(f"last {LAST_LINES} lines, mmap", lambda: last_lines_reverse(log_path, True))
+        measure("last Event Created, blocks", lambda: last_created_reverse(log_path, False))
+        measure("last Event Created, mmap", lambda: last_created_reverse(log_path, True))
+        # Run last, peak RSS only ever grows
+        if LOG_SIZE_MB <= READLINES_MAX_MB:
+            measure(f"last {LAST_LINES} lines, readlines()", lambda: last_lines_readlines(log_path))
+        else:
+            print(f"{'last ' + str(LAST_LINES) + ' lines, readlines()':<34} | skipped above {READLINES_MAX_MB} MB")
+    finally:
+        shutil.rmtree(bench_dir, ignore_errors=True)
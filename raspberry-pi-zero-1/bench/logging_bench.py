@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+VERSION = "20261017.1300"
+
+
+
+### SECTION :: Module Imports ############################################################
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(script_dir)
+sys.path.insert(0, project_dir)
+
+from utils import logger
+from utils.logger import BatchedFileHandler, format_log_data
+
+
+
+### SECTION :: Configuration #############################################################
+MESSAGE_COUNT = 20000
+QUEUE_SIZE = 100000
+LEVELS = [("DEBUG", logging.DEBUG), ("INFO", logging.INFO)]
+SAMPLE_EVENT = {"mqtt_topic": "zigbee/0x00124b001f8ab0cd", "action": "single", "battery": 87, "linkquality": 142, "voltage": 3000}
+
+
+
+### FUNCTION :: Build Bench Logger #######################################################
+def build_logger(log_path: str, level: int) -> logging.Logger:
+    """Creates a logger with the application's formatter writing to log_path only."""
+    bench_logger = logging.getLogger(f"bench-{os.path.basename(log_path)}")
+    bench_logger.handlers.clear()
+    bench_logger.propagate = False
+    bench_logger.setLevel(level)
+    handler = BatchedFileHandler(log_path, encoding='utf-8')
+    handler.setFormatter(logger.formatter)
+    bench_logger.addHandler(handler)
+    return bench_logger
+
+
+
+### FUNCTION :: Run Scenario #############################################################
+def run_scenario(work_dir: str, name: str, level: int, use_async: bool, lazy: bool) -> float:
+    """Logs MESSAGE_COUNT debug and info lines like on_message does and returns messages per second."""
+    bench_logger = build_logger(os.path.join(work_dir, f"{name}.log"), level)
+    listener = logger.start_async_logging(queue_size=QUEUE_SIZE, target_logger=bench_logger) if use_async else None
+
+    started = time.perf_counter()
+    for i in range(MESSAGE_COUNT):
+        log_data = {**SAMPLE_EVENT, "sequence": i}
+        if lazy:
+            bench_logger.debug("%s Event Matched  | %s", "[APP]", format_log_data(log_data))
+            bench_logger.info("%s Event Received | %s", "[APP]", format_log_data(log_data))
+        else:
+            bench_logger.debug(f"[APP] Event Matched  | {format_log_data(log_data)}")
+            bench_logger.info(f"[APP] Event Received | {format_log_data(log_data)}")
+    caller_elapsed = time.perf_counter() - started
+
+    if listener is not None:
+        logger.stop_async_logging(listener, target_logger=bench_logger)
+    for handler in list(bench_logger.handlers):
+        handler.close()
+        bench_logger.removeHandler(handler)
+    return MESSAGE_COUNT / caller_elapsed
+
+
+
+### MAIN #################################################################################
+if __name__ == "__main__":
+    work_dir = tempfile.mkdtemp(prefix="logging_bench_")
+    try:
+        print(f"messages={MESSAGE_COUNT} (one debug and one info line each), rate seen by the calling thread")
+        print(f"{'level':<6} {'pipeline':<6} {'format':<6} {'msg/s':>10}")
+        for level_name, level in LEVELS:
+            for use_async in (False, True):
+                for lazy in (False, True):
+                    name = f"{level_name.lower()}_{'async' if use_async else 'sync'}_{'lazy' if lazy else 'eager'}"
+                    rate = run_scenario(work_dir, name, level, use_async, lazy)
+                    print(f"{level_name:<6} {'async' if use_async else 'sync':<6} {'lazy' if lazy else 'eager':<6} {rate:>10.0f}")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
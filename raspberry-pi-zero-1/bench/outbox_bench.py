@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+VERSION = "20261017.1000"
+
+
+
+### SECTION :: Module Imports ############################################################
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(script_dir)
+sys.path.insert(0, project_dir)
+
+from utils.outbox import Outbox
+
+
+
+### SECTION :: Configuration #############################################################
+JOB_COUNT = 2000
+FSYNC_BATCHES = [1, 8, 32, 128]
+FSYNC_INTERVAL_SECONDS = 0.5
+SAMPLE_JOB = {
+    "event_mode": "create",
+    "mqtt_topic": "zigbee/0x00124b001f8ab0cd",
+    "action": "single",
+    "payload": {
+        "start_time": "20261017T120000", "end_time": "20261017T121000",
+        "event_calendar_url": "https://example.com/remote.php/dav/calendars/home/automation/",
+        "event_timezone": "Europe/London", "event_summary": "Button Pressed",
+        "event_location": "Entrance Hall", "event_description": "Button pressed in entrance hall"
+    }
+}
+
+
+
+### MAIN #################################################################################
+if __name__ == "__main__":
+    bench_dir = tempfile.mkdtemp(prefix="outbox_bench_", dir=sys.argv[1] if len(sys.argv) > 1 else None)
+    print(f"Journal directory: {bench_dir}")
+    print(f"{'fsync batch':>11} | {'appends/s':>10} | {'append+ack/s':>12} | {'fsyncs':>6}")
+    print('-' * 49)
+    try:
+        for fsync_batch in FSYNC_BATCHES:
+            journal_path = os.path.join(bench_dir, f"bench_{fsync_batch}.outbox")
+            outbox = Outbox(journal_path, fsync_batch=fsync_batch, fsync_interval=FSYNC_INTERVAL_SECONDS)
+
+            start = time.perf_counter()
+            job_ids = [outbox.append(SAMPLE_JOB) for _ in range(JOB_COUNT)]
+            append_rate = JOB_COUNT / (time.perf_counter() - start)
+
+            start = time.perf_counter()
+            for _ in range(JOB_COUNT):
+                outbox.ack(outbox.append(SAMPLE_JOB))
+            cycle_rate = JOB_COUNT / (time.perf_counter() - start)
+
+            for job_id in job_ids:
+                outbox.ack(job_id)
+            fsync_count = outbox.stats()['fsync_count']
+            outbox.close()
+            print(f"{fsync_batch:>11} | {append_rate:>10.0f} | {cycle_rate:>12.0f} | {fsync_count:>6}")
+    finally:
+        shutil.rmtree(bench_dir, ignore_errors=True)
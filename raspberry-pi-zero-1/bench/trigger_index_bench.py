@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+VERSION = "20261017.0900"
+
+
+
+### SECTION :: Module Imports ############################################################
+import os
+import sys
+import timeit
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(script_dir)
+sys.path.insert(0, project_dir)
+
+from utils.trigger_index import TriggerIndex
+
+
+
+### SECTION :: Configuration #############################################################
+TRIGGER_COUNTS = [10, 1000, 10000]
+WILDCARD_RATIO = 0.05
+LOOKUPS = 20000
+
+
+
+### FUNCTION :: Build Synthetic Triggers #################################################
+def build_triggers(count):
+    """Returns a trigger list with a small share of '+' and '#' subscriptions."""
+    triggers = []
+    wildcard_every = max(1, int(1 / WILDCARD_RATIO))
+    for i in range(count):
+        if i % wildcard_every == wildcard_every - 1:
+            topic = f"zigbee/room_{i}/+/state" if i % 2 else f"zigbee/room_{i}/#"
+        else:
+            topic = f"zigbee/0x{i:016x}"
+        triggers.append({"MODE": "Create", "MQTT_TOPIC": topic, "MQTT_EVENT": {"action": "single"}})
+    return triggers
+
+
+
+### FUNCTION :: Linear Scan Baseline #####################################################
+def linear_match(triggers, topic):
+    """Matches the way on_message did before the index existed."""
+    return [trigger for trigger in triggers if trigger['MQTT_TOPIC'] == topic]
+
+
+
+### MAIN #################################################################################
+if __name__ == "__main__":
+    print(f"{'triggers':>9} | {'linear us/msg':>14} | {'index us/msg':>13} | {'speedup':>8}")
+    print('-' * 54)
+    for count in TRIGGER_COUNTS:
+        triggers = build_triggers(count)
+        index = TriggerIndex(triggers)
+        topics = [f"zigbee/0x{i:016x}" for i in range(0, count, max(1, count // 100))]
+        topics.append(f"zigbee/room_{count - 1}/light/state")
+
+        def run_linear():
+            for topic in topics:
+                linear_match(triggers, topic)
+
+        def run_index():
+            for topic in topics:
+                index.match(topic)
+
+        rounds = max(1, LOOKUPS // len(topics))
+        linear_runs = max(1, rounds // max(1, count // 100))
+        linear_us = min(timeit.repeat(run_linear, number=linear_runs, repeat=3)) / (linear_runs * len(topics)) * 1e6
+        index_us = min(timeit.repeat(run_index, number=rounds, repeat=3)) / (rounds * len(topics)) * 1e6
+        print(f"{count:>9} | {linear_us:>14.2f} | {index_us:>13.2f} | {linear_us / index_us:>7.0f}x")
@@ -7,45 +7,100 @@ VERSION = "20260606.1810"
 # Standard
 import errno
 import json
+import logging
 import os
 import signal
 import sys
 import threading
 import time
+import uuid
+from contextlib import nullcontext
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 # Third Party
 import caldav
 import requests
 from caldav.lib.error import AuthorizationError, DAVError, NotFoundError
-from paho.mqtt.client import Client as MQTTClient, MQTTMessage
+from paho.mqtt.client import Client as MQTTClient, MQTTMessage, MQTT_ERR_SUCCESS
 
 # Local
-from utils import logger
-from utils.constants import (APP_NAME, CONFIG_DIR, LOG_DIR, LOG_FILE_NAME, SETTINGS_FILE_NAME, TRIGGERS_FILE_NAME, LOCK_FILE_PATH)
-
-
+from utils import logger, tracing
+from utils.log_files import iter_lines_reverse
+from utils.log_parser import parse_line
+from utils.log_sampler import TopicLogSampler
+from utils.metrics import Metrics, start_metrics_server
+from utils.logger import format_log_data
+from utils.constants import (APP_NAME, CONFIG_DIR, LOG_DIR, LOG_FILE_NAME, SETTINGS_FILE_NAME, TRIGGERS_FILE_NAME, LOCK_FILE_PATH, EVENT_INDEX_PATH, OUTBOX_PATH, TELEMETRY_PATH, TRACE_PATH)
+from utils.caldav_registry import REQUEST_EXCEPTIONS, CaldavClientRegistry, EventChangedError, retryable_server_error
+from utils.circuit_breaker import ADMITTED, BACKLOG_FULL, CircuitBreaker, PARKED, STATE_CLOSED
+from utils.config_watcher import ConfigWatcher
+from utils.debouncer import TriggerDebouncer
+from utils.event_index import EventIndex
+from utils.ical_template import compile_trigger_template, replace_event_end
+from utils.open_events import OpenEvent, OpenEventTracker
+from utils.outbox import Outbox
+from utils.rate_limiter import LimitSpec, RequestLimiter
+from utils.retry_scheduler import KIND_RETRY, RetryScheduler, jittered_backoff
+from utils.stats_publisher import ServiceStats, StatsPublisher, resident_memory_bytes
+from utils.telemetry_store import DEFAULT_FIELDS as TELEMETRY_DEFAULT_FIELDS, TelemetryStore
+from utils.tracing import Trace, Tracer
+from utils.trigger_index import TriggerIndex, trigger_key
+from utils.worker_pool import CaldavWorkerPool, QUEUE_FULL_POLICIES
+
+
+caldav_timeout: Optional[int] = None
 
 ### SECTION :: Global Variables ##########################################################
 caldav_client = None
+caldav_registry: Optional[CaldavClientRegistry] = None
+caldav_worker_pool: Optional[CaldavWorkerPool] = None
+event_index: Optional[EventIndex] = None
+caldav_outbox: Optional[Outbox] = None
+caldav_retry_scheduler: Optional[RetryScheduler] = None
+caldav_breaker: Optional[CircuitBreaker] = None
+event_debouncer = TriggerDebouncer()
+open_event_tracker = OpenEventTracker()
+caldav_limiter: Optional[RequestLimiter] = None
+telemetry_store: Optional[TelemetryStore] = None
+metrics: Optional[Metrics] = None
+service_stats: Optional[ServiceStats] = None
+stats_publisher: Optional[StatsPublisher] = None
+tracer: Optional[Tracer] = None
+config_watcher: Optional[ConfigWatcher] = None
 SHUTDOWN_REQUESTED = False
 
+# Log Prefixes Until apply_log_settings() Sets the Configured Ones
+LOG_PREFIX_APPLICATION = "[APP]"
+LOG_PREFIX_CALDAV = "[DAV]"
+LOG_PREFIX_MQTT = "[MQT]"
+LOG_PREFIX_SYSTEM = "[SYS]"
+LOG_PREFIX_USER = "[USR]"
 
+# CalDAV Job Outcomes
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+JOB_RETRY = "retry"
+JOB_DEFERRED = "deferred"
+JOB_SHED = "shed"
+CALDAV_RETRY_MAX_DELAY_SECONDS = 3600
+CALDAV_REQUEUE_MAX_DELAY_SECONDS = 30
 
-### FUNCTION :: Format Log Data ##########################################################
-def format_log_data(data: Dict[str, Any]) -> str:
-    """Formats a dictionary into a key='value' string."""
-    return ", ".join([f"{key}='{value}'" for key, value in data.items()])
+# Settings Read per Message, Others Apply After a Restart
+RELOADABLE_SETTINGS = ('LOG_LEVEL', 'LOG_PREFIXES', 'LOG_SAMPLING', 'LOG_SAMPLING_FLUSH_SECONDS', 'CONFIG_WATCH_SECONDS',
+                       'CALDAV_DIRECT_PUT', 'CALDAV_EVENT_RETRY_ATTEMPTS', 'CALDAV_EVENT_RETRY_DELAY_SECONDS')
 
 
 
 ### FUNCTION :: Load Config File #########################################################
 def load_config(settings_file: str = os.path.join(CONFIG_DIR, SETTINGS_FILE_NAME),
                 triggers_file: str = os.path.join(CONFIG_DIR, TRIGGERS_FILE_NAME)) -> Dict[str, Any]:
-    """Loads settings and triggers from JSON files and returns a merged dictionary."""
-    global LOG_PREFIX_APPLICATION, LOG_PREFIX_CALDAV, LOG_PREFIX_MQTT, LOG_PREFIX_SYSTEM, LOG_PREFIX_USER
+    """Loads settings and triggers from JSON files and returns a merged dictionary.
 
+    The log level and prefixes are resolved into LOG_LEVEL and LOG_PREFIXES but not
+    applied, so a reload that is rejected leaves logging untouched. Callers apply them
+    with apply_log_settings() once the config is in use.
+    """
     config: Dict[str, Any] = {}
     settings_path = ""
     triggers_path = ""
@@ -68,11 +123,13 @@ def load_config(settings_file: str = os.path.join(CONFIG_DIR, SETTINGS_FILE_NAME
         with open(settings_path, 'r', encoding='utf-8') as f:
             config = json.load(f)
             log_prefixes = config.get('APPLICATION_SETTINGS', {}).get('LOG_PREFIXES', {})
-            LOG_PREFIX_APPLICATION = log_prefixes.get('APPLICATION', '[APP]')
-            LOG_PREFIX_CALDAV = log_prefixes.get('CALDAV', '[DAV]')
-            LOG_PREFIX_MQTT = log_prefixes.get('MQTT', '[MQT]')
-            LOG_PREFIX_SYSTEM = log_prefixes.get('SYSTEM', '[SYS]')
-            LOG_PREFIX_USER = log_prefixes.get('USER', '[USR]')
+            config['LOG_PREFIXES'] = {
+                'APPLICATION': log_prefixes.get('APPLICATION', '[APP]'),
+                'CALDAV': log_prefixes.get('CALDAV', '[DAV]'),
+                'MQTT': log_prefixes.get('MQTT', '[MQT]'),
+                'SYSTEM': log_prefixes.get('SYSTEM', '[SYS]'),
+                'USER': log_prefixes.get('USER', '[USR]')
+            }
 
             settings_object_count = 0
             settings_array_count = 0
@@ -100,7 +157,7 @@ def load_config(settings_file: str = os.path.join(CONFIG_DIR, SETTINGS_FILE_NAME
                 "json_object_count": settings_object_count,
                 "json_key_count": settings_key_count
             }
-            logger.info(f"{LOG_PREFIX_APPLICATION} Settings File Load Successful | {format_log_data(log_data)}")
+            logger.info("%s Settings File Load Successful | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data))
 
     # Handle Missing Settings File
     except FileNotFoundError as e:
@@ -116,8 +173,7 @@ def load_config(settings_file: str = os.path.join(CONFIG_DIR, SETTINGS_FILE_NAME
         print(f"crit  {datetime.now().strftime('%Y-%m-%d %H:%M:%S,%f')[:-3]}: {_LOG_PREFIX_APP_ERR} Invalid JSON in Settings    | {format_log_data(log_data)}")
         sys.exit(1)
 
-    log_level_str = config.get('APPLICATION_SETTINGS', {}).get('LOG_LEVEL', 'INFO')
-    logger.set_log_level(log_level_str)
+    config['LOG_LEVEL'] = config.get('APPLICATION_SETTINGS', {}).get('LOG_LEVEL', 'INFO')
 
     try:
         if not os.path.isabs(triggers_file):
@@ -127,7 +183,7 @@ def load_config(settings_file: str = os.path.join(CONFIG_DIR, SETTINGS_FILE_NAME
 
         if not any(triggers_path.startswith(safe_dir) for safe_dir in safe_base_dirs):
             log_data = {"app_conf_file": triggers_path, "reason": "Path traversal attempt detected in triggers_file"}
-            logger.error(f"{LOG_PREFIX_APPLICATION} Unsafe Path Resolution      | {format_log_data(log_data)}")
+            logger.error("%s Unsafe Path Resolution      | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data))
             sys.exit(1)
 
         # Load and Parse Triggers File
@@ -139,7 +195,7 @@ def load_config(settings_file: str = os.path.join(CONFIG_DIR, SETTINGS_FILE_NAME
             for i, trigger in enumerate(triggers_list):
                 if 'MQTT_EVENT' not in trigger:
                     log_data = {"trigger_index": i, "trigger_content": str(trigger), "reason": "Trigger definition missing 'MQTT_EVENT' key"}
-                    logger.critical(f"{LOG_PREFIX_APPLICATION} Invalid Trigger Config      | {format_log_data(log_data)}")
+                    logger.critical("%s Invalid Trigger Config      | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data))
                     sys.exit(1)
 
             trigger_object_count = 0
@@ -170,418 +226,964 @@ def load_config(settings_file: str = os.path.join(CONFIG_DIR, SETTINGS_FILE_NAME
                 "json_object_count": trigger_object_count,
                 "json_key_count": trigger_key_count
             }
-            logger.info(f"{LOG_PREFIX_APPLICATION} Triggers File Load Successful | {format_log_data(log_data)}")
+            logger.info("%s Triggers File Load Successful | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data))
 
     # Handle Missing Triggers File
     except FileNotFoundError as e:
         log_data = {"app_conf_file": triggers_path, "exception_type": type(e).__name__, "details": str(e)}
-        logger.error(f"{LOG_PREFIX_APPLICATION} Triggers File Not Found     | {format_log_data(log_data)}")
+        logger.error("%s Triggers File Not Found     | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data))
         config['TRIGGERS'] = []
         logger.warn(f"{LOG_PREFIX_APPLICATION} Continuing without triggers defined in file.")
 
     # Handle Invalid Json Format In Triggers File
     except json.JSONDecodeError as e:
         log_data = {"app_conf_file": triggers_path, "exception_type": type(e).__name__, "details": str(e)}
-        logger.error(f"{LOG_PREFIX_APPLICATION} Invalid JSON in Triggers    | {format_log_data(log_data)}")
+        logger.error("%s Invalid JSON in Triggers    | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data))
         sys.exit(1)
 
     # Handle Errors When Processing Triggers
     except Exception as e:
         log_data = {"app_conf_file": triggers_path, "exception_type": type(e).__name__, "details": str(e)}
-        logger.error(f"{LOG_PREFIX_APPLICATION} Error processing Triggers   | {format_log_data(log_data)}")
+        logger.error("%s Error processing Triggers   | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data))
+        sys.exit(1)
+
+    # Build Topic Dispatch Index
+    try:
+        config['TRIGGER_INDEX'] = TriggerIndex(config.get('TRIGGERS', []))
+        log_data = {
+            "exact_topic_count": len(config['TRIGGER_INDEX'].exact),
+            "wildcard_trigger_count": config['TRIGGER_INDEX'].wildcard_count
+        }
+        logger.debug("%s Trigger Index Built           | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data))
+
+    # Handle Malformed Wildcard Topics
+    except ValueError as e:
+        log_data = {"app_conf_file": triggers_path, "exception_type": type(e).__name__, "details": str(e)}
+        logger.critical("%s Invalid Trigger Config      | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data))
         sys.exit(1)
 
+    # Precompile iCalendar Templates for Create and Extend Triggers
+    config['ICAL_TEMPLATES'] = {}
+    for i, trigger in enumerate(config.get('TRIGGERS', [])):
+        if str(trigger.get('MODE', '')).lower() not in ('create', 'extend'):
+            continue
+        try:
+            config['ICAL_TEMPLATES'][trigger_key(i, trigger)] = compile_trigger_template(trigger)
+
+        # Handle Incomplete Triggers, Event Creation Reports The Missing Key
+        except (KeyError, ValueError, TypeError) as e:
+            log_data = {"trigger_index": i, "mqtt_topic": trigger.get('MQTT_TOPIC', 'N/A'), "reason": "iCalendar template not compiled", "exception_type": type(e).__name__, "details": str(e)}
+            logger.warn("%s Invalid Trigger Config      | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data))
+
+    # Build Per-Topic Log Sampling Rules
+    config['LOG_SAMPLER'] = None
+    sampling_rules = config.get('APPLICATION_SETTINGS', {}).get('LOG_SAMPLING', [])
+    if sampling_rules:
+        try:
+            sampling_flush_seconds = float(config.get('APPLICATION_SETTINGS', {}).get('LOG_SAMPLING_FLUSH_SECONDS', 60))
+            config['LOG_SAMPLER'] = TopicLogSampler(sampling_rules, sampling_flush_seconds)
+
+        # Handle Invalid Sampling Rules, Every Message Is Logged
+        except (KeyError, ValueError, TypeError) as e:
+            log_data = {"app_conf_file": settings_path, "config_key": "LOG_SAMPLING", "reason": "Log sampling disabled", "exception_type": type(e).__name__, "details": str(e)}
+            logger.warn("%s Invalid Log Sampling Config | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data))
+
+    # Parse Per-Calendar Rate Limit Overrides
+    config['CALENDAR_LIMITS'] = {}
+    calendar_default = parse_rate_limit(config.get('CALDAV_SERVER', {}), 'CALDAV_CALENDAR', (0.0, 1, 0), SETTINGS_FILE_NAME)
+    for i, trigger in enumerate(config.get('TRIGGERS', [])):
+        if 'EVENT_CALENDAR' not in trigger or not any(key in trigger for key in ('EVENT_RATE_PER_SECOND', 'EVENT_BURST', 'EVENT_MAX_IN_FLIGHT')):
+            continue
+        calendar_key = RequestLimiter.calendar_key(trigger['EVENT_CALENDAR'])
+        if calendar_key in config['CALENDAR_LIMITS']:
+            log_data = {"trigger_index": i, "mqtt_topic": trigger.get('MQTT_TOPIC', 'N/A'), "reason": "Calendar limit already set by an earlier trigger", "calendar_url": trigger['EVENT_CALENDAR']}
+            logger.warn("%s Invalid Trigger Config      | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data))
+            continue
+        config['CALENDAR_LIMITS'][calendar_key] = parse_rate_limit(trigger, 'EVENT', calendar_default, f"{TRIGGERS_FILE_NAME}[{i}]")
+
+    # Parse Per-Trigger Debounce Windows
+    config['DEBOUNCE_WINDOWS'] = {}
+    for i, trigger in enumerate(config.get('TRIGGERS', [])):
+        debounce_value = trigger.get('EVENT_DEBOUNCE_SECONDS')
+        if debounce_value in (None, '', '0'):
+            continue
+        try:
+            debounce_seconds = float(debounce_value)
+            if debounce_seconds < 0: raise ValueError("negative window")
+            if debounce_seconds > 0:
+                config['DEBOUNCE_WINDOWS'][trigger_key(i, trigger)] = debounce_seconds
+
+        # Handle Invalid Debounce Window, Trigger Runs Without Debouncing
+        except (ValueError, TypeError) as e:
+            log_data = {"trigger_index": i, "mqtt_topic": trigger.get('MQTT_TOPIC', 'N/A'), "config_key": "EVENT_DEBOUNCE_SECONDS", "value": debounce_value, "details": str(e)}
+            logger.warn("%s Invalid Trigger Config      | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data))
+
     return config
 
 
 
+### FUNCTION :: Apply Log Settings #######################################################
+def apply_log_settings(config: Dict[str, Any]) -> None:
+    """Sets the log level and prefixes resolved by load_config()."""
+    global LOG_PREFIX_APPLICATION, LOG_PREFIX_CALDAV, LOG_PREFIX_MQTT, LOG_PREFIX_SYSTEM, LOG_PREFIX_USER
+    logger.set_log_level(config['LOG_LEVEL'])
+    LOG_PREFIX_APPLICATION = config['LOG_PREFIXES']['APPLICATION']
+    LOG_PREFIX_CALDAV = config['LOG_PREFIXES']['CALDAV']
+    LOG_PREFIX_MQTT = config['LOG_PREFIXES']['MQTT']
+    LOG_PREFIX_SYSTEM = config['LOG_PREFIXES']['SYSTEM']
+    LOG_PREFIX_USER = config['LOG_PREFIXES']['USER']
+
+
+
+### FUNCTION :: Parse Rate Limit #########################################################
+def parse_rate_limit(settings: Dict[str, Any], prefix: str, default: LimitSpec, source: str) -> LimitSpec:
+    """Reads <prefix>_RATE_PER_SECOND, <prefix>_BURST and <prefix>_MAX_IN_FLIGHT, falling back to default per key."""
+    spec = list(default)
+    for position, (suffix, cast) in enumerate((("RATE_PER_SECOND", float), ("BURST", int), ("MAX_IN_FLIGHT", int))):
+        config_key = f"{prefix}_{suffix}"
+        if settings.get(config_key) in (None, ''):
+            continue
+        try:
+            value = cast(settings[config_key])
+            if value < 0: raise ValueError("negative limit")
+            spec[position] = value
+
+        # Handle Invalid Limit Values
+        except (ValueError, TypeError):
+            log_data_warn = {"reason": "Invalid config value", "config_source": source, "config_key": config_key, "value": settings[config_key]}
+            logger.warn("%s Invalid %s, using default: %s | %s", LOG_PREFIX_APPLICATION, config_key, default[position], format_log_data(log_data_warn))
+    return spec[0], max(1, spec[1]), spec[2]
+
+
+
 ### FUNCTION :: Connect CalDAV Server ####################################################
-def connect_caldav(caldav_server_address: str, caldav_username: str, caldav_password: str) -> Optional[caldav.DAVClient]:
-    """Connects to the CalDAV server and returns the client object, or None on failure."""
+def connect_caldav(caldav_server_address: str, caldav_username: str, caldav_password: str, timeout: Optional[float] = None) -> Optional[caldav.DAVClient]:
+    """Connects to the CalDAV server and returns the client object, or None on failure.
+
+    timeout applies to every HTTP request of the client, whichever library caldav uses.
+    """
     caldav_host_info = f"{caldav_username}@{caldav_server_address}"
     
     # Authenticate and Discover Calendars
     try:
-        caldav_client: caldav.DAVClient = caldav.DAVClient(url=caldav_server_address, username=caldav_username, password=caldav_password)
+        caldav_client: caldav.DAVClient = caldav.DAVClient(url=caldav_server_address, username=caldav_username, password=caldav_password, timeout=timeout)
         my_principal = caldav_client.principal()
         calendars = my_principal.calendars()
         log_data_conn = {"caldav_host": log_data_conn if 'log_data_conn' in locals() else caldav_host_info}
         if calendars:
-            logger.info(f"{LOG_PREFIX_CALDAV} Server Connection Successful  | {format_log_data(log_data_conn)}")
+            logger.info("%s Server Connection Successful  | %s", LOG_PREFIX_CALDAV, format_log_data(log_data_conn))
             for calendar in calendars:
                 log_data_cal = {
                     "caldav_calendar": calendar.name,
                     "caldav_calendar_path": str(calendar.url)
                 }
-                logger.info(f"{LOG_PREFIX_CALDAV} Calendar Resource Discovered  | {format_log_data(log_data_cal)}")
+                logger.info("%s Calendar Resource Discovered  | %s", LOG_PREFIX_CALDAV, format_log_data(log_data_cal))
         else:
             log_data_debug = {"caldav_host": caldav_host_info, "detail": "No calendars found"}
-            logger.debug(f"{LOG_PREFIX_CALDAV} Server Connection Successful  | {format_log_data(log_data_debug)}")
+            logger.debug("%s Server Connection Successful  | %s", LOG_PREFIX_CALDAV, format_log_data(log_data_debug))
         return caldav_client
 
     # Handle CalDAV Authentication Errors
     except AuthorizationError as e:
         log_data = {"caldav_host": os.getenv("CALDAV_HOST", caldav_host_info), "reason": type(e).__name__, "details": str(e)}
-        logger.error(f"{LOG_PREFIX_CALDAV} Server Connection Failed      | {format_log_data(log_data)}")
+        logger.error("%s Server Connection Failed      | %s", LOG_PREFIX_CALDAV, format_log_data(log_data))
         return None
 
     # Handle CalDAV Server And Protocol Errors
     except DAVError as e:
         log_data = {"caldav_host": os.getenv("CALDAV_HOST", caldav_host_info), "reason": type(e).__name__, "details": str(e)}
-        logger.error(f"{LOG_PREFIX_CALDAV} Server Connection Failed      | {format_log_data(log_data)}")
+        logger.error("%s Server Connection Failed      | %s", LOG_PREFIX_CALDAV, format_log_data(log_data))
         return None
 
     # Handle Network Errors During Initial Connection Attempt
     except requests.exceptions.ConnectionError as e:
         log_data = {"caldav_host": os.getenv("CALDAV_HOST", caldav_host_info), "reason": "Connection Error", "exception_type": type(e).__name__, "details": str(e)}
-        logger.error(f"{LOG_PREFIX_CALDAV} Server Connection Failed      | {format_log_data(log_data)}")
+        logger.error("%s Server Connection Failed      | %s", LOG_PREFIX_CALDAV, format_log_data(log_data))
         return None
 
     # Handle Other Unexpected Errors
     except Exception as e:
         log_data = {"caldav_host": os.getenv("CALDAV_HOST", caldav_host_info), "reason": "Unexpected Error", "exception_type": type(e).__name__, "details": str(e)}
-        logger.error(f"{LOG_PREFIX_CALDAV} Server Connection Failed      | {format_log_data(log_data)}")
+        logger.error("%s Server Connection Failed      | %s", LOG_PREFIX_CALDAV, format_log_data(log_data))
         return None
 
 
 
 ### FUNCTION :: Create CalDAV Event ######################################################
-def create_caldav_event(current_caldav_client: caldav.DAVClient, event_details: Optional[Dict[str, Any]], topic: str, config: Dict[str, Any]) -> None:
-    """Creates an event on the CalDAV server with retry logic for network errors."""
+def create_caldav_event(current_caldav_client: caldav.DAVClient, event_details: Optional[Dict[str, Any]], topic: str, config: Dict[str, Any],
+                        attempt: int = 0) -> Tuple[str, Optional[float]]:
+    """Sends one event creation attempt to the CalDAV server.
+
+    Returns the job outcome and the server's Retry-After in seconds, if any. Retries of
+    network errors are scheduled by run_caldav_job.
+    """
     global caldav_client
     if event_details is None:
         log_data_payload = {"reason": "Internal Error - event_details is None"}
-        logger.error(f"{LOG_PREFIX_CALDAV} Event Create Error | {format_log_data({'mqtt_topic': topic, **log_data_payload})}")
-        return
+        logger.error("%s Event Create Error | %s", LOG_PREFIX_CALDAV, format_log_data({'mqtt_topic': topic, **log_data_payload}))
+        return JOB_FAILED, None
 
     # Construct iCal Event Payload
     try:
         start_time = event_details['start_time']
         end_time = event_details['end_time']
         mqtt_action = event_details.get('mqtt_action', 'unknown')
-        main_event = "BEGIN:VCALENDAR\n" \
-                "VERSION:2.0\n" \
-                "PRODID:-//MQTT//EN\n" \
-                "CALSCALE:GREGORIAN\n" \
-                "BEGIN:VEVENT\n" \
-                f"DTSTART;TZID={event_details['event_timezone']}:{start_time}\n" \
-                f"DTEND;TZID={event_details['event_timezone']}:{end_time}\n" \
-                f"DTSTAMP:{start_time}\n" \
-                f"LOCATION:{event_details['event_location']}\n" \
-                f"DESCRIPTION:{event_details['event_description']}\n" \
-                f"URL;VALUE=URI:{event_details['event_url']}\n" \
-                f"SUMMARY:{event_details['event_summary']}\n" \
-                f"GEO:{event_details['event_geo']}\n" \
-                f"TRANSP:{event_details['event_transp']}\n" \
-                f"CATEGORIES:{event_details['event_categories']}\n" \
-                f"CREATED:{start_time}\n"
-
-        end_event = "END:VEVENT\n" \
-            "END:VCALENDAR\n"
-
-        # Build Optional Alarm Payload
-        alarm_event = ""
-        if event_details['event_trigger']:
-            alarm_event = "BEGIN:VALARM\n" \
-                               f"TRIGGER:-PT{event_details['event_trigger']}M\n" \
-                               "ATTACH;VALUE=URI:Chord\n" \
-                               "ACTION:AUDIO\n" \
-                               "END:VALARM\n"
-
-        # Assemble Final Event Payload
-        str_event = main_event + alarm_event + end_event
-
-        # Parse and Validate Event Retry Settings
+
+        # Use Payload Rendered From The Precompiled Trigger Template
+        if event_details.get('event_ical'):
+            str_event = event_details['event_ical']
+        else:
+            main_event = "BEGIN:VCALENDAR\n" \
+                    "VERSION:2.0\n" \
+                    "PRODID:-//MQTT//EN\n" \
+                    "CALSCALE:GREGORIAN\n" \
+                    "BEGIN:VEVENT\n" \
+                    f"DTSTART;TZID={event_details['event_timezone']}:{start_time}\n" \
+                    f"DTEND;TZID={event_details['event_timezone']}:{end_time}\n" \
+                    f"DTSTAMP:{start_time}\n" \
+                    f"LOCATION:{event_details['event_location']}\n" \
+                    f"DESCRIPTION:{event_details['event_description']}\n" \
+                    f"URL;VALUE=URI:{event_details['event_url']}\n" \
+                    f"SUMMARY:{event_details['event_summary']}\n" \
+                    f"GEO:{event_details['event_geo']}\n" \
+                    f"TRANSP:{event_details['event_transp']}\n" \
+                    f"CATEGORIES:{event_details['event_categories']}\n" \
+                    f"CREATED:{start_time}\n"
+
+            end_event = "END:VEVENT\n" \
+                "END:VCALENDAR\n"
+
+            # Build Optional Alarm Payload
+            alarm_event = ""
+            if event_details['event_trigger']:
+                alarm_event = "BEGIN:VALARM\n" \
+                                   f"TRIGGER:-PT{event_details['event_trigger']}M\n" \
+                                   "ATTACH;VALUE=URI:Chord\n" \
+                                   "ACTION:AUDIO\n" \
+                                   "END:VALARM\n"
+
+            # Assemble Final Event Payload
+            str_event = main_event + alarm_event + end_event
+
+        # Parse Event Retry Settings for Logging
         max_attempts = config.get('CALDAV_SERVER', {}).get('CALDAV_EVENT_RETRY_ATTEMPTS', 3)
-        initial_retry_delay = config.get('CALDAV_SERVER', {}).get('CALDAV_EVENT_RETRY_DELAY_SECONDS', 60)
-        initial_retry_delay = max(1, int(initial_retry_delay))
         event_calendar_url = event_details['event_calendar_url']
 
-        current_delay = initial_retry_delay
+        # Use Direct PUT Only for Payloads with a Client-Generated UID
+        use_direct_put = bool(event_details.get('event_direct_put')) and caldav_registry is not None \
+            and bool(event_details.get('event_uid')) and bool(event_details.get('event_ical'))
 
         # Attempt Event Creation with Reconnection Logic
-        for attempt in range(max_attempts):
-            is_retryable_error = False
-            try:
-                if attempt > 0:
-                    logger.info(f"{LOG_PREFIX_CALDAV} Attempting to re-initialize CalDAV client...")
-                    new_client = connect_caldav(config['CALDAV_SERVER']['CALDAV_SERVER_ADDRESS'], config['CALDAV_SERVER']['CALDAV_USERNAME'], config['CALDAV_SERVER']['CALDAV_PASSWORD'])
+        is_retryable_error = False
+        try:
+            if attempt > 0:
+                logger.info(f"{LOG_PREFIX_CALDAV} Attempting to re-initialize CalDAV client...")
+                if caldav_registry is not None:
+                    current_caldav_client = caldav_registry.reconnect(current_caldav_client)
+                else:
+                    new_client = connect_caldav(config['CALDAV_SERVER']['CALDAV_SERVER_ADDRESS'], config['CALDAV_SERVER']['CALDAV_USERNAME'], config['CALDAV_SERVER']['CALDAV_PASSWORD'], caldav_timeout)
                     if new_client:
                         current_caldav_client = new_client
                         caldav_client = new_client
 
-                event_calendar = None
-                try:
+            event_calendar = None
+            try:
+                if caldav_registry is not None:
+                    event_calendar = caldav_registry.calendar(event_calendar_url)
+                else:
                     event_calendar = caldav.Calendar(client=current_caldav_client, url=event_calendar_url)
 
-                # Handle Exceptions During Calendar Object Instantiation
-                except Exception as cal_init_e:
-                    log_data_instantiation_error_payload = {
-                        "attempt": attempt + 1,
-                        "max_attempts": max_attempts,
-                        "reason": "Calendar Object Instantiation Failed",
-                        "calendar_url": str(event_calendar_url),
-                        "exception_type": type(cal_init_e).__name__,
-                        "details": str(cal_init_e)
-                    }
-                    logger.error(f"{LOG_PREFIX_CALDAV} Event Create Error (Instantiation) | {format_log_data({'mqtt_topic': topic, **log_data_instantiation_error_payload})}")
-                    raise cal_init_e
-
-                # Push Event to Calendar Server
-                caldav_event = event_calendar.save_event(str_event)
-                log_data_payload = {
-                    "action": mqtt_action,
-                    "event_path": str(caldav_event.url)
+            # Handle Exceptions During Calendar Object Instantiation
+            except Exception as cal_init_e:
+                log_data_instantiation_error_payload = {
+                    "attempt": attempt + 1,
+                    "max_attempts": max_attempts,
+                    "reason": "Calendar Object Instantiation Failed",
+                    "calendar_url": str(event_calendar_url),
+                    "exception_type": type(cal_init_e).__name__,
+                    "details": str(cal_init_e)
                 }
-                logger.info(f"{LOG_PREFIX_CALDAV} Event Created  | {format_log_data({'mqtt_topic': topic, **log_data_payload})}")
-                return
-
-            # Handle CalDAV Calendar Not Found Error (Non-retryable)
-            except NotFoundError as e:
-                log_data_payload = {"reason": "Calendar Not Found", "calendar_url": event_calendar_url, "details": str(e)}
-                logger.error(f"{LOG_PREFIX_CALDAV} Event Create Error | {format_log_data({'mqtt_topic': topic, **log_data_payload})}")
-                break
-
-            # Handle CalDAV Authentication Error (Non-retryable)
-            except AuthorizationError as e:
-                log_data = {"caldav_host": os.getenv("CALDAV_HOST", caldav_host_info), "reason": type(e).__name__, "details": str(e)}
-                logger.error(f"{LOG_PREFIX_CALDAV} Server Connection Failed      | {format_log_data(log_data)}")
-                break
-
-            # Handle CalDAV Event Create Errors
-            except DAVError as e:
-                current_attempt = attempt + 1
-                if e.args and isinstance(e.args[0], requests.exceptions.RequestException):
-                    is_retryable_error = True
-                    log_data_payload = {"attempt": current_attempt, "max_attempts": max_attempts, "reason": "Network Error", "exception_type": type(e.args[0]).__name__, "details": str(e.args[0])}
-                    logger.error(f"{LOG_PREFIX_CALDAV} Event Create Error | {format_log_data({'mqtt_topic': topic, **log_data_payload})}")
-                else:
-                    log_data_payload = {"attempt": current_attempt, "max_attempts": max_attempts, "reason": "CalDAV Server Error", "exception_type": type(e).__name__, "details": str(e)}
-                    logger.error(f"{LOG_PREFIX_CALDAV} Event Create Error | {format_log_data({'mqtt_topic': topic, **log_data_payload})}")
+                logger.error("%s Event Create Error (Instantiation) | %s", LOG_PREFIX_CALDAV, format_log_data({'mqtt_topic': topic, **log_data_instantiation_error_payload}))
+                raise cal_init_e
+
+            # Push Event to Calendar Server
+            if caldav_registry is not None:
+                caldav_registry.reset_request_count()
+            tracing.lap("prepare")
+            request_start = time.monotonic()
+            if use_direct_put:
+                event_path = caldav_registry.put_event(current_caldav_client, event_calendar_url, event_details['event_uid'], str_event)
+            else:
+                caldav_event = event_calendar.save_event(str_event)
+                event_path = str(caldav_event.url)
+            log_data_payload = {
+                "action": mqtt_action,
+                "event_path": event_path,
+                "write_path": "direct_put" if use_direct_put else "save_event",
+                "latency_ms": caldav_request_done("put", request_start)
+            }
+            if caldav_registry is not None:
+                log_data_payload["http_requests"] = caldav_registry.request_count()
+            logger.info("%s Event Created  | %s", LOG_PREFIX_CALDAV, format_log_data({'mqtt_topic': topic, **log_data_payload}))
+            record_event_index('created', event_path, topic, event_details.get('event_summary', ''), str(event_calendar_url))
+            return JOB_SUCCEEDED, None
+
+        # Handle CalDAV Calendar Not Found Error (Non-retryable)
+        except NotFoundError as e:
+            log_data_payload = {"reason": "Calendar Not Found", "calendar_url": event_calendar_url, "details": str(e)}
+            logger.error("%s Event Create Error | %s", LOG_PREFIX_CALDAV, format_log_data({'mqtt_topic': topic, **log_data_payload}))
+            return JOB_FAILED, None
 
-            # Handle CalDAV Network Errors During Event Creation
-            except requests.exceptions.RequestException as e:
+        # Handle CalDAV Authentication Error (Non-retryable)
+        except AuthorizationError as e:
+            log_data = {"caldav_host": os.getenv("CALDAV_HOST", caldav_host_info), "reason": type(e).__name__, "details": str(e)}
+            logger.error("%s Server Connection Failed      | %s", LOG_PREFIX_CALDAV, format_log_data(log_data))
+            return JOB_FAILED, None
+
+        # Handle CalDAV Server Busy Responses and Event Create Errors
+        except DAVError as e:
+            current_attempt = attempt + 1
+            server_busy = retryable_server_error(e)
+            if server_busy is not None:
+                log_data_payload = {"attempt": current_attempt, "max_attempts": max_attempts, "reason": "Server Busy", "status": server_busy.status, "retry_after": server_busy.retry_after, "details": str(e)}
+                logger.error("%s Event Create Error | %s", LOG_PREFIX_CALDAV, format_log_data({'mqtt_topic': topic, **log_data_payload}))
+                return JOB_RETRY, server_busy.retry_after
+            if e.args and isinstance(e.args[0], REQUEST_EXCEPTIONS):
                 is_retryable_error = True
-                current_attempt = attempt + 1
-                log_data_payload = {"attempt": current_attempt, "max_attempts": max_attempts, "reason": "Network Error", "exception_type": type(e).__name__, "details": str(e)}
-                logger.error(f"{LOG_PREFIX_CALDAV} Event Create Error | {format_log_data({'mqtt_topic': topic, **log_data_payload})}")
+                log_data_payload = {"attempt": current_attempt, "max_attempts": max_attempts, "reason": "Network Error", "exception_type": type(e.args[0]).__name__, "details": str(e.args[0])}
+                logger.error("%s Event Create Error | %s", LOG_PREFIX_CALDAV, format_log_data({'mqtt_topic': topic, **log_data_payload}))
+            else:
+                log_data_payload = {"attempt": current_attempt, "max_attempts": max_attempts, "reason": "CalDAV Server Error", "exception_type": type(e).__name__, "details": str(e)}
+                logger.error("%s Event Create Error | %s", LOG_PREFIX_CALDAV, format_log_data({'mqtt_topic': topic, **log_data_payload}))
 
-            # Handle Remaining CalDAV Event Creation Exceptions
-            except Exception as e:
-                current_attempt = attempt + 1
-                if isinstance(e, requests.exceptions.RequestException) or \
-                   (hasattr(e, 'args') and e.args and isinstance(e.args[0], requests.exceptions.RequestException)) or \
-                   'ConnectionError' in str(e) or 'Temporary failure in name resolution' in str(e) or 'Failed to establish a new connection' in str(e):
-                    is_retryable_error = True
-                    log_data_payload = {"attempt": current_attempt, "max_attempts": max_attempts, "reason": "Likely Network Error", "exception_type": type(e).__name__, "details": str(e)}
-                    logger.error(f"{LOG_PREFIX_CALDAV} Event Create Error | {format_log_data({'mqtt_topic': topic, **log_data_payload})}")
-                else:
-                    log_data_payload = {"attempt": current_attempt, "max_attempts": max_attempts, "reason": "Unexpected Error", "exception_type": type(e).__name__, "details": str(e)}
-                    logger.error(f"{LOG_PREFIX_CALDAV} Event Create Error | {format_log_data({'mqtt_topic': topic, **log_data_payload})}")
-                    break
+        # Handle CalDAV Network Errors During Event Creation
+        except REQUEST_EXCEPTIONS as e:
+            is_retryable_error = True
+            current_attempt = attempt + 1
+            log_data_payload = {"attempt": current_attempt, "max_attempts": max_attempts, "reason": "Network Error", "exception_type": type(e).__name__, "details": str(e)}
+            logger.error("%s Event Create Error | %s", LOG_PREFIX_CALDAV, format_log_data({'mqtt_topic': topic, **log_data_payload}))
 
-            # Handle Retry Delay and Exponential Backoff
-            if is_retryable_error:
-                if attempt + 1 < max_attempts:
-                    log_data_retry = {
-                        "mqtt_topic": topic,
-                        "original_action": mqtt_action,
-                        "next_attempt": attempt + 2,
-                         "max_attempts": max_attempts,
-                        "delay_seconds": current_delay
-                    }
-                    logger.info(f"{LOG_PREFIX_CALDAV} Retry Started  | {format_log_data(log_data_retry)}")
-                    time.sleep(current_delay)
-                    current_delay *= 2
-                else:
-                    log_data_fail_payload = {"reason": "Failed after max attempts", "attempts": max_attempts, "final_cause": "Network Errors"}
-                    logger.error(f"{LOG_PREFIX_CALDAV} Event Create Error | {format_log_data({'mqtt_topic': topic, **log_data_fail_payload})}")
+        # Handle Remaining CalDAV Event Creation Exceptions
+        except Exception as e:
+            current_attempt = attempt + 1
+            if isinstance(e, REQUEST_EXCEPTIONS) or \
+               (hasattr(e, 'args') and e.args and isinstance(e.args[0], REQUEST_EXCEPTIONS)) or \
+               'ConnectionError' in str(e) or 'Temporary failure in name resolution' in str(e) or 'Failed to establish a new connection' in str(e):
+                is_retryable_error = True
+                log_data_payload = {"attempt": current_attempt, "max_attempts": max_attempts, "reason": "Likely Network Error", "exception_type": type(e).__name__, "details": str(e)}
+                logger.error("%s Event Create Error | %s", LOG_PREFIX_CALDAV, format_log_data({'mqtt_topic': topic, **log_data_payload}))
             else:
-                break
+                log_data_payload = {"attempt": current_attempt, "max_attempts": max_attempts, "reason": "Unexpected Error", "exception_type": type(e).__name__, "details": str(e)}
+                logger.error("%s Event Create Error | %s", LOG_PREFIX_CALDAV, format_log_data({'mqtt_topic': topic, **log_data_payload}))
+                return JOB_FAILED, None
+
+        # Hand Retryable Errors Back to the Retry Scheduler
+        return (JOB_RETRY if is_retryable_error else JOB_FAILED), None
 
     # Handle Missing Trigger Keys
     except KeyError as e:
         log_data_payload = {"reason": "Config Error - Missing event detail key", "key": str(e)}
-        logger.error(f"{LOG_PREFIX_CALDAV} Event Create Error | {format_log_data({'mqtt_topic': topic, **log_data_payload})}")
+        logger.error("%s Event Create Error | %s", LOG_PREFIX_CALDAV, format_log_data({'mqtt_topic': topic, **log_data_payload}))
 
     # Handle Missing Trigger Values
     except ValueError as e:
         log_data_payload = {"reason": "Data Error - Invalid event detail value", "details": str(e)}
-        logger.error(f"{LOG_PREFIX_CALDAV} Event Create Error | {format_log_data({'mqtt_topic': topic, **log_data_payload})}")
+        logger.error("%s Event Create Error | %s", LOG_PREFIX_CALDAV, format_log_data({'mqtt_topic': topic, **log_data_payload}))
 
     # Handle Type Errors
     except TypeError as e:
-         if 'int()' in str(e) and 'CALDAV_EVENT_RETRY_DELAY_SECONDS' in str(config.get('CALDAV_SERVER', {})):
-              log_data = {"reason": "Config Error - CALDAV_EVENT_RETRY_DELAY_SECONDS must be an integer", "value": config.get('CALDAV_SERVER', {}).get('CALDAV_EVENT_RETRY_DELAY_SECONDS')}
-              logger.error(f"{LOG_PREFIX_APPLICATION} Invalid Config     | {format_log_data(log_data)}")
-         else:
-              log_data = {"mqtt_topic": topic, "reason": "Data Type Error during event processing", "details": str(e)}
-              logger.error(f"{LOG_PREFIX_APPLICATION} Processing Error   | {format_log_data(log_data)}")
+        log_data = {"mqtt_topic": topic, "reason": "Data Type Error during event processing", "details": str(e)}
+        logger.error("%s Processing Error   | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data))
 
+    return JOB_FAILED, None
 
 
 
-### FUNCTION :: Delete CalDAV Event ######################################################
-def delete_caldav_event(current_caldav_client: caldav.DAVClient, event_url: str, topic: str, config: Dict[str, Any], action: Optional[str] = None) -> None:
-    """Deletes a CalDAV event from the server with retry logic for network errors."""
-    global caldav_client
-    max_attempts = config.get('CALDAV_SERVER', {}).get('CALDAV_EVENT_RETRY_ATTEMPTS', 3)
-    try:
-        initial_retry_delay = config.get('CALDAV_SERVER', {}).get('CALDAV_EVENT_RETRY_DELAY_SECONDS', 60)
-        initial_retry_delay = max(1, int(initial_retry_delay))
-    except (ValueError, TypeError):
-        initial_retry_delay = 60
+### FUNCTION :: Extend CalDAV Event ######################################################
+def extend_caldav_event(current_caldav_client: caldav.DAVClient, event_details: Optional[Dict[str, Any]], topic: str, config: Dict[str, Any],
+                        attempt: int = 0) -> Tuple[str, Optional[float]]:
+    """Extends the open event of an extend trigger, or creates a new one once it has ended.
 
-    current_delay = initial_retry_delay
+    The open event's DTEND is moved with a PUT conditional on its ETag (If-Match). If the
+    event was changed or removed on the server, it is no longer tracked and a new event
+    is created. Returns the job outcome and the server's Retry-After in seconds, if any.
+    """
+    if caldav_registry is None:
+        return create_caldav_event(current_caldav_client, event_details, topic, config, attempt)
+    if not event_details or not event_details.get('event_ical') or not event_details.get('event_extend_key'):
+        log_data_payload = {"reason": "Internal Error - extend payload incomplete, iCalendar template missing"}
+        logger.error("%s Event Extend Error | %s", LOG_PREFIX_CALDAV, format_log_data({'mqtt_topic': topic, **log_data_payload}))
+        return JOB_FAILED, None
 
-    # Attempt Event Deletion with Reconnection Logic
-    for attempt in range(max_attempts):
-        is_retryable_error = False
+    max_attempts = config.get('CALDAV_SERVER', {}).get('CALDAV_EVENT_RETRY_ATTEMPTS', 3)
+    mqtt_action = event_details.get('mqtt_action', 'unknown')
+    extend_key = event_details['event_extend_key']
+    is_retryable_error = False
+
+    # Run Jobs of the Same Trigger and Topic One at a Time, Not Necessarily in Message Order
+    with open_event_tracker.lock(extend_key):
         try:
             if attempt > 0:
                 logger.info(f"{LOG_PREFIX_CALDAV} Attempting to re-initialize CalDAV client...")
-                new_client = connect_caldav(config['CALDAV_SERVER']['CALDAV_SERVER_ADDRESS'], config['CALDAV_SERVER']['CALDAV_USERNAME'], config['CALDAV_SERVER']['CALDAV_PASSWORD'])
+                current_caldav_client = caldav_registry.reconnect(current_caldav_client)
+            caldav_registry.reset_request_count()
+
+            # Extend Open Event with a Conditional PUT
+            open_event = open_event_tracker.get(extend_key)
+            if open_event is not None and event_details['start_time'] < open_event.end_time:
+                if event_details['end_time'] <= open_event.end_time:
+                    log_data_payload = {"action": mqtt_action, "event_path": open_event.url, "event_end": open_event.end_time, "reason": "Event already covers message"}
+                    logger.debug("%s Event Extended | %s", LOG_PREFIX_CALDAV, format_log_data({'mqtt_topic': topic, **log_data_payload}))
+                    return JOB_SUCCEEDED, None
+                try:
+                    str_event = replace_event_end(open_event.ical, open_event.timezone, open_event.end_time, event_details['end_time'])
+                    tracing.lap("prepare")
+                    request_start = time.monotonic()
+                    new_etag = caldav_registry.update_event(current_caldav_client, open_event.url, str_event, open_event.etag)
+                    open_event_tracker.extended(extend_key, event_details['end_time'], str_event, new_etag)
+                    log_data_payload = {
+                        "action": mqtt_action,
+                        "event_path": open_event.url,
+                        "event_end": event_details['end_time'],
+                        "http_requests": caldav_registry.request_count(),
+                        "latency_ms": caldav_request_done("update", request_start)
+                    }
+                    logger.info("%s Event Extended | %s", LOG_PREFIX_CALDAV, format_log_data({'mqtt_topic': topic, **log_data_payload}))
+                    return JOB_SUCCEEDED, None
+
+                # Handle Events Changed or Removed on the Server
+                except (EventChangedError, NotFoundError, ValueError) as e:
+                    open_event_tracker.forget(extend_key)
+                    log_data_payload = {"action": mqtt_action, "event_path": open_event.url, "reason": "Open event changed on server, creating new event", "details": str(e)}
+                    logger.warn("%s Event Extend Skipped | %s", LOG_PREFIX_CALDAV, format_log_data({'mqtt_topic': topic, **log_data_payload}))
+
+            # Create New Event and Track It
+            tracing.lap("prepare")
+            request_start = time.monotonic()
+            event_path, event_etag = caldav_registry.put_event_tagged(current_caldav_client, event_details['event_calendar_url'],
+                                                                       event_details['event_uid'], event_details['event_ical'])
+            open_event_tracker.open(extend_key, OpenEvent(event_path, event_etag, event_details['end_time'], event_details['event_ical'],
+                                                          event_details['event_timezone']))
+            log_data_payload = {
+                "action": mqtt_action,
+                "event_path": event_path,
+                "write_path": "extend",
+                "http_requests": caldav_registry.request_count(),
+                "latency_ms": caldav_request_done("put", request_start)
+            }
+            logger.info("%s Event Created  | %s", LOG_PREFIX_CALDAV, format_log_data({'mqtt_topic': topic, **log_data_payload}))
+            record_event_index('created', event_path, topic, event_details.get('event_summary', ''), str(event_details['event_calendar_url']))
+            return JOB_SUCCEEDED, None
+
+        # Handle CalDAV Calendar Not Found Error (Non-retryable)
+        except NotFoundError as e:
+            log_data_payload = {"reason": "Calendar Not Found", "calendar_url": event_details['event_calendar_url'], "details": str(e)}
+            logger.error("%s Event Extend Error | %s", LOG_PREFIX_CALDAV, format_log_data({'mqtt_topic': topic, **log_data_payload}))
+            return JOB_FAILED, None
+
+        # Handle CalDAV Server Busy, Server and Network Errors
+        except (DAVError, *REQUEST_EXCEPTIONS) as e:
+            server_busy = retryable_server_error(e)
+            if server_busy is not None:
+                log_data_payload = {"attempt": attempt + 1, "max_attempts": max_attempts, "reason": "Server Busy", "status": server_busy.status, "retry_after": server_busy.retry_after, "details": str(e)}
+                logger.error("%s Event Extend Error | %s", LOG_PREFIX_CALDAV, format_log_data({'mqtt_topic': topic, **log_data_payload}))
+                return JOB_RETRY, server_busy.retry_after
+            network_error = e if isinstance(e, REQUEST_EXCEPTIONS) else (e.args[0] if e.args else None)
+            is_retryable_error = isinstance(network_error, REQUEST_EXCEPTIONS)
+            log_data_payload = {
+                "attempt": attempt + 1,
+                "max_attempts": max_attempts,
+                "reason": "Network Error" if is_retryable_error else "CalDAV Server Error",
+                "exception_type": type(network_error if is_retryable_error else e).__name__,
+                "details": str(network_error if is_retryable_error else e)
+            }
+            logger.error("%s Event Extend Error | %s", LOG_PREFIX_CALDAV, format_log_data({'mqtt_topic': topic, **log_data_payload}))
+
+        # Handle Unexpected Errors
+        except Exception as e:
+            log_data_payload = {"reason": "Unexpected Error", "exception_type": type(e).__name__, "details": str(e)}
+            logger.error("%s Event Extend Error | %s", LOG_PREFIX_CALDAV, format_log_data({'mqtt_topic': topic, **log_data_payload}))
+
+    # Hand Retryable Errors Back to the Retry Scheduler
+    return (JOB_RETRY if is_retryable_error else JOB_FAILED), None
+
+
+
+### FUNCTION :: Delete CalDAV Event ######################################################
+def delete_caldav_event(current_caldav_client: caldav.DAVClient, event_url: str, topic: str, config: Dict[str, Any], action: Optional[str] = None,
+                        attempt: int = 0) -> Tuple[str, Optional[float]]:
+    """Sends one event deletion attempt to the CalDAV server.
+
+    Returns the job outcome and the server's Retry-After in seconds, if any. Retries of
+    network errors are scheduled by run_caldav_job.
+    """
+    global caldav_client
+    max_attempts = config.get('CALDAV_SERVER', {}).get('CALDAV_EVENT_RETRY_ATTEMPTS', 3)
+
+    # Attempt Event Deletion with Reconnection Logic
+    is_retryable_error = False
+    try:
+        if attempt > 0:
+            logger.info(f"{LOG_PREFIX_CALDAV} Attempting to re-initialize CalDAV client...")
+            if caldav_registry is not None:
+                current_caldav_client = caldav_registry.reconnect(current_caldav_client)
+            else:
+                new_client = connect_caldav(config['CALDAV_SERVER']['CALDAV_SERVER_ADDRESS'], config['CALDAV_SERVER']['CALDAV_USERNAME'], config['CALDAV_SERVER']['CALDAV_PASSWORD'], caldav_timeout)
                 if new_client:
                     current_caldav_client = new_client
                     caldav_client = new_client
 
-            # Delete Event from Calendar Server
+        # Delete Event from Calendar Server
+        tracing.lap("prepare")
+        request_start = time.monotonic()
+        if caldav_registry is not None:
+            caldav_registry.delete_event(current_caldav_client, event_url)
+        else:
             event = caldav.Event(client=current_caldav_client, url=event_url)
             event.delete()
-            log_data_payload = {
-                "action": action if action else "unknown",
-                "event_path": event_url
-            }
-            logger.info(f"{LOG_PREFIX_CALDAV} Event Deleted  | {format_log_data({'mqtt_topic': topic, **log_data_payload})}")
-            return
-
-        # Handle CalDAV Event Not Found
-        except NotFoundError as e:
-            log_data_payload = {"reason": "Not Found Error", "event_url": event_url}
-            logger.error(f"{LOG_PREFIX_CALDAV} Event Delete Error | {format_log_data({'mqtt_topic': topic, **log_data_payload})}")
-            break
+        log_data_payload = {
+            "action": action if action else "unknown",
+            "event_path": event_url,
+            "latency_ms": caldav_request_done("delete", request_start)
+        }
+        logger.info("%s Event Deleted  | %s", LOG_PREFIX_CALDAV, format_log_data({'mqtt_topic': topic, **log_data_payload}))
+        record_event_index('deleted', event_url, topic)
+        return JOB_SUCCEEDED, None
+
+    # Handle CalDAV Event Not Found
+    except NotFoundError as e:
+        log_data_payload = {"reason": "Not Found Error", "event_url": event_url}
+        logger.error("%s Event Delete Error | %s", LOG_PREFIX_CALDAV, format_log_data({'mqtt_topic': topic, **log_data_payload}))
+        record_event_index('deleted', event_url, topic)
+        return JOB_FAILED, None
+
+    # Handle CalDAV Server Busy Responses and Server Errors
+    except DAVError as e:
+        current_attempt = attempt + 1
+        server_busy = retryable_server_error(e)
+        if server_busy is not None:
+            log_data_payload = {"attempt": current_attempt, "max_attempts": max_attempts, "reason": "Server Busy", "status": server_busy.status, "retry_after": server_busy.retry_after, "details": str(e)}
+            logger.error("%s Event Delete Error | %s", LOG_PREFIX_CALDAV, format_log_data({'mqtt_topic': topic, **log_data_payload}))
+            return JOB_RETRY, server_busy.retry_after
+        if e.args and isinstance(e.args[0], REQUEST_EXCEPTIONS):
+            is_retryable_error = True
+            log_data_payload = {"attempt": current_attempt, "max_attempts": max_attempts, "reason": "Network Error", "exception_type": type(e.args[0]).__name__, "details": str(e.args[0])}
+            logger.error("%s Event Delete Error | %s", LOG_PREFIX_CALDAV, format_log_data({'mqtt_topic': topic, **log_data_payload}))
+        else:
+            log_data_payload = {"reason": "CalDAV Server Error", "exception_type": type(e).__name__, "details": str(e)}
+            logger.error("%s Event Delete Error | %s", LOG_PREFIX_CALDAV, format_log_data({'mqtt_topic': topic, **log_data_payload}))
 
-        # Handle CalDAV Server Errors
-        except DAVError as e:
-            current_attempt = attempt + 1
-            if e.args and isinstance(e.args[0], requests.exceptions.RequestException):
-                is_retryable_error = True
-                log_data_payload = {"attempt": current_attempt, "max_attempts": max_attempts, "reason": "Network Error", "exception_type": type(e.args[0]).__name__, "details": str(e.args[0])}
-                logger.error(f"{LOG_PREFIX_CALDAV} Event Delete Error | {format_log_data({'mqtt_topic': topic, **log_data_payload})}")
-            else:
-                log_data_payload = {"reason": "CalDAV Server Error", "exception_type": type(e).__name__, "details": str(e)}
-                logger.error(f"{LOG_PREFIX_CALDAV} Event Delete Error | {format_log_data({'mqtt_topic': topic, **log_data_payload})}")
+    # Handle CalDAV Network Errors During Event Deletion
+    except REQUEST_EXCEPTIONS as e:
+        is_retryable_error = True
+        current_attempt = attempt + 1
+        log_data_payload = {"attempt": current_attempt, "max_attempts": max_attempts, "reason": "Network Error", "exception_type": type(e).__name__, "details": str(e)}
+        logger.error("%s Event Delete Error | %s", LOG_PREFIX_CALDAV, format_log_data({'mqtt_topic': topic, **log_data_payload}))
 
-        # Handle CalDAV Network Errors During Event Deletion
-        except requests.exceptions.RequestException as e:
+    # Handle Remaining CalDAV Event Creation Exceptions
+    except Exception as e:
+        current_attempt = attempt + 1
+        if isinstance(e, REQUEST_EXCEPTIONS) or \
+           (hasattr(e, 'args') and e.args and isinstance(e.args[0], REQUEST_EXCEPTIONS)) or \
+           'ConnectionError' in str(e) or 'Temporary failure in name resolution' in str(e) or 'Failed to establish a new connection' in str(e):
             is_retryable_error = True
-            current_attempt = attempt + 1
-            log_data_payload = {"attempt": current_attempt, "max_attempts": max_attempts, "reason": "Network Error", "exception_type": type(e).__name__, "details": str(e)}
-            logger.error(f"{LOG_PREFIX_CALDAV} Event Delete Error | {format_log_data({'mqtt_topic': topic, **log_data_payload})}")
+            log_data_payload = {"attempt": current_attempt, "max_attempts": max_attempts, "reason": "Likely Network Error", "exception_type": type(e).__name__, "details": str(e)}
+            logger.error("%s Event Delete Error | %s", LOG_PREFIX_CALDAV, format_log_data({'mqtt_topic': topic, **log_data_payload}))
+        else:
+            log_data_payload = {"reason": "Unexpected Error", "exception_type": type(e).__name__, "details": str(e)}
+            logger.error("%s Event Delete Error | %s", LOG_PREFIX_CALDAV, format_log_data({'mqtt_topic': topic, **log_data_payload}))
+            return JOB_FAILED, None
 
-        # Handle Remaining CalDAV Event Creation Exceptions
-        except Exception as e:
-            current_attempt = attempt + 1
-            if isinstance(e, requests.exceptions.RequestException) or \
-               (hasattr(e, 'args') and e.args and isinstance(e.args[0], requests.exceptions.RequestException)) or \
-               'ConnectionError' in str(e) or 'Temporary failure in name resolution' in str(e) or 'Failed to establish a new connection' in str(e):
-                is_retryable_error = True
-                log_data_payload = {"attempt": current_attempt, "max_attempts": max_attempts, "reason": "Likely Network Error", "exception_type": type(e).__name__, "details": str(e)}
-                logger.error(f"{LOG_PREFIX_CALDAV} Event Delete Error | {format_log_data({'mqtt_topic': topic, **log_data_payload})}")
-            else:
-                log_data_payload = {"reason": "Unexpected Error", "exception_type": type(e).__name__, "details": str(e)}
-                logger.error(f"{LOG_PREFIX_CALDAV} Event Delete Error | {format_log_data({'mqtt_topic': topic, **log_data_payload})}")
-                break
-
-        # Handle Retry Delay and Exponential Backoff
-        if is_retryable_error:
-            if attempt + 1 < max_attempts:
-                log_data_retry = {
-                    "mqtt_topic": topic,
-                    "action": action,
-                    "next_attempt": attempt + 2,
-                    "max_attempts": max_attempts,
-                    "delay_seconds": current_delay
-                }
-                logger.info(f"{LOG_PREFIX_CALDAV} Retry Started  | {format_log_data(log_data_retry)}")
-                time.sleep(current_delay)
-                current_delay *= 2
-            else:
-                log_data_fail_payload = {"reason": "Failed after max attempts", "attempts": max_attempts, "final_cause": "Network Errors"}
-                logger.error(f"{LOG_PREFIX_CALDAV} Event Delete Error | {format_log_data({'mqtt_topic': topic, **log_data_fail_payload})}")
+    # Hand Retryable Errors Back to the Retry Scheduler
+    return (JOB_RETRY if is_retryable_error else JOB_FAILED), None
+
+
+
+### FUNCTION :: Schedule CalDAV Retry ####################################################
+def schedule_caldav_retry(outbox_id: Optional[int], event_mode: str, topic: str, action: str, payload: Dict[str, Any], config: Dict[str, Any],
+                          attempt: int, retry_after: Optional[float], trace: Optional[Trace] = None) -> bool:
+    """Schedules the next attempt of a job with jittered backoff. Returns False once all attempts are used up."""
+    try:
+        max_attempts = int(config.get('CALDAV_SERVER', {}).get('CALDAV_EVENT_RETRY_ATTEMPTS', 3))
+    except (ValueError, TypeError):
+        max_attempts = 3
+    try:
+        initial_retry_delay = max(1, int(config.get('CALDAV_SERVER', {}).get('CALDAV_EVENT_RETRY_DELAY_SECONDS', 60)))
+    except (ValueError, TypeError):
+        initial_retry_delay = 60
+
+    if caldav_retry_scheduler is None or attempt + 1 >= max_attempts:
+        return False
+
+    # Honor Retry-After When The Server Asks For a Longer Wait
+    retry_delay = max(jittered_backoff(initial_retry_delay, attempt, CALDAV_RETRY_MAX_DELAY_SECONDS), retry_after or 0.0)
+    log_data_retry = {
+        "mqtt_topic": topic,
+        "action": action,
+        "event_mode": event_mode,
+        "next_attempt": attempt + 2,
+        "max_attempts": max_attempts,
+        "delay_seconds": round(retry_delay, 1)
+    }
+    logger.info("%s Retry Started  | %s", LOG_PREFIX_CALDAV, format_log_data(log_data_retry))
+    count_metric("mqtt2caldav_caldav_retries_total", {"event_mode": event_mode})
+    caldav_retry_scheduler.schedule(retry_delay, lambda: requeue_caldav_job(outbox_id, event_mode, topic, action, payload, config, attempt + 1, trace))
+    return True
+
+
+
+### FUNCTION :: Requeue CalDAV Job #######################################################
+def requeue_caldav_job(outbox_id: Optional[int], event_mode: str, topic: str, action: str, payload: Dict[str, Any], config: Dict[str, Any],
+                       attempt: int, trace: Optional[Trace] = None, handover: int = 0) -> None:
+    """Hands a due retry to the worker pool from the retry scheduler thread without waiting.
+
+    While the job queue is full the hand-over is tried again with backoff, the job is
+    neither shed nor acknowledged, so one full queue never holds up other retries or
+    the circuit breaker's timers.
+    """
+    if caldav_worker_pool is None:
+        return
+    if caldav_worker_pool.offer(run_caldav_job, (outbox_id, event_mode, topic, action, payload, config, attempt, trace), label=f"{event_mode}:{topic}"):
+        return
+    if caldav_worker_pool.stopping:
+        keep_caldav_job(event_mode, topic, action, outbox_id, trace)
+        return
+
+    # Try Again Later While the Job Queue Is Full
+    requeue_delay = jittered_backoff(1.0, handover, CALDAV_REQUEUE_MAX_DELAY_SECONDS)
+    log_data_requeue = {"mqtt_topic": topic, "action": action, "event_mode": event_mode, "next_attempt": attempt + 1, "delay_seconds": round(requeue_delay, 1),
+                        "reason": "CalDAV job queue full"}
+    logger.debug("%s Retry Deferred | %s", LOG_PREFIX_CALDAV, format_log_data(log_data_requeue))
+    caldav_retry_scheduler.schedule(requeue_delay, lambda: requeue_caldav_job(outbox_id, event_mode, topic, action, payload, config, attempt, trace, handover + 1))
+
+
+
+### FUNCTION :: Run CalDAV Job ###########################################################
+def run_caldav_job(outbox_id: Optional[int], event_mode: str, topic: str, action: str, payload: Dict[str, Any], config: Dict[str, Any],
+                   attempt: int = 0, trace: Optional[Trace] = None) -> None:
+    """Executes one attempt of a queued create or delete job.
+
+    The job is parked while the circuit breaker is open, rescheduled on retryable errors
+    and acknowledged in the outbox once it succeeded or was given up on. The message
+    trace, if any, is active on the worker thread while the job runs.
+    """
+    def _resubmit():
+        # Runs on the breaker's release or probe thread, waits for queue space instead of shedding
+        submit_caldav_job(event_mode, topic, action, payload, config, outbox_id=outbox_id, block=True, attempt=attempt, trace=trace)
+
+    tracing.activate(trace)
+    tracing.lap("queue_wait" if attempt == 0 else "retry_wait")
+
+    # Park Job While CalDAV Server Is Considered Down
+    admission = caldav_breaker.acquire_or_park(_resubmit) if caldav_breaker is not None else ADMITTED
+    if admission == PARKED:
+        log_data_parked = {"mqtt_topic": topic, "action": action, "event_mode": event_mode, **caldav_breaker.stats()}
+        logger.debug("%s Job Parked     | %s", LOG_PREFIX_CALDAV, format_log_data(log_data_parked))
+        tracing.activate(None)
+        return
+
+    # Leave Job in the Outbox When Too Many Are Parked, It Is Replayed on the Next Start
+    if admission == BACKLOG_FULL:
+        log_data_refused = {"mqtt_topic": topic, "action": action, "event_mode": event_mode, "outbox_id": outbox_id,
+                            "reason": "Breaker backlog full, job kept in outbox for replay" if outbox_id is not None else "Breaker backlog full, job dropped", **caldav_breaker.stats()}
+        logger.warn("%s Job Not Parked | %s", LOG_PREFIX_CALDAV, format_log_data(log_data_refused))
+        if tracer is not None and trace is not None:
+            tracer.finish(trace, JOB_DEFERRED, event_mode)
+        tracing.activate(None)
+        return
+
+    outcome, retry_after = JOB_FAILED, None
+    # Wait for Server and Calendar Rate Limits
+    target_url = (payload or {}).get('event_url' if event_mode == "delete" else 'event_calendar_url', '')
+    with (caldav_limiter.acquire(target_url) if caldav_limiter is not None else nullcontext(0.0)) as rate_wait:
+        if rate_wait >= 1.0:
+            log_data_wait = {"mqtt_topic": topic, "action": action, "event_mode": event_mode, "calendar_url": RequestLimiter.calendar_key(target_url), "wait_seconds": round(rate_wait, 2)}
+            logger.debug("%s Rate Limit Wait | %s", LOG_PREFIX_CALDAV, format_log_data(log_data_wait))
+        tracing.lap("rate_limit_wait")
+
+        current_client = caldav_registry.client if caldav_registry is not None else caldav_client
+        if event_mode == "create":
+            outcome, retry_after = create_caldav_event(current_client, payload, topic, config, attempt)
+        elif event_mode == "extend":
+            outcome, retry_after = extend_caldav_event(current_client, payload, topic, config, attempt)
+        elif event_mode == "delete":
+            outcome, retry_after = delete_caldav_event(current_client, payload['event_url'], topic, config, action, attempt)
+    tracing.lap("record_result")
+
+    count_metric("mqtt2caldav_caldav_jobs_total", {"event_mode": event_mode, "outcome": outcome})
+    if service_stats is not None:
+        service_stats.caldav_result(outcome == JOB_SUCCEEDED)
+
+    # Report Outcome to Circuit Breaker
+    if caldav_breaker is not None:
+        if outcome == JOB_RETRY:
+            if caldav_breaker.record_failure(retry_after):
+                log_data_breaker = {"mqtt_topic": topic, "retry_after": retry_after, "reset_seconds": caldav_breaker.reset_timeout, **caldav_breaker.stats()}
+                logger.warn("%s Circuit Breaker Opened        | %s", LOG_PREFIX_CALDAV, format_log_data(log_data_breaker))
+        elif outcome == JOB_SUCCEEDED:
+            breaker_state = caldav_breaker.state
+            caldav_breaker.record_success()
+            if breaker_state != STATE_CLOSED:
+                logger.info("%s Circuit Breaker Closed        | %s", LOG_PREFIX_CALDAV, format_log_data(caldav_breaker.stats()))
+
+    # Schedule Retry or Finish Job
+    if outcome == JOB_RETRY:
+        if schedule_caldav_retry(outbox_id, event_mode, topic, action, payload, config, attempt, retry_after, trace):
+            tracing.activate(None)
+            return
+        log_data_fail_payload = {"reason": "Failed after max attempts", "attempts": attempt + 1, "final_cause": "Network Errors"}
+        error_label = "Event Delete Error" if event_mode == "delete" else "Event Create Error"
+        logger.error("%s %s | %s", LOG_PREFIX_CALDAV, error_label, format_log_data({'mqtt_topic': topic, **log_data_fail_payload}))
+
+    if outbox_id is not None and caldav_outbox is not None:
+        caldav_outbox.ack(outbox_id)
+
+    # Write Finished Trace
+    if tracer is not None and trace is not None:
+        tracing.lap("outbox_ack")
+        tracer.finish(trace, outcome, event_mode)
+    tracing.activate(None)
+
+
+
+### FUNCTION :: Queue CalDAV Job #########################################################
+def submit_caldav_job(event_mode: str, topic: str, action: str, payload: Dict[str, Any], config: Dict[str, Any],
+                      outbox_id: Optional[int] = None, block: bool = False, attempt: int = 0, trace: Optional[Trace] = None) -> bool:
+    """Persists a CalDAV job to the outbox, queues it on the worker pool and logs jobs shed by the queue full policy.
+
+    Jobs shed by the policy are given up and acknowledged in the outbox. Jobs refused
+    because the pool is stopping stay in the outbox and are replayed on the next start.
+    A message trace passed along is handed to the worker that runs the job.
+    """
+    if caldav_worker_pool is None:
+        log_data = {"mqtt_topic": topic, "action": action, "event_mode": event_mode, "reason": "CalDAV worker pool not started"}
+        logger.error("%s Event Skipped  | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data))
+        return False
+
+    # Persist Job Before Acknowledging the MQTT Message
+    if outbox_id is None and caldav_outbox is not None:
+        outbox_id = caldav_outbox.append({"event_mode": event_mode, "mqtt_topic": topic, "action": action, "payload": payload})
+        tracing.lap("outbox_append")
+
+    if trace is not None:
+        trace.handed_off = True
+    accepted, shed_job = caldav_worker_pool.submit(run_caldav_job, (outbox_id, event_mode, topic, action, payload, config, attempt, trace),
+                                                   label=f"{event_mode}:{topic}", block=block)
+    if shed_job is not None:
+        shed_outbox_id, shed_trace = shed_job[1][0], shed_job[1][-1]
+        if shed_outbox_id is not None and caldav_outbox is not None:
+            caldav_outbox.ack(shed_outbox_id)
+        if tracer is not None and shed_trace is not None:
+            tracer.finish(shed_trace, JOB_SHED, shed_job[1][1])
+        log_data = {
+            "mqtt_topic": topic,
+            "action": action,
+            "event_mode": event_mode,
+            "shed_job": shed_job[2],
+            "policy": caldav_worker_pool.policy,
+            **caldav_worker_pool.stats()
+        }
+        logger.warn("%s Job Queue Full | %s", LOG_PREFIX_CALDAV, format_log_data(log_data))
+    elif not accepted:
+        keep_caldav_job(event_mode, topic, action, outbox_id, trace)
+    return accepted
+
+
+def keep_caldav_job(event_mode: str, topic: str, action: str, outbox_id: Optional[int], trace: Optional[Trace]) -> None:
+    """Logs a job refused by the stopping worker pool, it stays in the outbox and is replayed on the next start."""
+    log_data = {"mqtt_topic": topic, "action": action, "event_mode": event_mode, "outbox_id": outbox_id, "reason": "CalDAV worker pool stopping, job kept in outbox for replay"}
+    logger.warn("%s Job Not Queued | %s", LOG_PREFIX_CALDAV, format_log_data(log_data))
+    if tracer is not None and trace is not None:
+        tracer.finish(trace, JOB_DEFERRED, event_mode)
+
+
+
+### FUNCTION :: Create Metrics ###########################################################
+def create_metrics() -> Metrics:
+    """Declares the metrics served on /metrics and the collectors reading pool, retry and limiter state."""
+    new_metrics = Metrics()
+    new_metrics.describe("mqtt2caldav_messages_received_total", "counter", "MQTT messages received per topic.")
+    new_metrics.describe("mqtt2caldav_messages_matched_total", "counter", "MQTT messages that matched at least one trigger per topic.")
+    new_metrics.describe("mqtt2caldav_messages_skipped_total", "counter", "MQTT messages or matched triggers not actioned per topic and reason.")
+    new_metrics.describe("mqtt2caldav_messages_invalid_json_total", "counter", "MQTT messages with a payload that is not valid JSON per topic.")
+    new_metrics.describe("mqtt2caldav_message_processing_seconds", "histogram", "Time spent in the MQTT message callback.")
+    new_metrics.describe("mqtt2caldav_caldav_request_seconds", "histogram", "Latency of successful CalDAV PUT, update and DELETE requests.")
+    new_metrics.describe("mqtt2caldav_caldav_jobs_total", "counter", "CalDAV job attempts per event mode and outcome.")
+    new_metrics.describe("mqtt2caldav_caldav_retries_total", "counter", "CalDAV job retries scheduled per event mode.")
+    new_metrics.describe("mqtt2caldav_caldav_last_success_timestamp_seconds", "gauge", "Unix time of the last successful CalDAV write.")
+    new_metrics.describe("mqtt2caldav_caldav_workers", "gauge", "CalDAV worker threads, configured and currently busy.")
+    new_metrics.describe("mqtt2caldav_caldav_queue_depth", "gauge", "CalDAV jobs waiting for a worker.")
+    new_metrics.describe("mqtt2caldav_caldav_retries_pending", "gauge", "CalDAV retries waiting for their backoff delay.")
+    new_metrics.describe("mqtt2caldav_caldav_breaker_open", "gauge", "1 while the CalDAV circuit breaker is not closed.")
+    new_metrics.describe("mqtt2caldav_caldav_rate_wait_seconds", "gauge", "Wait a CalDAV request reserving now would get, per rate limit bucket.")
+    new_metrics.describe("mqtt2caldav_outbox_pending_jobs", "gauge", "CalDAV jobs in the outbox that have not completed.")
+    new_metrics.describe("mqtt2caldav_threads", "gauge", "Threads running in the process.")
+    new_metrics.describe("mqtt2caldav_config_reloads_total", "counter", "Configuration reloads per result.")
+
+    def collect_workers():
+        if caldav_worker_pool is None:
+            return []
+        pool_stats = caldav_worker_pool.stats()
+        return [("mqtt2caldav_caldav_workers", {"state": "configured"}, pool_stats['worker_count']),
+                ("mqtt2caldav_caldav_workers", {"state": "active"}, pool_stats['active_workers'])]
+
+    new_metrics.add_collector("mqtt2caldav_caldav_workers", collect_workers)
+    new_metrics.add_collector("mqtt2caldav_caldav_queue_depth", lambda: [("mqtt2caldav_caldav_queue_depth", {}, caldav_worker_pool.stats()['queue_depth'])] if caldav_worker_pool is not None else [])
+    new_metrics.add_collector("mqtt2caldav_caldav_retries_pending", lambda: [("mqtt2caldav_caldav_retries_pending", {}, caldav_retry_scheduler.pending(KIND_RETRY))] if caldav_retry_scheduler is not None else [])
+    new_metrics.add_collector("mqtt2caldav_caldav_breaker_open", lambda: [("mqtt2caldav_caldav_breaker_open", {}, int(caldav_breaker.state != STATE_CLOSED))] if caldav_breaker is not None else [])
+    new_metrics.add_collector("mqtt2caldav_caldav_rate_wait_seconds", lambda: [("mqtt2caldav_caldav_rate_wait_seconds", {"bucket": bucket}, wait)
+                                                                               for bucket, wait in caldav_limiter.wait_seconds().items()] if caldav_limiter is not None else [])
+    new_metrics.add_collector("mqtt2caldav_outbox_pending_jobs", lambda: [("mqtt2caldav_outbox_pending_jobs", {}, caldav_outbox.stats()['pending_jobs'])] if caldav_outbox is not None else [])
+    new_metrics.add_collector("mqtt2caldav_threads", lambda: [("mqtt2caldav_threads", {}, threading.active_count())])
+    return new_metrics
+
+
+
+### FUNCTION :: Count Metric #############################################################
+def count_metric(name: str, labels: Dict[str, str]) -> None:
+    """Increments a counter, if the metrics endpoint is enabled."""
+    if metrics is not None:
+        metrics.inc(name, labels)
+
+
+def caldav_request_done(operation: str, request_start: float) -> int:
+    """Returns the latency of a successful CalDAV request in milliseconds and records it in the metrics and the active trace."""
+    elapsed = time.monotonic() - request_start
+    tracing.lap(f"caldav_{operation}")
+    if metrics is not None:
+        metrics.observe("mqtt2caldav_caldav_request_seconds", elapsed, {"operation": operation})
+        metrics.set("mqtt2caldav_caldav_last_success_timestamp_seconds", time.time())
+    if service_stats is not None:
+        service_stats.caldav_latency(round(elapsed * 1000))
+    return round(elapsed * 1000)
+
+
+
+### FUNCTION :: Build Status Document ####################################################
+def build_status_document() -> Dict[str, Any]:
+    """Returns the retained status document published on MQTT_STATUS_TOPIC."""
+    document = {
+        "state": "online",
+        "timestamp": datetime.now().isoformat(timespec='seconds'),
+        "app_version": VERSION,
+        "uptime_seconds": round(service_stats.uptime_seconds()),
+        "rss_mb": round(resident_memory_bytes() / 1024 / 1024, 1),
+        **service_stats.snapshot(),
+        "pending_retries": caldav_retry_scheduler.pending(KIND_RETRY) if caldav_retry_scheduler is not None else 0,
+        "outbox_pending_jobs": caldav_outbox.stats()['pending_jobs'] if caldav_outbox is not None else 0
+    }
+    if caldav_breaker is not None:
+        document["breaker_state"] = caldav_breaker.state
+    return document
+
+
+
+### FUNCTION :: Record Event Index #######################################################
+def record_event_index(state: str, event_url: str, topic: str, trigger: str = '', calendar: str = '') -> None:
+    """Records a created or deleted event URL in the event index, if it is open."""
+    if event_index is None:
+        return
+    try:
+        if state == 'created':
+            event_index.record_created(event_url, topic, trigger, calendar)
         else:
-            break
+            event_index.record_deleted(event_url)
+
+    # Handle Event Index Write Errors
+    except Exception as e:
+        log_data = {"mqtt_topic": topic, "event_path": event_url, "state": state, "exception_type": type(e).__name__, "details": str(e)}
+        logger.error("%s Event Index Error    | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data))
 
 
 
 ### FUNCTION :: Find Last Created Event ##################################################
 def find_last_created_event_url() -> Optional[str]:
-    """Searches the log file for the last created event URL that has not been deleted."""
+    """Returns the last created event URL that has not been deleted.
+
+    Uses the event index when it is open and falls back to searching the log file.
+    """
+    if event_index is not None:
+        try:
+            return event_index.last_created()
+
+        # Handle Event Index Read Errors
+        except Exception as e:
+            log_data = {"file_path": event_index.db_path, "exception_type": type(e).__name__, "details": str(e)}
+            logger.error("%s Event Index Error    | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data))
+
     log_file_path = os.path.join(LOG_DIR, LOG_FILE_NAME)
-    if not os.path.exists(log_file_path):
-        return None
 
     # Initialize Deleted Event Tracking
     deleted_event_urls = set()
 
-    # Parse Log File to Extract Event States
+    # Scan Log File and Archives Backwards to Match Created and Deleted Events
     try:
-        with open(log_file_path, 'r', encoding='utf-8') as logfile:
-            lines = logfile.readlines()
-
-            # Scan Logs Backwards to Match Created and Deleted Events
-            for line in reversed(lines):
-                if " | " not in line or "event_path='" not in line:
-                    continue
-
-                try:
-                    data_str = line.split(" | ", 1)[1]
-                    path_part = data_str.split("event_path='")[1]
-                    event_url = path_part.split("'")[0]
-                except IndexError:
-                    continue
+        for line in iter_lines_reverse(log_file_path, contains="event_path"):
+            entry = parse_line(line)
+            if entry is None or entry.prefix != LOG_PREFIX_CALDAV:
+                continue
+            event_url = entry.get('event_path')
+            if not event_url:
+                continue
 
-                if f"{LOG_PREFIX_CALDAV} Event Deleted" in line:
-                    deleted_event_urls.add(event_url)
+            if entry.event == "Event Deleted":
+                deleted_event_urls.add(event_url)
 
-                elif f"{LOG_PREFIX_CALDAV} Event Created" in line:
-                    if event_url not in deleted_event_urls:
-                        return event_url
+            elif entry.event == "Event Created":
+                if event_url not in deleted_event_urls:
+                    return event_url
 
     # Handle Log Parsing Errors
     except (IOError, Exception) as e:
         log_data = {"file_path": log_file_path, "exception_type": type(e).__name__, "details": str(e)}
-        logger.error(f"{LOG_PREFIX_APPLICATION} Log Parsing Error    | {format_log_data(log_data)}")
+        logger.error("%s Log Parsing Error    | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data))
         return None
 
     return None
 
 
 
+### FUNCTION :: Publish Offline Status ###################################################
+def publish_offline_status(mqtt_client: MQTTClient, config: Dict[str, Any]) -> None:
+    """Stops the status publisher and publishes a retained offline document on a clean shutdown."""
+    if stats_publisher is None:
+        return
+    stats_publisher.stop()
+    try:
+        mqtt_client.publish(config['MQTT_STATUS_TOPIC'], json.dumps({"state": "offline", "reason": "Shutdown", "timestamp": datetime.now().isoformat(timespec='seconds')}), qos=1, retain=True)
+
+    # Handle Publish Errors, The Broker Publishes the Last Will Instead
+    except Exception as e:
+        log_data_status_err = {"mqtt_topic": config['MQTT_STATUS_TOPIC'], "exception_type": type(e).__name__, "details": str(e)}
+        logger.error("%s Status Publish Error          | %s", LOG_PREFIX_MQTT, format_log_data(log_data_status_err))
+
+
+
 ### FUNCTION :: Connect MQTT Broker ######################################################
 def on_connect(client: MQTTClient, userdata, flags, rc: int, config: Dict[str, Any]) -> None:
     """Callback function for MQTT connection events. Logs the connection status."""
     mqtt_host_info = f"{config['MQTT_SERVER']['MQTT_USERNAME']}@{config['MQTT_SERVER']['MQTT_SERVER_ADDRESS']}:{config['MQTT_SERVER']['MQTT_SERVER_PORT']}"
     log_data = {"mqtt_host": mqtt_host_info}
     if rc == 0:
-        logger.info(f"{LOG_PREFIX_MQTT} Broker Connection Successful  | {format_log_data(log_data)}")
+        logger.info("%s Broker Connection Successful  | %s", LOG_PREFIX_MQTT, format_log_data(log_data))
+
+        # Replace the Last Will With a Current Status Document
+        if stats_publisher is not None:
+            try:
+                stats_publisher.publish_now()
+            except Exception as e:
+                log_data_status_err = {"mqtt_topic": config.get('MQTT_STATUS_TOPIC'), "exception_type": type(e).__name__, "details": str(e)}
+                logger.error("%s Status Publish Error          | %s", LOG_PREFIX_MQTT, format_log_data(log_data_status_err))
 
         # Subscribe To MQTT Topics
         triggers = config.get('TRIGGERS', [])
         unique_topics_subscribed = set()
         if not triggers:
             log_data_no_triggers = {'reason': 'No triggers defined in configuration, MQTT client will listen but perform no actions.'}
-            logger.warn(f"{LOG_PREFIX_MQTT} Config Error       | {format_log_data(log_data_no_triggers)}")
-
-        # Parse and Validate MQTT QoS Level
-        try:
-            mqtt_qos = int(config.get('MQTT_SERVER', {}).get('MQTT_QOS', 1))
-            if mqtt_qos not in [0, 1, 2]:
-                mqtt_qos = 1
-        except (ValueError, TypeError):
-            mqtt_qos = 1
+            logger.warn("%s Config Error       | %s", LOG_PREFIX_MQTT, format_log_data(log_data_no_triggers))
 
         # Subscribe to Configured Trigger Topics
+        mqtt_qos = subscription_qos(config)
         for trigger in triggers:
             try:
                 topic_to_subscribe = trigger['MQTT_TOPIC']
@@ -593,15 +1195,115 @@ def on_connect(client: MQTTClient, userdata, flags, rc: int, config: Dict[str, A
             # Handle Triggers Without An MQTT_TOPIC Key
             except KeyError:
                 log_data_err = {"trigger_details": str(trigger), "reason": "Trigger definition missing 'MQTT_TOPIC' key"}
-                logger.error(f"{LOG_PREFIX_APPLICATION} Invalid Trigger Skipped | {format_log_data(log_data_err)}")
+                logger.error("%s Invalid Trigger Skipped | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data_err))
 
             # Handle Unexpected Errors During Subscription Process
             except Exception as sub_e:
                  log_data_err = {"mqtt_topic": trigger.get('MQTT_TOPIC', 'N/A'), "reason": "Error during MQTT subscription", "exception_type": type(sub_e).__name__, "details": str(sub_e)}
-                 logger.error(f"{LOG_PREFIX_MQTT} Subscription Error | {format_log_data(log_data_err)}")
+                 logger.error("%s Subscription Error | %s", LOG_PREFIX_MQTT, format_log_data(log_data_err))
     else:
         log_data["return_code"] = rc
-        logger.error(f"{LOG_PREFIX_MQTT} Broker Connection Failed      | {format_log_data(log_data)}")
+        logger.error("%s Broker Connection Failed      | %s", LOG_PREFIX_MQTT, format_log_data(log_data))
+
+
+
+### FUNCTION :: Subscription Settings ####################################################
+def subscription_qos(config: Dict[str, Any]) -> int:
+    """Returns the configured MQTT_QOS, or 1 if it is not 0, 1 or 2."""
+    try:
+        mqtt_qos = int(config.get('MQTT_SERVER', {}).get('MQTT_QOS', 1))
+        if mqtt_qos not in [0, 1, 2]:
+            mqtt_qos = 1
+    except (ValueError, TypeError):
+        mqtt_qos = 1
+    return mqtt_qos
+
+
+def trigger_topics(config: Dict[str, Any]) -> Set[str]:
+    """Returns the distinct MQTT topics subscribed for the configured triggers."""
+    return {trigger['MQTT_TOPIC'] for trigger in config.get('TRIGGERS', []) if 'MQTT_TOPIC' in trigger}
+
+
+
+### FUNCTION :: Reload Config ############################################################
+def reload_config(mqtt_client: MQTTClient, reason: str) -> None:
+    """Reloads settings and triggers and swaps them in without reconnecting.
+
+    The running config stays in place when validation fails. Messages being processed
+    and queued CalDAV jobs keep the config they started with, only topics that were
+    added or removed are subscribed or unsubscribed.
+    """
+    global config
+    if SHUTDOWN_REQUESTED:
+        return
+    reload_start = time.monotonic()
+    previous_config = config
+    logger.info("%s Config Reload Initiated       | %s", LOG_PREFIX_APPLICATION, format_log_data({'reason': reason}))
+
+    # Validate the New Files, load_config Exits on Invalid Triggers
+    try:
+        new_config = load_config()
+    except (SystemExit, Exception) as e:
+        log_data_err = {"reason": reason, "details": "Running config kept", "exception_type": type(e).__name__}
+        logger.error("%s Config Reload Failed          | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data_err))
+        count_metric("mqtt2caldav_config_reloads_total", {"result": "failed"})
+        return
+    if previous_config.get('TRIGGERS') and not new_config.get('TRIGGERS'):
+        log_data_err = {"reason": reason, "details": "New config has no triggers, running config kept"}
+        logger.error("%s Config Reload Failed          | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data_err))
+        count_metric("mqtt2caldav_config_reloads_total", {"result": "failed"})
+        return
+    if 'MQTT_STATUS_TOPIC' in previous_config:
+        new_config['MQTT_STATUS_TOPIC'] = previous_config['MQTT_STATUS_TOPIC']
+
+    # Report Changed Settings That Were Only Read at Startup
+    restart_keys = []
+    for section in ('APPLICATION_SETTINGS', 'CALDAV_SERVER', 'MQTT_SERVER'):
+        previous_section, new_section = previous_config.get(section, {}), new_config.get(section, {})
+        restart_keys.extend(f"{section}.{key}" for key in sorted(set(previous_section) | set(new_section))
+                            if key not in RELOADABLE_SETTINGS and previous_section.get(key) != new_section.get(key))
+    if previous_config.get('CALENDAR_LIMITS') != new_config.get('CALENDAR_LIMITS'):
+        restart_keys.append(f"{TRIGGERS_FILE_NAME}.EVENT_RATE_PER_SECOND/EVENT_BURST/EVENT_MAX_IN_FLIGHT")
+    if restart_keys:
+        log_data_warn = {"reason": "Changed settings apply after a restart", "config_keys": ", ".join(restart_keys)}
+        logger.warn("%s Config Reload Incomplete      | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data_warn))
+
+    # Swap the Config, the MQTT Callbacks Read It per Message
+    config = new_config
+    apply_log_settings(new_config)
+    if previous_config.get('LOG_SAMPLER') is not None:
+        log_suppressed_lines(previous_config['LOG_SAMPLER'].flush())
+
+    # Subscribe and Unsubscribe Changed Topics Only
+    previous_topics, new_topics = trigger_topics(previous_config), trigger_topics(new_config)
+    topics_added, topics_removed = sorted(new_topics - previous_topics), sorted(previous_topics - new_topics)
+    if mqtt_client.is_connected():
+        mqtt_qos = subscription_qos(new_config)
+        for topic in topics_removed:
+            result, _ = mqtt_client.unsubscribe(topic)
+            if result == MQTT_ERR_SUCCESS:
+                logger.info(f"{LOG_PREFIX_MQTT} Topic Unsubscribe Successful  | mqtt_topic='{topic}'")
+            else:
+                logger.error("%s Unsubscribe Error             | %s", LOG_PREFIX_MQTT, format_log_data({'mqtt_topic': topic, 'return_code': result}))
+        for topic in topics_added:
+            result, _ = mqtt_client.subscribe(topic, qos=mqtt_qos)
+            if result == MQTT_ERR_SUCCESS:
+                logger.info(f"{LOG_PREFIX_MQTT} Topic Subscription Successful | mqtt_topic='{topic}'")
+            else:
+                logger.error("%s Subscription Error | %s", LOG_PREFIX_MQTT, format_log_data({'mqtt_topic': topic, 'return_code': result}))
+    elif topics_added or topics_removed:
+        log_data_mqtt = {"reason": "Broker not connected, topics are subscribed on reconnect", "topics_added": len(topics_added), "topics_removed": len(topics_removed)}
+        logger.warn("%s Subscription Update Deferred  | %s", LOG_PREFIX_MQTT, format_log_data(log_data_mqtt))
+
+    log_data_reload = {
+        "reason": reason,
+        "trigger_count": len(new_config.get('TRIGGERS', [])),
+        "topics_added": len(topics_added),
+        "topics_removed": len(topics_removed),
+        "duration_ms": round((time.monotonic() - reload_start) * 1000)
+    }
+    logger.info("%s Config Reload Successful      | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data_reload))
+    count_metric("mqtt2caldav_config_reloads_total", {"result": "succeeded"})
 
 
 
@@ -614,31 +1316,65 @@ def on_message(caldav_client: caldav.DAVClient, config: Dict[str, Any], mqtt_cli
         return
 
     # Extract Topic and Decode Payload
+    message_start = time.monotonic()
     topic = mqtt_message.topic
     payload_str = mqtt_message.payload.decode('utf-8')
+    count_metric("mqtt2caldav_messages_received_total", {"topic": topic})
+    if service_stats is not None:
+        service_stats.message_received()
 
     # Verify CalDAV Client is Initialized
     if caldav_client is None:
         log_data = {"mqtt_topic": topic, "reason": "CalDAV client not initialized, cannot process message"}
-        logger.error(f"{LOG_PREFIX_APPLICATION} Processing Error   | {format_log_data(log_data)}")
+        logger.error("%s Processing Error   | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data))
         return
 
+    # Start Message Trace, paho Stamps Messages With time.monotonic() on Receipt
+    trace = tracer.start(topic) if tracer is not None else None
+    if trace is not None:
+        received_at = getattr(mqtt_message, 'timestamp', 0)
+        if received_at:
+            trace.add_span("mqtt_dispatch", max(0.0, (time.monotonic() - received_at) * 1000))
+        tracing.activate(trace)
+
     # Parse and Log Incoming MQTT Event
     try:
         parsed_mqtt_event: Dict[str, Any] = json.loads(payload_str)
         mqtt_action = parsed_mqtt_event.get('action', 'unknown')
-        log_data_received = {'mqtt_topic': topic, **parsed_mqtt_event}
-        logger.info(f"{LOG_PREFIX_APPLICATION} Event Received | {format_log_data(log_data_received)}")
+        tracing.lap("json_parse")
+
+        # Apply Per-Topic Log Sampling
+        log_sampler: Optional[TopicLogSampler] = config.get('LOG_SAMPLER')
+        received_level = log_sampler.level_for(topic, parsed_mqtt_event) if log_sampler is not None else logging.INFO
+        if received_level is not None and logger.is_enabled(received_level):
+            log_data_received = {'mqtt_topic': topic, **parsed_mqtt_event}
+            logger.log(received_level, "%s Event Received | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data_received))
+        if log_sampler is not None:
+            log_suppressed_lines(log_sampler.due_counts())
+
+        # Record Numeric Payload Fields
+        if telemetry_store is not None and isinstance(parsed_mqtt_event, dict):
+            try:
+                telemetry_store.record(topic, parsed_mqtt_event)
 
-        # Scan Configured Triggers for Topic Matches
-        for config_trigger in config.get('TRIGGERS', []):
-            if config_trigger['MQTT_TOPIC'] != topic:
-                continue
+            # Handle Telemetry Write Errors, Message Processing Continues
+            except Exception as e:
+                log_data = {"mqtt_topic": topic, "telemetry_file": TELEMETRY_PATH, "exception_type": type(e).__name__, "details": str(e)}
+                logger.error("%s Telemetry Store Error | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data))
+        tracing.lap("log_received")
+
+        # Look Up Triggers Subscribed to Topic
+        trigger_matched = False
+        for trigger_position, config_trigger in config['TRIGGER_INDEX'].match_positions(topic):
 
             # Match Received Event against Configured Trigger
             if match_mqtt_event(parsed_mqtt_event, config_trigger, mqtt_message):
+                tracing.lap("trigger_match")
                 log_data_matched = {'mqtt_topic': topic, **parsed_mqtt_event}
-                logger.info(f"{LOG_PREFIX_APPLICATION} Event Matched  | {format_log_data(log_data_matched)}")
+                logger.info("%s Event Matched  | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data_matched))
+                if not trigger_matched:
+                    count_metric("mqtt2caldav_messages_matched_total", {"topic": topic})
+                trigger_matched = True
 
                 # Validate Configured Trigger Mode
                 trigger_mode = config_trigger.get('MODE', '').lower()
@@ -647,14 +1383,33 @@ def on_message(caldav_client: caldav.DAVClient, config: Dict[str, Any], mqtt_cli
                         "action": mqtt_action,
                         "reason": "MODE key not allowed or missing"
                     }
-                    logger.error(f"{LOG_PREFIX_APPLICATION} Event Skipped  | {format_log_data({'mqtt_topic': topic, **log_data_payload})}")
+                    logger.error("%s Event Skipped  | %s", LOG_PREFIX_APPLICATION, format_log_data({'mqtt_topic': topic, **log_data_payload}))
+                    count_metric("mqtt2caldav_messages_skipped_total", {"topic": topic, "reason": "invalid_trigger"})
                     continue
 
-                # Process Event Creation Trigger
-                if trigger_mode == "create":
+                # Coalesce Repeats Within the Debounce Window
+                config_trigger_key = trigger_key(trigger_position, config_trigger)
+                debounce_seconds = config.get('DEBOUNCE_WINDOWS', {}).get(config_trigger_key, 0)
+                suppressed_count = event_debouncer.admit((topic, config_trigger_key), debounce_seconds)
+                if suppressed_count:
+                    log_data_payload = {
+                        "action": mqtt_action,
+                        "event_mode": trigger_mode,
+                        "debounce_seconds": debounce_seconds,
+                        "suppressed_in_window": suppressed_count
+                    }
+                    logger.info("%s Event Debounced | %s", LOG_PREFIX_APPLICATION, format_log_data({'mqtt_topic': topic, **log_data_payload}))
+                    count_metric("mqtt2caldav_messages_skipped_total", {"topic": topic, "reason": "debounced"})
+                    break
+
+                # Process Event Creation and Extension Trigger
+                if trigger_mode in ("create", "extend"):
                     event_details = None
                     try:
-                        event_details = create_event_details(config_trigger, mqtt_action)
+                        event_details = create_event_details(config_trigger, mqtt_action, config.get('ICAL_TEMPLATES', {}).get(config_trigger_key),
+                                                             config.get('CALDAV_SERVER', {}).get('CALDAV_DIRECT_PUT', 'False'))
+                        if trigger_mode == "extend":
+                            event_details['event_extend_key'] = f"{topic}|{config_trigger['EVENT_CALENDAR']}|{config_trigger['EVENT_SUMMARY']}"
 
                         # Log Actioned Event Details
                         if "action" in parsed_mqtt_event:
@@ -666,9 +1421,10 @@ def on_message(caldav_client: caldav.DAVClient, config: Dict[str, Any], mqtt_cli
                                 "event_location": event_location,
                                 "event_duration": config_trigger.get('EVENT_DURATION', '')
                             }
-                            logger.info(f"{LOG_PREFIX_APPLICATION} Event Actioned | {format_log_data({'mqtt_topic': topic, **log_data_payload})}")
+                            logger.info("%s Event Actioned | %s", LOG_PREFIX_APPLICATION, format_log_data({'mqtt_topic': topic, **log_data_payload}))
+                        tracing.lap("event_details")
 
-                        threading.Thread(target=create_caldav_event, args=(caldav_client, event_details, topic, config), daemon=True).start()
+                        submit_caldav_job(trigger_mode, topic, mqtt_action, event_details, config, trace=trace)
                         break
 
                     # Handle Invalid Configuration Value
@@ -677,7 +1433,8 @@ def on_message(caldav_client: caldav.DAVClient, config: Dict[str, Any], mqtt_cli
                             "action": mqtt_action,
                             "reason": "Invalid EVENT_OFFSET value configured"
                         }
-                        logger.error(f"{LOG_PREFIX_APPLICATION} Event Skipped  | {format_log_data({'mqtt_topic': topic, **log_data_payload})}")
+                        logger.error("%s Event Skipped  | %s", LOG_PREFIX_APPLICATION, format_log_data({'mqtt_topic': topic, **log_data_payload}))
+                        count_metric("mqtt2caldav_messages_skipped_total", {"topic": topic, "reason": "invalid_trigger"})
                         break
 
                     # Handle Missing Configuration Value
@@ -687,13 +1444,14 @@ def on_message(caldav_client: caldav.DAVClient, config: Dict[str, Any], mqtt_cli
                             "reason": "Config Error in trigger - Missing key",
                             "key": str(e)
                         }
-                        logger.error(f"{LOG_PREFIX_APPLICATION} Event Skipped  | {format_log_data({'mqtt_topic': topic, **log_data_payload})}")
+                        logger.error("%s Event Skipped  | %s", LOG_PREFIX_APPLICATION, format_log_data({'mqtt_topic': topic, **log_data_payload}))
+                        count_metric("mqtt2caldav_messages_skipped_total", {"topic": topic, "reason": "invalid_trigger"})
                         break
 
                     # Handle Unexpected Errors
                     except Exception as event_creation_error:
                         log_data_payload = {"reason": "Unexpected Error during creation handling", "exception_type": type(event_creation_error).__name__, "details": str(event_creation_error)}
-                        logger.error(f"{LOG_PREFIX_APPLICATION} Event Create Error | {format_log_data({'mqtt_topic': topic, **log_data_payload})}")
+                        logger.error("%s Event Create Error | %s", LOG_PREFIX_APPLICATION, format_log_data({'mqtt_topic': topic, **log_data_payload}))
                         break
 
                 # Process Event Deletion Trigger
@@ -702,40 +1460,65 @@ def on_message(caldav_client: caldav.DAVClient, config: Dict[str, Any], mqtt_cli
                         "action": mqtt_action,
                         "event_mode": trigger_mode
                     }
-                    logger.info(f"{LOG_PREFIX_APPLICATION} Event Actioned | {format_log_data({'mqtt_topic': topic, **log_data_action_payload})}")
+                    logger.info("%s Event Actioned | %s", LOG_PREFIX_APPLICATION, format_log_data({'mqtt_topic': topic, **log_data_action_payload}))
 
                     # Locate and Queue Event Deletion
                     try:
                         event_url_to_delete = find_last_created_event_url()
+                        tracing.lap("find_event")
                         if event_url_to_delete:
-                            threading.Thread(target=delete_caldav_event, args=(caldav_client, event_url_to_delete, topic, config, mqtt_action), daemon=True).start()
+                            submit_caldav_job(trigger_mode, topic, mqtt_action, {"event_url": event_url_to_delete}, config, trace=trace)
                         else:
                             log_data_skip_payload = {
                                 "action": mqtt_action,
                                 "reason": "No event to delete found in logs"
                             }
-                            logger.warn(f"{LOG_PREFIX_APPLICATION} Event Skipped  | {format_log_data({'mqtt_topic': topic, **log_data_skip_payload})}")
+                            logger.warn("%s Event Skipped  | %s", LOG_PREFIX_APPLICATION, format_log_data({'mqtt_topic': topic, **log_data_skip_payload}))
+                            count_metric("mqtt2caldav_messages_skipped_total", {"topic": topic, "reason": "nothing_to_delete"})
 
                     # Handle Unexpected Deletion Errors
                     except Exception as event_deletion_error:
                         log_data_payload = {"reason": "Unexpected Error during deletion handling", "exception_type": type(event_deletion_error).__name__, "details": str(event_deletion_error)}
-                        logger.error(f"{LOG_PREFIX_APPLICATION} Event Delete Error | {format_log_data({'mqtt_topic': topic, **log_data_payload})}")
+                        logger.error("%s Event Delete Error | %s", LOG_PREFIX_APPLICATION, format_log_data({'mqtt_topic': topic, **log_data_payload}))
                     break
 
+        # Count Messages No Trigger Matched
+        if not trigger_matched:
+            count_metric("mqtt2caldav_messages_skipped_total", {"topic": topic, "reason": "unmatched"})
+
     # Handle MQTT Payload Decoding Errors
     except json.JSONDecodeError as json_decode_error:
         log_data = {"mqtt_topic": topic, "payload": payload_str, "exception_type": type(json_decode_error).__name__, "details": str(json_decode_error)}
-        logger.error(f"{LOG_PREFIX_APPLICATION} Invalid JSON Received         | {format_log_data(log_data)}")
+        logger.error("%s Invalid JSON Received         | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data))
+        count_metric("mqtt2caldav_messages_invalid_json_total", {"topic": topic})
 
     # Handle Missing MQTT Key Errors
     except KeyError as e:
         log_data = {"mqtt_topic": topic, "reason": "Config Error - Missing key in trigger or MQTT event", "key": str(e)}
-        logger.error(f"{LOG_PREFIX_APPLICATION} Processing Error   | {format_log_data(log_data)}")
+        logger.error("%s Processing Error   | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data))
 
     # Handle Unexpected Errors
     except Exception as generic_message_error:
         log_data = {"mqtt_topic": topic, "reason": "Unexpected Error", "exception_type": type(generic_message_error).__name__, "details": str(generic_message_error)}
-        logger.error(f"{LOG_PREFIX_APPLICATION} Processing Error   | {format_log_data(log_data)}")
+        logger.error("%s Processing Error   | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data))
+
+    if metrics is not None:
+        metrics.observe("mqtt2caldav_message_processing_seconds", time.monotonic() - message_start)
+
+    # Write Trace of Messages That Queued No CalDAV Job
+    if trace is not None:
+        if not trace.handed_off:
+            tracer.finish(trace, "no_job")
+        tracing.activate(None)
+
+
+
+### FUNCTION :: Log Suppressed Lines #####################################################
+def log_suppressed_lines(suppressed_counts: List[Tuple[str, int]]) -> None:
+    """Writes one line per topic whose 'Event Received' lines were suppressed by log sampling."""
+    for suppressed_topic, suppressed_count in suppressed_counts:
+        log_data_suppressed = {"mqtt_topic": suppressed_topic, "suppressed_lines": suppressed_count}
+        logger.info("%s Log Lines Suppressed          | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data_suppressed))
 
 
 
@@ -756,7 +1539,7 @@ def validate_mode(trigger: Dict[str, Any], message: MQTTMessage) -> bool:
          return False
 
     # Verify Trigger Mode is Allowed
-    allowed_modes = ["create", "delete"]
+    allowed_modes = ["create", "delete", "extend"]
     if trigger.get('MODE', '').lower() not in allowed_modes:
        return False
     return True
@@ -791,8 +1574,11 @@ def adjust_event_time(now_datetime: datetime, offset: str) -> datetime:
 
 
 ### FUNCTION :: Collect Event Details ####################################################
-def create_event_details(config_trigger: Dict[str, Any], mqtt_action: str) -> Optional[Dict[str, Any]]:
-    """Creates a dictionary containing event details based on the trigger and MQTT event."""
+def create_event_details(config_trigger: Dict[str, Any], mqtt_action: str, ical_template=None, default_direct_put: str = 'False') -> Optional[Dict[str, Any]]:
+    """Creates a dictionary containing event details based on the trigger and MQTT event.
+
+    With a precompiled trigger template the iCalendar payload is rendered here as well.
+    """
     now_datetime: datetime = datetime.now()
     try:
         event_offset = config_trigger.get('EVENT_OFFSET')
@@ -860,6 +1646,15 @@ def create_event_details(config_trigger: Dict[str, Any], mqtt_action: str) -> Op
             'event_categories': config_trigger['EVENT_CATEGORIES'],
             'event_trigger': config_trigger['EVENT_TRIGGER']
         }
+
+        # Select CalDAV Write Path
+        event_direct_put = config_trigger.get('EVENT_DIRECT_PUT', default_direct_put)
+        event_details['event_direct_put'] = str(event_direct_put).lower() == 'true'
+
+        # Render Precompiled iCal Payload
+        if ical_template is not None:
+            event_details['event_uid'] = str(uuid.uuid4())
+            event_details['event_ical'] = ical_template.render(start_time, end_time, event_details['event_uid'])
         return event_details
 
     # Handle Trigger Non-Integer Value
@@ -883,13 +1678,49 @@ if __name__ == '__main__':
         "app_version": VERSION,
         "app_pid": _app_pid_init
     }
-    logger.info(f"[SYS] Application Start Initiated   | {format_log_data(_log_data_app_start)}")
+    logger.info("[SYS] Application Start Initiated   | %s", format_log_data(_log_data_app_start))
 
     # Load Application Configuration
     config = load_config()
+    apply_log_settings(config)
     app_path = os.path.abspath(__file__)
     log_data_start = {"app_main_file": app_path, "app_name": APP_NAME, "app_version": VERSION}
-    logger.info(f"{LOG_PREFIX_SYSTEM} Application Load Successful   | {format_log_data(log_data_start)}")
+    logger.info("%s Application Load Successful   | %s", LOG_PREFIX_SYSTEM, format_log_data(log_data_start))
+
+    # Apply Log Rotation Limits
+    log_rotation = {}
+    for config_key, default_value in (('LOG_ROTATE_MAX_MB', 10), ('LOG_ROTATE_MAX_AGE_HOURS', 168), ('LOG_ROTATE_BACKUP_COUNT', 10)):
+        try:
+            log_rotation[config_key] = float(config.get('APPLICATION_SETTINGS', {}).get(config_key, default_value))
+            if log_rotation[config_key] < 0: raise ValueError("negative value")
+        except (ValueError, TypeError):
+            config_value = config.get('APPLICATION_SETTINGS', {}).get(config_key, 'Not Found')
+            log_data_warn = {"reason": "Invalid config value type", "config_key": config_key, "value": config_value}
+            logger.warn("%s Invalid or missing %s, using default: %s | %s", LOG_PREFIX_APPLICATION, config_key, default_value, format_log_data(log_data_warn))
+            log_rotation[config_key] = default_value
+    logger.set_log_rotation(int(log_rotation['LOG_ROTATE_MAX_MB'] * 1024 * 1024), log_rotation['LOG_ROTATE_MAX_AGE_HOURS'] * 3600,
+                            int(log_rotation['LOG_ROTATE_BACKUP_COUNT']))
+
+    # Apply Log File Format
+    log_format = str(config.get('APPLICATION_SETTINGS', {}).get('LOG_FORMAT', 'text')).lower()
+    if log_format not in logger.LOG_FORMATS:
+        log_data_warn = {"reason": "Invalid config value", "config_key": "LOG_FORMAT", "value": log_format, "allowed_values": ", ".join(logger.LOG_FORMATS)}
+        logger.warn("%s Invalid or missing LOG_FORMAT, using default: text | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data_warn))
+        log_format = 'text'
+    logger.set_log_format(log_format)
+
+    # Move Log Handlers Off the Calling Threads
+    if str(config.get('APPLICATION_SETTINGS', {}).get('LOG_ASYNC', 'True')).lower() == 'true':
+        try:
+            log_queue_size = int(config.get('APPLICATION_SETTINGS', {}).get('LOG_QUEUE_SIZE', 10000))
+            if log_queue_size <= 0: log_queue_size = 10000
+        except (ValueError, TypeError):
+            config_value = config.get('APPLICATION_SETTINGS', {}).get('LOG_QUEUE_SIZE', 'Not Found')
+            log_data_warn = {"reason": "Invalid config value type", "config_key": "LOG_QUEUE_SIZE", "value": config_value}
+            logger.warn("%s Invalid or missing LOG_QUEUE_SIZE, using default: 10000 | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data_warn))
+            log_queue_size = 10000
+        logger.start_async_logging(queue_size=log_queue_size)
+        logger.debug("%s Async Logging Started         | %s", LOG_PREFIX_SYSTEM, format_log_data({"log_queue_size": log_queue_size}))
 
     # Check Lock File
     try:
@@ -897,7 +1728,7 @@ if __name__ == '__main__':
         with os.fdopen(fd, 'w', encoding='utf-8') as f:
             f.write(str(os.getpid()))
         log_data_lock = {"app_lock_file": LOCK_FILE_PATH, "app_pid": os.getpid()}
-        logger.info(f"{LOG_PREFIX_SYSTEM} Application Lock File Created | {format_log_data(log_data_lock)}")
+        logger.info("%s Application Lock File Created | %s", LOG_PREFIX_SYSTEM, format_log_data(log_data_lock))
 
     # Handle Existing Lock File
     except FileExistsError:
@@ -933,25 +1764,25 @@ if __name__ == '__main__':
                 # Force Stale Lock Cleanup for Recycled PID
                 if is_recycled:
                     log_data_stale = {"app_lock_file": LOCK_FILE_PATH, "app_pid": pid, "reason": "PID exists but belongs to a different process, assuming stale lock"}
-                    logger.warn(f"{LOG_PREFIX_SYSTEM} Stale Lock File Detected      | {format_log_data(log_data_stale)}")
+                    logger.warn("%s Stale Lock File Detected      | %s", LOG_PREFIX_SYSTEM, format_log_data(log_data_stale))
                     raise OSError(errno.ESRCH, "Process is recycled")
 
                 # Abort Startup as Application is Already Running
                 log_data_lock = {"app_lock_file": LOCK_FILE_PATH, "app_pid": pid}
-                logger.error(f"{LOG_PREFIX_SYSTEM} Application Lock File Exists  | {format_log_data(log_data_lock)}")
-                logger.critical(f"{LOG_PREFIX_SYSTEM} Application Already Running?  | {format_log_data(log_data_lock)}")
+                logger.error("%s Application Lock File Exists  | %s", LOG_PREFIX_SYSTEM, format_log_data(log_data_lock))
+                logger.critical("%s Application Already Running?  | %s", LOG_PREFIX_SYSTEM, format_log_data(log_data_lock))
                 sys.exit(1)
 
             # Handle Lock File Errors For Non-existent Process
             except OSError as e:
                 if e.errno == errno.ESRCH:
                     log_data_stale = {"app_lock_file": LOCK_FILE_PATH, "app_pid": pid, "reason": "PID not found, assuming stale lock file"}
-                    logger.warn(f"{LOG_PREFIX_SYSTEM} Stale Lock File Detected      | {format_log_data(log_data_stale)}")
+                    logger.warn("%s Stale Lock File Detected      | %s", LOG_PREFIX_SYSTEM, format_log_data(log_data_stale))
                     try:
                         try:
                             os.remove(LOCK_FILE_PATH)
                             log_data_removed = {"app_lock_file": LOCK_FILE_PATH}
-                            logger.info(f"{LOG_PREFIX_SYSTEM} Stale Lock File Removed       | {format_log_data(log_data_removed)}")
+                            logger.info("%s Stale Lock File Removed       | %s", LOG_PREFIX_SYSTEM, format_log_data(log_data_removed))
                         except FileNotFoundError:
                             pass
                         
@@ -960,38 +1791,38 @@ if __name__ == '__main__':
                             with os.fdopen(fd, 'w', encoding='utf-8') as f:
                                 f.write(str(os.getpid()))
                             log_data_lock = {"app_lock_file": LOCK_FILE_PATH, "app_pid": os.getpid()}
-                            logger.info(f"{LOG_PREFIX_SYSTEM} Application Lock File Created | {format_log_data(log_data_lock)}")
+                            logger.info("%s Application Lock File Created | %s", LOG_PREFIX_SYSTEM, format_log_data(log_data_lock))
 
                         # Handle Lock File Re-creation Errors
                         except Exception as create_e:
                             log_data_lock_err = {"app_lock_file": LOCK_FILE_PATH, "reason": "Failed to create lock file after removing stale", "exception_type": type(create_e).__name__, "details": str(create_e)}
-                            logger.critical(f"{LOG_PREFIX_SYSTEM} Application Lock File Error   | {format_log_data(log_data_lock_err)}")
+                            logger.critical("%s Application Lock File Error   | %s", LOG_PREFIX_SYSTEM, format_log_data(log_data_lock_err))
                             sys.exit(1)
 
                     # Handle Stale Lock File Errors
                     except OSError as remove_e:
                         log_data_remove_err = {"app_lock_file": LOCK_FILE_PATH, "reason": "Failed to remove lock file on MQTT connection exit", "exception_type": type(remove_e).__name__, "details": str(remove_e)}
-                        logger.error(f"{LOG_PREFIX_SYSTEM} Application Lock File Error   | {format_log_data(remove_e)}")
+                        logger.error("%s Application Lock File Error   | %s", LOG_PREFIX_SYSTEM, format_log_data(remove_e))
                         sys.exit(1)
                 elif e.errno == errno.EPERM:
                     log_data_perm = {"app_lock_file": LOCK_FILE_PATH, "app_pid": pid, "reason": "Permission error checking PID, assuming process is running"}
-                    logger.error(f"{LOG_PREFIX_SYSTEM} Application Lock File Exists  | {format_log_data(log_data_perm)}")
-                    logger.critical(f"{LOG_PREFIX_SYSTEM} Application Already Running?  | {format_log_data(log_data_perm)}")
+                    logger.error("%s Application Lock File Exists  | %s", LOG_PREFIX_SYSTEM, format_log_data(log_data_perm))
+                    logger.critical("%s Application Already Running?  | %s", LOG_PREFIX_SYSTEM, format_log_data(log_data_perm))
                     sys.exit(1)
                 else:
                     log_data_oserr = {"app_lock_file": LOCK_FILE_PATH, "app_pid": pid, "reason": "OS error checking PID", "exception_type": type(e).__name__, "details": str(e)}
-                    logger.error(f"{LOG_PREFIX_SYSTEM} Lock File Check Error       | {format_log_data(log_data_oserr)}")
+                    logger.error("%s Lock File Check Error       | %s", LOG_PREFIX_SYSTEM, format_log_data(log_data_oserr))
                     sys.exit(1)
 
         # Handle Lock File Content Errors
         except (ValueError, FileNotFoundError, IOError) as e:
             log_data_invalid = {"app_lock_file": LOCK_FILE_PATH, "pid_read": pid, "reason": "Invalid or unreadable lock file content, assuming stale", "exception_type": type(e).__name__, "details": str(e)}
-            logger.warn(f"{LOG_PREFIX_SYSTEM} Invalid Lock File Detected    | {format_log_data(log_data_invalid)}")
+            logger.warn("%s Invalid Lock File Detected    | %s", LOG_PREFIX_SYSTEM, format_log_data(log_data_invalid))
             try:
                 try:
                     os.remove(LOCK_FILE_PATH)
                     log_data_removed = {"app_lock_file": LOCK_FILE_PATH}
-                    logger.info(f"{LOG_PREFIX_SYSTEM} Invalid Lock File Removed     | {format_log_data(log_data_removed)}")
+                    logger.info("%s Invalid Lock File Removed     | %s", LOG_PREFIX_SYSTEM, format_log_data(log_data_removed))
                 except FileNotFoundError:
                     pass
 
@@ -1000,22 +1831,22 @@ if __name__ == '__main__':
                     with os.fdopen(fd, 'w', encoding='utf-8') as f:
                         f.write(str(os.getpid()))
                     log_data_lock = {"app_lock_file": LOCK_FILE_PATH, "app_pid": os.getpid()}
-                    logger.info(f"{LOG_PREFIX_SYSTEM} Application Lock File Created | {format_log_data(log_data_lock)}")
+                    logger.info("%s Application Lock File Created | %s", LOG_PREFIX_SYSTEM, format_log_data(log_data_lock))
                 except Exception as create_e:
                     log_data_lock_err = {"app_lock_file": LOCK_FILE_PATH, "reason": "Failed to create lock file after removing invalid", "exception_type": type(create_e).__name__, "details": str(create_e)}
-                    logger.critical(f"{LOG_PREFIX_SYSTEM} Application Lock File Error   | {format_log_data(log_data_lock_err)}")
+                    logger.critical("%s Application Lock File Error   | %s", LOG_PREFIX_SYSTEM, format_log_data(log_data_lock_err))
                     sys.exit(1)
 
             # Handle Invalid Lock File Errors
             except OSError as remove_e:
                 log_data_remove_err = {"app_lock_file": LOCK_FILE_PATH, "reason": "Failed to remove invalid lock file", "exception_type": type(remove_e).__name__, "details": str(remove_e)}
-                logger.error(f"{LOG_PREFIX_SYSTEM} Application Lock File Error   | {format_log_data(remove_e)}")
+                logger.error("%s Application Lock File Error   | %s", LOG_PREFIX_SYSTEM, format_log_data(remove_e))
                 sys.exit(1)
 
     # Handle Unexpected Lock File Creation Errors
     except Exception as e:
         log_data_lock_err = {"app_lock_file": LOCK_FILE_PATH, "reason": "Failed to create lock file", "exception_type": type(e).__name__, "details": str(e)}
-        logger.critical(f"{LOG_PREFIX_SYSTEM} Application Lock File Error   | {format_log_data(log_data_lock_err)}")
+        logger.critical("%s Application Lock File Error   | %s", LOG_PREFIX_SYSTEM, format_log_data(log_data_lock_err))
         sys.exit(1)
 
     # Get Essential Configuration Settings
@@ -1032,29 +1863,100 @@ if __name__ == '__main__':
     # Handle Essential Key Configuration Errors
     except KeyError as e:
         log_data_key_error = {"reason": "Missing essential configuration key in settings.json", "key": str(e)}
-        logger.critical(f"{LOG_PREFIX_APPLICATION} Config Error       | {format_log_data(log_data_key_error)}")
+        logger.critical("%s Config Error       | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data_key_error))
         try:
             os.remove(LOCK_FILE_PATH)
         except FileNotFoundError:
             pass
         except Exception as lock_e:
              log_data_lock_rem_err = {"app_lock_file": LOCK_FILE_PATH, "reason": "Failed to remove lock file on config error exit", "exception_type": type(lock_e).__name__, "details": str(lock_e)}
-             logger.error(f"{LOG_PREFIX_SYSTEM} Application Lock File Error   | {format_log_data(log_data_lock_rem_err)}")
+             logger.error("%s Application Lock File Error   | %s", LOG_PREFIX_SYSTEM, format_log_data(log_data_lock_rem_err))
         sys.exit(1)
 
     # Handle Unexpected Configuration Access Errors
     except Exception as e:
         log_data_other_error = {"reason": "Unexpected error accessing configuration", "exception_type": type(e).__name__, "details": str(e)}
-        logger.critical(f"{LOG_PREFIX_APPLICATION} Config Error       | {format_log_data(log_data_other_error)}")
+        logger.critical("%s Config Error       | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data_other_error))
         try:
             os.remove(LOCK_FILE_PATH)
         except FileNotFoundError:
             pass
         except Exception as lock_e:
              log_data_lock_rem_err = {"app_lock_file": LOCK_FILE_PATH, "reason": "Failed to remove lock file on config error exit", "exception_type": type(lock_e).__name__, "details": str(lock_e)}
-             logger.error(f"{LOG_PREFIX_SYSTEM} Application Lock File Error   | {format_log_data(log_data_lock_rem_err)}")
+             logger.error("%s Application Lock File Error   | %s", LOG_PREFIX_SYSTEM, format_log_data(log_data_lock_rem_err))
         sys.exit(1)
 
+    # Open Event Index and Import Existing Log Entries
+    try:
+        event_index = EventIndex(EVENT_INDEX_PATH)
+        imported_lines = event_index.import_log(os.path.join(LOG_DIR, LOG_FILE_NAME), f"{LOG_PREFIX_CALDAV} Event Created", f"{LOG_PREFIX_CALDAV} Event Deleted")
+        log_data_index = {"event_index_file": EVENT_INDEX_PATH, "imported_log_lines": imported_lines}
+        logger.info("%s Event Index Load Successful   | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data_index))
+
+    # Handle Event Index Errors by Falling Back to Log Scanning
+    except Exception as e:
+        event_index = None
+        log_data_index_err = {"event_index_file": EVENT_INDEX_PATH, "reason": "Falling back to log file scanning", "exception_type": type(e).__name__, "details": str(e)}
+        logger.warn("%s Event Index Load Failed       | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data_index_err))
+
+    # Open Telemetry Store
+    if str(config.get('APPLICATION_SETTINGS', {}).get('TELEMETRY_STORE', 'False')).lower() == 'true':
+        telemetry_settings = {}
+        for config_key, default_value in (('TELEMETRY_MAX_READINGS', 1000), ('TELEMETRY_RETENTION_DAYS', 90)):
+            try:
+                telemetry_settings[config_key] = float(config.get('APPLICATION_SETTINGS', {}).get(config_key, default_value))
+                if telemetry_settings[config_key] <= 0: raise ValueError("not positive")
+            except (ValueError, TypeError):
+                config_value = config.get('APPLICATION_SETTINGS', {}).get(config_key, 'Not Found')
+                log_data_warn = {"reason": "Invalid config value type", "config_key": config_key, "value": config_value}
+                logger.warn("%s Invalid or missing %s, using default: %s | %s", LOG_PREFIX_APPLICATION, config_key, default_value, format_log_data(log_data_warn))
+                telemetry_settings[config_key] = default_value
+        telemetry_fields = config.get('APPLICATION_SETTINGS', {}).get('TELEMETRY_FIELDS', list(TELEMETRY_DEFAULT_FIELDS))
+        if not isinstance(telemetry_fields, list) or not all(isinstance(field, str) for field in telemetry_fields):
+            log_data_warn = {"reason": "Invalid config value type", "config_key": "TELEMETRY_FIELDS", "value": telemetry_fields}
+            logger.warn("%s Invalid or missing TELEMETRY_FIELDS, using default: %s | %s", LOG_PREFIX_APPLICATION, ', '.join(TELEMETRY_DEFAULT_FIELDS), format_log_data(log_data_warn))
+            telemetry_fields = list(TELEMETRY_DEFAULT_FIELDS)
+        try:
+            telemetry_store = TelemetryStore(TELEMETRY_PATH, telemetry_fields, int(telemetry_settings['TELEMETRY_MAX_READINGS']),
+                                             telemetry_settings['TELEMETRY_RETENTION_DAYS'], log_prefix=LOG_PREFIX_APPLICATION)
+            log_data_telemetry = {"telemetry_file": TELEMETRY_PATH, "telemetry_fields": ", ".join(telemetry_fields), **telemetry_settings}
+            logger.info("%s Telemetry Store Load Successful | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data_telemetry))
+
+        # Handle Telemetry Store Errors, Telemetry Is Not Recorded
+        except Exception as e:
+            telemetry_store = None
+            log_data_telemetry_err = {"telemetry_file": TELEMETRY_PATH, "reason": "Telemetry not recorded", "exception_type": type(e).__name__, "details": str(e)}
+            logger.warn("%s Telemetry Store Load Failed   | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data_telemetry_err))
+
+    # Start Message Tracing
+    try:
+        trace_sample_rate = float(config.get('APPLICATION_SETTINGS', {}).get('TRACE_SAMPLE_RATE', 0))
+        if not 0 <= trace_sample_rate <= 1: raise ValueError("not between 0 and 1")
+    except (ValueError, TypeError):
+        config_value = config.get('APPLICATION_SETTINGS', {}).get('TRACE_SAMPLE_RATE', 'Not Found')
+        log_data_warn = {"reason": "Invalid config value type", "config_key": "TRACE_SAMPLE_RATE", "value": config_value}
+        logger.warn("%s Invalid or missing TRACE_SAMPLE_RATE, using default: 0 | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data_warn))
+        trace_sample_rate = 0.0
+    if trace_sample_rate > 0:
+        try:
+            trace_max_mb = float(config.get('APPLICATION_SETTINGS', {}).get('TRACE_ROTATE_MAX_MB', 5))
+            if trace_max_mb <= 0: raise ValueError("not positive")
+        except (ValueError, TypeError):
+            config_value = config.get('APPLICATION_SETTINGS', {}).get('TRACE_ROTATE_MAX_MB', 'Not Found')
+            log_data_warn = {"reason": "Invalid config value type", "config_key": "TRACE_ROTATE_MAX_MB", "value": config_value}
+            logger.warn("%s Invalid or missing TRACE_ROTATE_MAX_MB, using default: 5 | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data_warn))
+            trace_max_mb = 5.0
+        try:
+            tracer = Tracer(TRACE_PATH, trace_sample_rate, int(trace_max_mb * 1024 * 1024))
+            log_data_trace = {"trace_file": TRACE_PATH, "sample_rate": trace_sample_rate, "trace_rotate_max_mb": trace_max_mb}
+            logger.info("%s Message Tracing Enabled       | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data_trace))
+
+        # Handle Trace File Errors, Messages Are Not Traced
+        except Exception as e:
+            tracer = None
+            log_data_trace_err = {"trace_file": TRACE_PATH, "reason": "Messages not traced", "exception_type": type(e).__name__, "details": str(e)}
+            logger.warn("%s Message Tracing Failed        | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data_trace_err))
+
     # Establish CalDAV Connection
     try:
         max_caldav_attempts = int(config.get('CALDAV_SERVER', {}).get('CALDAV_SERVER_RETRY_ATTEMPTS', 3))
@@ -1064,7 +1966,7 @@ if __name__ == '__main__':
     except (ValueError, TypeError):
         config_value = config.get('CALDAV_SERVER', {}).get('CALDAV_SERVER_RETRY_ATTEMPTS', 'Not Found')
         log_data_warn = {"reason": "Invalid config value type", "config_key": "CALDAV_SERVER_RETRY_ATTEMPTS", "value": config_value}
-        logger.warn(f"{LOG_PREFIX_APPLICATION} Config Error       | {format_log_data(log_data_warn)}")
+        logger.warn("%s Config Error       | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data_warn))
         max_caldav_attempts = 3
 
     # Parse and Validate CalDAV Retry Delay Seconds
@@ -1076,10 +1978,10 @@ if __name__ == '__main__':
     except (ValueError, TypeError):
         config_value = config.get('CALDAV_SERVER', {}).get('CALDAV_SERVER_RETRY_DELAY_SECONDS', 'Not Found')
         log_data_warn = {"reason": "Invalid config value type", "config_key": "CALDAV_SERVER_RETRY_DELAY_SECONDS", "value": config_value}
-        logger.warn(f"{LOG_PREFIX_APPLICATION} Invalid or missing CALDAV_SERVER_RETRY_DELAY_SECONDS, using default: 10 | {format_log_data(log_data_warn)}")
+        logger.warn("%s Invalid or missing CALDAV_SERVER_RETRY_DELAY_SECONDS, using default: 10 | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data_warn))
         caldav_retry_delay = 10
 
-    # Enforce Global HTTP Request Timeout
+    # Read CalDAV HTTP Request Timeout
     try:
         caldav_timeout = int(config.get('CALDAV_SERVER', {}).get('CALDAV_SERVER_TIMEOUT_SECONDS', 30))
         if caldav_timeout <= 0: caldav_timeout = 30
@@ -1088,30 +1990,23 @@ if __name__ == '__main__':
     except (ValueError, TypeError):
         config_value = config.get('CALDAV_SERVER', {}).get('CALDAV_SERVER_TIMEOUT_SECONDS', 'Not Found')
         log_data_warn = {"reason": "Invalid config value type", "config_key": "CALDAV_SERVER_TIMEOUT_SECONDS", "value": config_value}
-        logger.warn(f"{LOG_PREFIX_APPLICATION} Invalid or missing CALDAV_SERVER_TIMEOUT_SECONDS, using default: 30 | {format_log_data(log_data_warn)}")
+        logger.warn("%s Invalid or missing CALDAV_SERVER_TIMEOUT_SECONDS, using default: 30 | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data_warn))
         caldav_timeout = 30
 
-    # Apply Global HTTP Timeout Patch
-    _original_session_request = requests.Session.request
-    def patched_session_request(self, method, url, *args, **kwargs):
-        kwargs.setdefault('timeout', caldav_timeout)
-        return _original_session_request(self, method, url, *args, **kwargs)
-    requests.Session.request = patched_session_request
-
     # Connect to CalDAV Server with Retries
     for attempt in range(max_caldav_attempts):
         caldav_host_info = f"{CALDAV_USERNAME}@{CALDAV_SERVER_ADDRESS}"
         log_data_conn_init = {"caldav_host": caldav_host_info, "attempt": attempt + 1, "max_attempts": max_caldav_attempts}
-        logger.info(f"{LOG_PREFIX_CALDAV} Server Connection Initiated   | {format_log_data(log_data_conn_init)}")
+        logger.info("%s Server Connection Initiated   | %s", LOG_PREFIX_CALDAV, format_log_data(log_data_conn_init))
 
         # Execute Connection and Handle Retry Delay
-        caldav_client = connect_caldav(CALDAV_SERVER_ADDRESS, CALDAV_USERNAME, CALDAV_PASSWORD)
+        caldav_client = connect_caldav(CALDAV_SERVER_ADDRESS, CALDAV_USERNAME, CALDAV_PASSWORD, caldav_timeout)
         if caldav_client is not None:
             break
         else:
             if attempt < max_caldav_attempts - 1:
                 log_data_retry = {"caldav_host": caldav_host_info, "attempt": attempt + 1, "max_attempts": max_caldav_attempts, "delay_seconds": caldav_retry_delay}
-                logger.warn(f"{LOG_PREFIX_CALDAV} Server Connection Retry...    | {format_log_data(log_data_retry)}")
+                logger.warn("%s Server Connection Retry...    | %s", LOG_PREFIX_CALDAV, format_log_data(log_data_retry))
                 time.sleep(caldav_retry_delay)
             else:
                 pass
@@ -1119,7 +2014,7 @@ if __name__ == '__main__':
     # Abort Startup as CalDAV Connection Failed
     if caldav_client is None:
         log_data_exit = {"reason": f"Initial CalDAV connection failed after {max_caldav_attempts} attempts. Cannot proceed."}
-        logger.critical(f"{LOG_PREFIX_SYSTEM} Application Exit              | {format_log_data(log_data_exit)}")
+        logger.critical("%s Application Exit              | %s", LOG_PREFIX_SYSTEM, format_log_data(log_data_exit))
         try:
             os.remove(LOCK_FILE_PATH)
         except FileNotFoundError:
@@ -1128,15 +2023,175 @@ if __name__ == '__main__':
         # Handle Lock File Removal Errors
         except Exception as lock_e:
              log_data_lock_rem_err = {"app_lock_file": LOCK_FILE_PATH, "reason": "Failed to remove lock file on CalDAV connection exit", "exception_type": type(lock_e).__name__, "details": str(lock_e)}
-             logger.error(f"{LOG_PREFIX_SYSTEM} Application Lock File Error   | {format_log_data(log_data_lock_rem_err)}")
+             logger.error("%s Application Lock File Error   | %s", LOG_PREFIX_SYSTEM, format_log_data(log_data_lock_rem_err))
         sys.exit(1)
 
+    # Parse and Validate CalDAV Worker Pool Settings
+    try:
+        caldav_worker_count = int(config.get('CALDAV_SERVER', {}).get('CALDAV_WORKER_COUNT', 2))
+        if caldav_worker_count <= 0: caldav_worker_count = 2
+    except (ValueError, TypeError):
+        config_value = config.get('CALDAV_SERVER', {}).get('CALDAV_WORKER_COUNT', 'Not Found')
+        log_data_warn = {"reason": "Invalid config value type", "config_key": "CALDAV_WORKER_COUNT", "value": config_value}
+        logger.warn("%s Invalid or missing CALDAV_WORKER_COUNT, using default: 2 | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data_warn))
+        caldav_worker_count = 2
+
+    try:
+        caldav_queue_size = int(config.get('CALDAV_SERVER', {}).get('CALDAV_QUEUE_SIZE', 100))
+        if caldav_queue_size <= 0: caldav_queue_size = 100
+    except (ValueError, TypeError):
+        config_value = config.get('CALDAV_SERVER', {}).get('CALDAV_QUEUE_SIZE', 'Not Found')
+        log_data_warn = {"reason": "Invalid config value type", "config_key": "CALDAV_QUEUE_SIZE", "value": config_value}
+        logger.warn("%s Invalid or missing CALDAV_QUEUE_SIZE, using default: 100 | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data_warn))
+        caldav_queue_size = 100
+
+    caldav_queue_policy = str(config.get('CALDAV_SERVER', {}).get('CALDAV_QUEUE_FULL_POLICY', 'reject_new')).lower()
+    if caldav_queue_policy not in QUEUE_FULL_POLICIES:
+        log_data_warn = {"reason": "Invalid config value", "config_key": "CALDAV_QUEUE_FULL_POLICY", "value": caldav_queue_policy, "allowed": "|".join(QUEUE_FULL_POLICIES)}
+        logger.warn("%s Invalid or missing CALDAV_QUEUE_FULL_POLICY, using default: reject_new | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data_warn))
+        caldav_queue_policy = 'reject_new'
+
+    # Parse and Validate Circuit Breaker Settings
+    try:
+        breaker_failure_threshold = int(config.get('CALDAV_SERVER', {}).get('CALDAV_BREAKER_FAILURE_THRESHOLD', 5))
+        if breaker_failure_threshold <= 0: breaker_failure_threshold = 5
+    except (ValueError, TypeError):
+        config_value = config.get('CALDAV_SERVER', {}).get('CALDAV_BREAKER_FAILURE_THRESHOLD', 'Not Found')
+        log_data_warn = {"reason": "Invalid config value type", "config_key": "CALDAV_BREAKER_FAILURE_THRESHOLD", "value": config_value}
+        logger.warn("%s Invalid or missing CALDAV_BREAKER_FAILURE_THRESHOLD, using default: 5 | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data_warn))
+        breaker_failure_threshold = 5
+
+    try:
+        breaker_max_parked = int(config.get('CALDAV_SERVER', {}).get('CALDAV_BREAKER_MAX_PARKED', 1000))
+        if breaker_max_parked <= 0: breaker_max_parked = 1000
+    except (ValueError, TypeError):
+        config_value = config.get('CALDAV_SERVER', {}).get('CALDAV_BREAKER_MAX_PARKED', 'Not Found')
+        log_data_warn = {"reason": "Invalid config value type", "config_key": "CALDAV_BREAKER_MAX_PARKED", "value": config_value}
+        logger.warn("%s Invalid or missing CALDAV_BREAKER_MAX_PARKED, using default: 1000 | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data_warn))
+        breaker_max_parked = 1000
+
+    try:
+        breaker_reset_seconds = float(config.get('CALDAV_SERVER', {}).get('CALDAV_BREAKER_RESET_SECONDS', 60))
+        if breaker_reset_seconds < 0: breaker_reset_seconds = 60
+    except (ValueError, TypeError):
+        config_value = config.get('CALDAV_SERVER', {}).get('CALDAV_BREAKER_RESET_SECONDS', 'Not Found')
+        log_data_warn = {"reason": "Invalid config value type", "config_key": "CALDAV_BREAKER_RESET_SECONDS", "value": config_value}
+        logger.warn("%s Invalid or missing CALDAV_BREAKER_RESET_SECONDS, using default: 60 | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data_warn))
+        breaker_reset_seconds = 60
+
+    # Start Shared Retry Scheduler and Circuit Breaker
+    caldav_retry_scheduler = RetryScheduler(log_prefix=LOG_PREFIX_CALDAV)
+    caldav_retry_scheduler.start()
+    caldav_breaker = CircuitBreaker(breaker_failure_threshold, breaker_reset_seconds, caldav_retry_scheduler, breaker_max_parked, LOG_PREFIX_CALDAV)
+
+    # Create CalDAV Rate and Concurrency Limits
+    caldav_server_limit = parse_rate_limit(config.get('CALDAV_SERVER', {}), 'CALDAV_SERVER', (0.0, 1, 0), SETTINGS_FILE_NAME)
+    caldav_calendar_limit = parse_rate_limit(config.get('CALDAV_SERVER', {}), 'CALDAV_CALENDAR', (0.0, 1, 0), SETTINGS_FILE_NAME)
+    caldav_limiter = RequestLimiter(caldav_server_limit, caldav_calendar_limit, config.get('CALENDAR_LIMITS', {}))
+    log_data_limits = {
+        "server_limit": "/".join(str(value) for value in caldav_server_limit),
+        "calendar_limit": "/".join(str(value) for value in caldav_calendar_limit),
+        "calendar_overrides": len(config.get('CALENDAR_LIMITS', {}))
+    }
+    logger.debug("%s Rate Limits Configured        | %s", LOG_PREFIX_CALDAV, format_log_data(log_data_limits))
+
+    # Share One Pooled CalDAV Session Between Workers
+    caldav_registry = CaldavClientRegistry(CALDAV_SERVER_ADDRESS, CALDAV_USERNAME, CALDAV_PASSWORD, pool_size=caldav_worker_count, client=caldav_client, timeout=caldav_timeout)
+
+    # Start CalDAV Worker Pool
+    caldav_worker_pool = CaldavWorkerPool(caldav_worker_count, caldav_queue_size, caldav_queue_policy, log_prefix=LOG_PREFIX_CALDAV)
+    caldav_worker_pool.start()
+    log_data_pool = {"worker_count": caldav_worker_count, "queue_size": caldav_queue_size, "policy": caldav_queue_policy}
+    logger.info("%s Worker Pool Started           | %s", LOG_PREFIX_CALDAV, format_log_data(log_data_pool))
+
+    # Open CalDAV Outbox and Replay Pending Jobs
+    if str(config.get('CALDAV_SERVER', {}).get('CALDAV_OUTBOX_ENABLED', 'True')).lower() == 'true':
+        try:
+            try:
+                outbox_fsync_batch = int(config.get('CALDAV_SERVER', {}).get('CALDAV_OUTBOX_FSYNC_BATCH', 32))
+                if outbox_fsync_batch <= 0: outbox_fsync_batch = 32
+            except (ValueError, TypeError):
+                config_value = config.get('CALDAV_SERVER', {}).get('CALDAV_OUTBOX_FSYNC_BATCH', 'Not Found')
+                log_data_warn = {"reason": "Invalid config value type", "config_key": "CALDAV_OUTBOX_FSYNC_BATCH", "value": config_value}
+                logger.warn("%s Invalid or missing CALDAV_OUTBOX_FSYNC_BATCH, using default: 32 | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data_warn))
+                outbox_fsync_batch = 32
+
+            try:
+                outbox_fsync_interval = float(config.get('CALDAV_SERVER', {}).get('CALDAV_OUTBOX_FSYNC_INTERVAL_SECONDS', 0.5))
+                if outbox_fsync_interval < 0: outbox_fsync_interval = 0.5
+            except (ValueError, TypeError):
+                config_value = config.get('CALDAV_SERVER', {}).get('CALDAV_OUTBOX_FSYNC_INTERVAL_SECONDS', 'Not Found')
+                log_data_warn = {"reason": "Invalid config value type", "config_key": "CALDAV_OUTBOX_FSYNC_INTERVAL_SECONDS", "value": config_value}
+                logger.warn("%s Invalid or missing CALDAV_OUTBOX_FSYNC_INTERVAL_SECONDS, using default: 0.5 | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data_warn))
+                outbox_fsync_interval = 0.5
+
+            caldav_outbox = Outbox(OUTBOX_PATH, fsync_batch=outbox_fsync_batch, fsync_interval=outbox_fsync_interval)
+            pending_jobs = caldav_outbox.pending()
+            log_data_outbox = {"outbox_file": OUTBOX_PATH, "pending_jobs": len(pending_jobs), "fsync_batch": outbox_fsync_batch, "fsync_interval_seconds": outbox_fsync_interval}
+            logger.info("%s Outbox Load Successful        | %s", LOG_PREFIX_CALDAV, format_log_data(log_data_outbox))
+
+            # Replay Jobs Left Over from the Previous Run in Order
+            for pending_job in pending_jobs:
+                job = pending_job['job']
+                log_data_replay = {"mqtt_topic": job.get('mqtt_topic'), "action": job.get('action'), "event_mode": job.get('event_mode'), "outbox_id": pending_job['id']}
+                logger.info("%s Outbox Job Replayed           | %s", LOG_PREFIX_CALDAV, format_log_data(log_data_replay))
+                submit_caldav_job(job.get('event_mode'), job.get('mqtt_topic'), job.get('action'), job.get('payload', {}), config,
+                                  outbox_id=pending_job['id'], block=True)
+
+        # Handle Outbox Errors by Continuing Without Persistence
+        except Exception as e:
+            caldav_outbox = None
+            log_data_outbox_err = {"outbox_file": OUTBOX_PATH, "reason": "Continuing without outbox", "exception_type": type(e).__name__, "details": str(e)}
+            logger.error("%s Outbox Load Failed            | %s", LOG_PREFIX_CALDAV, format_log_data(log_data_outbox_err))
+
+    # Start Metrics Endpoint
+    if str(config.get('APPLICATION_SETTINGS', {}).get('METRICS_ENABLED', 'False')).lower() == 'true':
+        metrics_address = str(config.get('APPLICATION_SETTINGS', {}).get('METRICS_ADDRESS', '127.0.0.1'))
+        try:
+            metrics_port = int(config.get('APPLICATION_SETTINGS', {}).get('METRICS_PORT', 9464))
+            if not 0 < metrics_port < 65536: raise ValueError("port out of range")
+        except (ValueError, TypeError):
+            config_value = config.get('APPLICATION_SETTINGS', {}).get('METRICS_PORT', 'Not Found')
+            log_data_warn = {"reason": "Invalid config value type", "config_key": "METRICS_PORT", "value": config_value}
+            logger.warn("%s Invalid or missing METRICS_PORT, using default: 9464 | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data_warn))
+            metrics_port = 9464
+        try:
+            metrics = create_metrics()
+            start_metrics_server(metrics, metrics_address, metrics_port)
+            log_data_metrics = {"metrics_url": f"http://{metrics_address}:{metrics_port}/metrics"}
+            logger.info("%s Metrics Endpoint Started      | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data_metrics))
+
+        # Handle Metrics Endpoint Errors, The Application Runs Without Metrics
+        except OSError as e:
+            metrics = None
+            log_data_metrics_err = {"metrics_address": metrics_address, "metrics_port": metrics_port, "reason": "Continuing without metrics", "exception_type": type(e).__name__, "details": str(e)}
+            logger.error("%s Metrics Endpoint Failed       | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data_metrics_err))
+
     # Initialize MQTT Connection
     mqtt_client = MQTTClient(APP_NAME)
     mqtt_client.username_pw_set(MQTT_USERNAME, password=MQTT_PASSWORD)
     mqtt_client.on_connect = lambda client, userdata, flags, rc: on_connect(client, userdata, flags, rc, config)
     mqtt_client.on_message = lambda client, userdata, message: on_message(caldav_client, config, client, userdata, message)
 
+    # Set Last Will and Start Status Publisher
+    try:
+        stats_interval = float(config.get('MQTT_SERVER', {}).get('MQTT_STATS_INTERVAL_SECONDS', 0))
+        if stats_interval < 0: raise ValueError("negative value")
+    except (ValueError, TypeError):
+        config_value = config.get('MQTT_SERVER', {}).get('MQTT_STATS_INTERVAL_SECONDS', 'Not Found')
+        log_data_warn = {"reason": "Invalid config value type", "config_key": "MQTT_STATS_INTERVAL_SECONDS", "value": config_value}
+        logger.warn("%s Invalid or missing MQTT_STATS_INTERVAL_SECONDS, using default: 0 | %s", LOG_PREFIX_MQTT, format_log_data(log_data_warn))
+        stats_interval = 0
+    if stats_interval:
+        config['MQTT_STATUS_TOPIC'] = str(config.get('MQTT_SERVER', {}).get('MQTT_STATUS_TOPIC', 'mqtt2caldav/status'))
+        mqtt_client.will_set(config['MQTT_STATUS_TOPIC'], json.dumps({"state": "offline", "reason": "Connection lost"}), qos=1, retain=True)
+        service_stats = ServiceStats()
+        stats_publisher = StatsPublisher(stats_interval, build_status_document,
+                                         lambda document: mqtt_client.publish(config['MQTT_STATUS_TOPIC'], json.dumps(document), qos=1, retain=True))
+        stats_publisher.start()
+        log_data_stats = {"mqtt_topic": config['MQTT_STATUS_TOPIC'], "interval_seconds": stats_interval}
+        logger.info("%s Status Publisher Started      | %s", LOG_PREFIX_MQTT, format_log_data(log_data_stats))
+
     # Define Signal Handler
     def shutdown_handler(signum, frame):
         global SHUTDOWN_REQUESTED
@@ -1154,7 +2209,7 @@ if __name__ == '__main__':
             shutdown_reason = "Termination Signal Received"
 
         log_data = {"reason": shutdown_reason, "signal": signal_name}
-        logger.warn(f"{LOG_PREFIX_SYSTEM} Initiating Graceful Shutdown  | {format_log_data(log_data)}")
+        logger.warn("%s Initiating Graceful Shutdown  | %s", LOG_PREFIX_SYSTEM, format_log_data(log_data))
         
         # Parse and Validate QoS Disconnect Delay
         def graceful_disconnect():
@@ -1167,11 +2222,14 @@ if __name__ == '__main__':
                     except (ValueError, TypeError):
                         disconnect_delay = 2.0
 
+                    # Replace the Status Document Before the Will Would Fire
+                    publish_offline_status(mqtt_client, config)
+
                     # Execute Graceful MQTT Disconnect
                     time.sleep(disconnect_delay)
                     mqtt_host_info_shutdown = f"{config.get('MQTT_SERVER', {}).get('MQTT_USERNAME', 'unknown')}@{config.get('MQTT_SERVER', {}).get('MQTT_SERVER_ADDRESS', 'unknown')}:{config.get('MQTT_SERVER', {}).get('MQTT_SERVER_PORT', 'unknown')}"
                     log_data_disc_init = {"mqtt_host": mqtt_host_info_shutdown}
-                    logger.info(f"{LOG_PREFIX_SYSTEM} MQTT Disconnect Initiated     | {format_log_data(log_data_disc_init)}")
+                    logger.info("%s MQTT Disconnect Initiated     | %s", LOG_PREFIX_SYSTEM, format_log_data(log_data_disc_init))
                     mqtt_client.disconnect()
                 else:
                     logger.info(f"{LOG_PREFIX_SYSTEM} MQTT client found but not connected, skipping disconnect.")
@@ -1179,23 +2237,40 @@ if __name__ == '__main__':
             # Handle Uninitialized Variable Errors
             except NameError:
                 log_data_err = {"reason": "MQTT client or config not initialized when shutdown requested."}
-                logger.error(f"{LOG_PREFIX_SYSTEM} MQTT Disconnect Error         | {format_log_data(log_data_err)}")
+                logger.error("%s MQTT Disconnect Error         | %s", LOG_PREFIX_SYSTEM, format_log_data(log_data_err))
 
             # Handle MQTT Disconnect Errors
             except Exception as e:
                 log_data_err = {"details": str(e), "exception_type": type(e).__name__}
-                logger.error(f"{LOG_PREFIX_SYSTEM} MQTT Disconnect Error         | {format_log_data(log_data_err)}")
+                logger.error("%s MQTT Disconnect Error         | %s", LOG_PREFIX_SYSTEM, format_log_data(log_data_err))
 
         threading.Thread(target=graceful_disconnect, daemon=True).start()
 
     signal.signal(signal.SIGTERM, shutdown_handler)
     signal.signal(signal.SIGINT, shutdown_handler)
 
+    # Reload Configuration on SIGHUP or File Change
+    try:
+        config_watch_seconds = float(config.get('APPLICATION_SETTINGS', {}).get('CONFIG_WATCH_SECONDS', 0))
+        if config_watch_seconds < 0: raise ValueError("negative value")
+    except (ValueError, TypeError):
+        config_value = config.get('APPLICATION_SETTINGS', {}).get('CONFIG_WATCH_SECONDS', 'Not Found')
+        log_data_warn = {"reason": "Invalid config value type", "config_key": "CONFIG_WATCH_SECONDS", "value": config_value}
+        logger.warn("%s Invalid or missing CONFIG_WATCH_SECONDS, using default: 0 | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data_warn))
+        config_watch_seconds = 0
+    config_watcher = ConfigWatcher([os.path.join(CONFIG_DIR, SETTINGS_FILE_NAME), os.path.join(CONFIG_DIR, TRIGGERS_FILE_NAME)],
+                                   lambda reason: reload_config(mqtt_client, reason), config_watch_seconds)
+    config_watcher.start()
+    if hasattr(signal, 'SIGHUP'):
+        signal.signal(signal.SIGHUP, lambda signum, frame: config_watcher.request())
+    log_data_reload = {"signal": "SIGHUP" if hasattr(signal, 'SIGHUP') else None, "watch_interval_seconds": config_watch_seconds}
+    logger.info("%s Config Reload Enabled         | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data_reload))
+
     # Establish MQTT Connection
     try:
         mqtt_host_info_init = f"{MQTT_USERNAME}@{MQTT_SERVER_ADDRESS}:{MQTT_SERVER_PORT}"
         log_data_mqtt_init = {"mqtt_host": mqtt_host_info_init}
-        logger.info(f"{LOG_PREFIX_MQTT} Broker Connection Initiated   | {format_log_data(log_data_mqtt_init)}")
+        logger.info("%s Broker Connection Initiated   | %s", LOG_PREFIX_MQTT, format_log_data(log_data_mqtt_init))
         mqtt_port = int(MQTT_SERVER_PORT)
         mqtt_client.connect(MQTT_SERVER_ADDRESS, port=mqtt_port)
 
@@ -1203,28 +2278,28 @@ if __name__ == '__main__':
     except ValueError as e:
         mqtt_host_info_fail = f"{MQTT_USERNAME}@{MQTT_SERVER_ADDRESS}:{MQTT_SERVER_PORT}"
         log_data = {"mqtt_host": mqtt_host_info_fail, "reason": "Invalid MQTT Port configured", "exception_type": type(e).__name__, "details": str(e)}
-        logger.critical(f"{LOG_PREFIX_MQTT} Broker Connection Failed      | {format_log_data(log_data)}")
+        logger.critical("%s Broker Connection Failed      | %s", LOG_PREFIX_MQTT, format_log_data(log_data))
         try:
             os.remove(LOCK_FILE_PATH)
         except FileNotFoundError:
             pass
         except Exception as lock_e:
              log_data_lock_rem_err = {"app_lock_file": LOCK_FILE_PATH, "reason": "Failed to remove lock file on MQTT connection exit", "exception_type": type(lock_e).__name__, "details": str(lock_e)}
-             logger.error(f"{LOG_PREFIX_SYSTEM} Application Lock File Error   | {format_log_data(log_data_lock_rem_err)}")
+             logger.error("%s Application Lock File Error   | %s", LOG_PREFIX_SYSTEM, format_log_data(log_data_lock_rem_err))
         sys.exit(1)
 
     # Handle MQTT Connection Attempt Errors
     except Exception as e:
         mqtt_host_info_fail = f"{MQTT_USERNAME}@{MQTT_SERVER_ADDRESS}:{MQTT_SERVER_PORT}"
         log_data = {"mqtt_host": mqtt_host_info_fail, "reason": "MQTT Connection Failed", "exception_type": type(e).__name__, "details": str(e)}
-        logger.critical(f"{LOG_PREFIX_MQTT} Broker Connection Failed      | {format_log_data(log_data)}")
+        logger.critical("%s Broker Connection Failed      | %s", LOG_PREFIX_MQTT, format_log_data(log_data))
         try:
             os.remove(LOCK_FILE_PATH)
         except FileNotFoundError:
             pass
         except Exception as lock_e:
              log_data_lock_rem_err = {"app_lock_file": LOCK_FILE_PATH, "reason": "Failed to remove lock file on MQTT connection exit", "exception_type": type(lock_e).__name__, "details": str(lock_e)}
-             logger.error(f"{LOG_PREFIX_SYSTEM} Application Lock File Error   | {format_log_data(log_data_lock_rem_err)}")
+             logger.error("%s Application Lock File Error   | %s", LOG_PREFIX_SYSTEM, format_log_data(log_data_lock_rem_err))
         sys.exit(1)
 
     # Start MQTT Blocking Loop
@@ -1234,30 +2309,31 @@ if __name__ == '__main__':
             mqtt_client.loop_forever()
         else:
             log_data_no_sub = {'reason': 'No triggers defined. MQTT loop not started. Exiting.'}
-            logger.warn(f"{LOG_PREFIX_MQTT} No Subscriptions   | {format_log_data(log_data_no_sub)}")
+            logger.warn("%s No Subscriptions   | %s", LOG_PREFIX_MQTT, format_log_data(log_data_no_sub))
 
     # Handle User Interruption During Shutdown
     except KeyboardInterrupt:
         log_data = {"reason": "KeyboardInterrupt Exception Caught Directly"}
-        logger.warn(f"{LOG_PREFIX_USER} Keyboard Interrupt Exception  | {format_log_data(log_data)}")
+        logger.warn("%s Keyboard Interrupt Exception  | %s", LOG_PREFIX_USER, format_log_data(log_data))
 
     # Handle Unexpected Errors During MQTT Loop
     except Exception as e:
         log_data = {"exception_type": type(e).__name__, "details": str(e)}
-        logger.error(f"{LOG_PREFIX_APPLICATION} Main Loop Error    | {format_log_data(log_data)}")
+        logger.error("%s Main Loop Error    | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data))
 
     # Attempt MQTT Client Disconnect
     finally:
         log_data_shutdown_init = {"app_name": APP_NAME, "app_version": VERSION}
-        logger.info(f"{LOG_PREFIX_SYSTEM} Application Cleanup Initiated | {format_log_data(log_data_shutdown_init)}")
+        logger.info("%s Application Cleanup Initiated | %s", LOG_PREFIX_SYSTEM, format_log_data(log_data_shutdown_init))
         try:
              if 'mqtt_client' in locals() or 'mqtt_client' in globals():
                  if mqtt_client.is_connected():
                      if not SHUTDOWN_REQUESTED:
+                         publish_offline_status(mqtt_client, config)
                          mqtt_client.disconnect()
                          mqtt_host_info_final = f"{config.get('MQTT_SERVER', {}).get('MQTT_SERVER_ADDRESS', 'unknown')}:{config.get('MQTT_SERVER', {}).get('MQTT_SERVER_PORT', 'unknown')}"
                          log_data_disconnect = {"mqtt_host": mqtt_host_info_final}
-                         logger.info(f"{LOG_PREFIX_MQTT} Broker Disconnect Successful  | {format_log_data(log_data_disconnect)}")
+                         logger.info("%s Broker Disconnect Successful  | %s", LOG_PREFIX_MQTT, format_log_data(log_data_disconnect))
                      else:
                          try:
                              disconnect_delay = float(config.get('MQTT_SERVER', {}).get('MQTT_QOS_DISCONNECT_SECONDS', 2.0))
@@ -1269,7 +2345,82 @@ if __name__ == '__main__':
                          time.sleep(disconnect_delay + 0.5)
         except Exception as e:
             log_data_disc_err = {"details": str(e) , "exception_type": type(e).__name__}
-            logger.error(f"{LOG_PREFIX_SYSTEM} MQTT Disconnect Error         | {format_log_data(log_data_disc_err)}")
+            logger.error("%s MQTT Disconnect Error         | %s", LOG_PREFIX_SYSTEM, format_log_data(log_data_disc_err))
+
+        # Stop Config Watcher
+        if config_watcher is not None:
+            config_watcher.stop()
+
+        # Log Rate Limiter Counters
+        if caldav_limiter is not None:
+            logger.info("%s Rate Limit Summary            | %s", LOG_PREFIX_CALDAV, format_log_data(caldav_limiter.stats()))
+
+        # Flush Log Sampling Counters
+        if config.get('LOG_SAMPLER') is not None:
+            log_suppressed_lines(config['LOG_SAMPLER'].flush())
+
+        # Log Debounce and Extend Counters
+        logger.info("%s Debounce Summary              | %s", LOG_PREFIX_APPLICATION, format_log_data(event_debouncer.stats()))
+        logger.info("%s Extend Summary                | %s", LOG_PREFIX_APPLICATION, format_log_data(open_event_tracker.stats()))
+
+        # Stop Retry Scheduler, Pending Retries Stay in the Outbox
+        if caldav_retry_scheduler is not None:
+            log_data_scheduler = {"pending_retries": caldav_retry_scheduler.pending(KIND_RETRY), **(caldav_breaker.stats() if caldav_breaker is not None else {})}
+            caldav_retry_scheduler.shutdown()
+            logger.info("%s Retry Scheduler Stopped       | %s", LOG_PREFIX_CALDAV, format_log_data(log_data_scheduler))
+
+        # Drain CalDAV Worker Pool
+        try:
+            if caldav_worker_pool is not None:
+                try:
+                    pool_drain_timeout = float(config.get('MQTT_SERVER', {}).get('MQTT_QOS_DISCONNECT_SECONDS', 2.0))
+                    if pool_drain_timeout < 0:
+                        pool_drain_timeout = 2.0
+                except (ValueError, TypeError):
+                    pool_drain_timeout = 2.0
+                pool_drained = caldav_worker_pool.shutdown(pool_drain_timeout)
+                log_data_pool = {"drained": pool_drained, **caldav_worker_pool.stats()}
+                logger.info("%s Worker Pool Stopped           | %s", LOG_PREFIX_CALDAV, format_log_data(log_data_pool))
+        except Exception as e:
+            log_data_pool_err = {"details": str(e), "exception_type": type(e).__name__}
+            logger.error("%s Worker Pool Stop Error        | %s", LOG_PREFIX_CALDAV, format_log_data(log_data_pool_err))
+
+        # Close CalDAV Outbox
+        if caldav_outbox is not None:
+            try:
+                log_data_outbox = {"outbox_file": OUTBOX_PATH, **caldav_outbox.stats()}
+                caldav_outbox.close()
+                logger.info("%s Outbox Closed                 | %s", LOG_PREFIX_CALDAV, format_log_data(log_data_outbox))
+            except Exception as e:
+                log_data_outbox_err = {"outbox_file": OUTBOX_PATH, "exception_type": type(e).__name__, "details": str(e)}
+                logger.error("%s Outbox Close Error            | %s", LOG_PREFIX_CALDAV, format_log_data(log_data_outbox_err))
+
+        # Close Telemetry Store
+        if telemetry_store is not None:
+            try:
+                log_data_telemetry = {"telemetry_file": TELEMETRY_PATH, **telemetry_store.stats()}
+                telemetry_store.close()
+                logger.info("%s Telemetry Store Closed        | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data_telemetry))
+            except Exception as e:
+                log_data_telemetry_err = {"telemetry_file": TELEMETRY_PATH, "exception_type": type(e).__name__, "details": str(e)}
+                logger.error("%s Telemetry Store Close Error   | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data_telemetry_err))
+
+        # Close Trace File
+        if tracer is not None:
+            try:
+                log_data_trace = tracer.stats()
+                tracer.close()
+                logger.info("%s Trace File Closed             | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data_trace))
+            except Exception as e:
+                log_data_trace_err = {"trace_file": TRACE_PATH, "exception_type": type(e).__name__, "details": str(e)}
+                logger.error("%s Trace File Close Error        | %s", LOG_PREFIX_APPLICATION, format_log_data(log_data_trace_err))
+
+        # Close Event Index
+        if event_index is not None:
+            try:
+                event_index.close()
+            except Exception:
+                pass
 
         # Remove Lock File During Cleanup
         try:
@@ -1285,19 +2436,20 @@ if __name__ == '__main__':
                 try:
                     os.remove(LOCK_FILE_PATH)
                     log_data_lock_rem = {"app_lock_file": LOCK_FILE_PATH, "app_pid": current_pid}
-                    logger.info(f"{LOG_PREFIX_SYSTEM} Application Lock File Removed | {format_log_data(log_data_lock_rem)}")
+                    logger.info("%s Application Lock File Removed | %s", LOG_PREFIX_SYSTEM, format_log_data(log_data_lock_rem))
                 except FileNotFoundError:
                     pass
             else:
                 log_data_lock_other = {"app_lock_file": LOCK_FILE_PATH, "current_pid": current_pid, "lock_pid": lock_pid}
-                logger.warn(f"{LOG_PREFIX_SYSTEM} Application Lock File Blocked | {format_log_data(log_data_lock_other)}")
+                logger.warn("%s Application Lock File Blocked | %s", LOG_PREFIX_SYSTEM, format_log_data(log_data_lock_other))
 
         # Handle Lock File Removal Errors
         except Exception as e:
             log_data_lock_rem_err = {"app_lock_file": LOCK_FILE_PATH, "reason": "Failed to remove lock file", "exception_type": type(e).__name__, "details": str(e)}
-            logger.error(f"{LOG_PREFIX_SYSTEM} Application Lock File Error   | {format_log_data(log_data_lock_rem_err)}")
+            logger.error("%s Application Lock File Error   | %s", LOG_PREFIX_SYSTEM, format_log_data(log_data_lock_rem_err))
         
         # Log Application Stop
         _app_pid_final = os.getpid()
         log_data_shutdown_final = {"app_name": APP_NAME, "app_version": VERSION, "app_pid": _app_pid_final}
-        logger.info(f"{LOG_PREFIX_SYSTEM} Application Stop Successful   | {format_log_data(log_data_shutdown_final)}")
+        logger.info("%s Application Stop Successful   | %s", LOG_PREFIX_SYSTEM, format_log_data(log_data_shutdown_final))
+        logger.stop_async_logging()
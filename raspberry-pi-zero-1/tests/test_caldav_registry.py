@@ -0,0 +1,68 @@
+### SECTION :: Module Imports ############################################################
+import os
+import sys
+import unittest
+
+project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_dir)
+
+try:
+    from utils.caldav_registry import REQUEST_EXCEPTIONS, CaldavClientRegistry
+    from utils.caldav_standin import CaldavStandin
+except ImportError:
+    CaldavClientRegistry = None
+
+
+
+### SECTION :: Configuration #############################################################
+EVENT_ICAL = ("BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//mqtt2caldav//test//EN\r\nBEGIN:VEVENT\r\nUID:registry-test\r\n"
+              "DTSTAMP:20261017T120000Z\r\nDTSTART:20261017T120000Z\r\nDTEND:20261017T121000Z\r\nSUMMARY:Test\r\nEND:VEVENT\r\nEND:VCALENDAR\r\n")
+
+
+
+### CLASS :: Registry Requests ###########################################################
+@unittest.skipIf(CaldavClientRegistry is None, "caldav is not installed")
+class CaldavClientRegistryTest(unittest.TestCase):
+    """The registry's pooled session has to reach the server with the installed caldav version."""
+
+    def setUp(self):
+        self.standin = CaldavStandin("user", "password", ("automation",))
+        self.standin.start()
+        self.registry = CaldavClientRegistry(self.standin.url, "user", "password", pool_size=4)
+
+    def tearDown(self):
+        self.standin.stop()
+
+    def test_put_and_delete_reach_the_server(self):
+        client = self.registry.client
+        self.registry.reset_request_count()
+        event_url = self.registry.put_event(client, self.standin.calendar_url("automation"), "registry-test", EVENT_ICAL)
+        self.assertEqual(self.standin.stats()['events'], 1)
+        self.assertGreaterEqual(self.standin.stats()['requests'].get('PUT', 0), 1)
+        self.assertGreaterEqual(self.registry.request_count(), 1)
+
+        self.registry.delete_event(client, event_url)
+        self.assertEqual(self.standin.stats()['events'], 0)
+        self.assertEqual(self.standin.stats()['requests'].get('DELETE', 0), 1)
+
+    def test_timeout_applies_to_the_session_caldav_uses(self):
+        registry = CaldavClientRegistry(self.standin.url, "user", "password", timeout=0.2)
+        self.standin.set_faults(latency_ms=2000, methods=("PUT",))
+        with self.assertRaises(REQUEST_EXCEPTIONS):
+            registry.put_event(registry.reconnect(), self.standin.calendar_url("automation"), "registry-test", EVENT_ICAL)
+
+    def test_sequential_requests_reuse_one_connection(self):
+        client = self.registry.client
+        calendar_url = self.standin.calendar_url("automation")
+        self.standin.reset_stats()
+        for index in range(5):
+            event_url = self.registry.put_event(client, calendar_url, f"registry-test-{index}", EVENT_ICAL)
+            self.registry.delete_event(client, event_url)
+        self.assertEqual(self.standin.stats()['requests'].get('DELETE', 0), 5)
+        self.assertEqual(self.standin.stats()['connections'], 1)
+
+
+
+### MAIN #################################################################################
+if __name__ == "__main__":
+    unittest.main()
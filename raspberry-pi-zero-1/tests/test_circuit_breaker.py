@@ -0,0 +1,113 @@
+### SECTION :: Module Imports ############################################################
+import os
+import sys
+import threading
+import unittest
+
+project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_dir)
+
+from utils.circuit_breaker import PARKED, STATE_CLOSED, CircuitBreaker
+from utils.retry_scheduler import KIND_TIMER, RetryScheduler
+from utils.worker_pool import POLICY_REJECT_NEW, CaldavWorkerPool
+
+
+
+### SECTION :: Configuration #############################################################
+PARKED_JOBS = 30
+QUEUE_SIZE = 5
+WAIT_SECONDS = 10
+
+
+
+### CLASS :: Breaker Release #############################################################
+class CircuitBreakerReleaseTest(unittest.TestCase):
+    """Parked jobs have to reach the workers even when the backlog is larger than the queue."""
+
+    def setUp(self):
+        self.scheduler = RetryScheduler()
+        self.scheduler.start()
+        self.pool = CaldavWorkerPool(1, QUEUE_SIZE, POLICY_REJECT_NEW)
+        self.pool.start()
+        self.breaker = CircuitBreaker(1, 60, self.scheduler, max_parked=PARKED_JOBS)
+        self.ran = []
+        self.ran_lock = threading.Lock()
+        self.all_ran = threading.Event()
+
+    def tearDown(self):
+        self.pool.shutdown(WAIT_SECONDS)
+        self.scheduler.shutdown()
+
+    def _job(self, index):
+        with self.ran_lock:
+            self.ran.append(index)
+            if len(self.ran) == PARKED_JOBS:
+                self.all_ran.set()
+
+    def _resubmit(self, index):
+        return lambda: self.pool.submit(self._job, (index,), "parked", block=True)
+
+    def test_release_with_full_queue(self):
+        self.assertTrue(self.breaker.record_failure())
+        for index in range(PARKED_JOBS):
+            self.assertEqual(self.breaker.acquire_or_park(self._resubmit(index)), PARKED)
+
+        # The only worker reports the success, releasing it must not wait for queue space
+        accepted, _ = self.pool.submit(self.breaker.record_success, (), "probe")
+        self.assertTrue(accepted)
+
+        self.assertTrue(self.all_ran.wait(WAIT_SECONDS), f"only {len(self.ran)} of {PARKED_JOBS} parked jobs ran")
+        self.assertEqual(self.ran, list(range(PARKED_JOBS)))
+        self.assertEqual(self.pool.stats()['rejected_jobs'], 0)
+        self.assertEqual(self.breaker.state, STATE_CLOSED)
+        self.assertEqual(self.breaker.stats()['parked_jobs'], 0)
+
+    def test_probe_waiting_for_queue_space_leaves_the_scheduler_running(self):
+        breaker = CircuitBreaker(1, 0.05, self.scheduler)
+        worker_busy, worker_blocked = threading.Event(), threading.Event()
+
+        def busy():
+            worker_busy.set()
+            worker_blocked.wait(WAIT_SECONDS)
+        self.pool.submit(busy, (), "busy")
+        self.assertTrue(worker_busy.wait(WAIT_SECONDS))
+        while self.pool.submit(self._noop, (), "filler")[0]:
+            pass
+        probe_queued = threading.Event()
+
+        def probe():
+            self.pool.submit(self._noop, (), "probe", block=True)
+            probe_queued.set()
+        breaker.record_failure()
+        self.assertEqual(breaker.acquire_or_park(probe), PARKED)
+
+        # The probe is released after 0.05 seconds and waits for the busy worker
+        timer_ran = threading.Event()
+        self.scheduler.schedule(0.2, timer_ran.set)
+        self.assertTrue(timer_ran.wait(WAIT_SECONDS))
+        self.assertFalse(probe_queued.is_set())
+        worker_blocked.set()
+        self.assertTrue(probe_queued.wait(WAIT_SECONDS))
+
+    def test_breaker_timers_are_not_pending_retries(self):
+        breaker = CircuitBreaker(1, 60, self.scheduler)
+        breaker.record_failure()
+        self.scheduler.schedule(60, self._noop)
+        self.assertEqual(self.scheduler.pending(), 1)
+        self.assertEqual(self.scheduler.pending(KIND_TIMER), 1)
+        self.assertEqual(self.scheduler.pending(None), 2)
+
+    def _noop(self):
+        pass
+
+    def test_stopping_pool_sheds_nothing(self):
+        self.pool.shutdown(WAIT_SECONDS)
+        accepted, shed_job = self.pool.submit(self._job, (0,), "late")
+        self.assertFalse(accepted)
+        self.assertIsNone(shed_job)
+
+
+
+### MAIN #################################################################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+### SECTION :: Module Imports ############################################################
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_dir)
+
+try:
+    import main
+    from utils import logger
+except ImportError:
+    main = None
+
+
+
+### SECTION :: Configuration #############################################################
+SETTINGS = {"APPLICATION_SETTINGS": {"LOG_LEVEL": "ERROR", "LOG_PREFIXES": {"APPLICATION": "[NEW]"}}}
+TRIGGERS = [{"MODE": "Delete", "MQTT_TOPIC": "test/device", "MQTT_EVENT": {"action": "off"}}]
+
+
+
+### CLASS :: Load Config #################################################################
+@unittest.skipIf(main is None, "caldav or paho-mqtt is not installed")
+class LoadConfigTest(unittest.TestCase):
+    """Loading a config must not touch logging until the config is applied."""
+
+    def setUp(self):
+        # load_config only reads files below the project directory
+        self.work_dir = tempfile.mkdtemp(prefix=".test_load_config_", dir=project_dir)
+        self.addCleanup(shutil.rmtree, self.work_dir, True)
+        self.settings_path = os.path.join(self.work_dir, "settings.json")
+        self.triggers_path = os.path.join(self.work_dir, "triggers.json")
+        with open(self.settings_path, 'w', encoding='utf-8') as settings_file:
+            json.dump(SETTINGS, settings_file)
+        self.prefix, self.level = main.LOG_PREFIX_APPLICATION, logger.logger.level
+
+    def tearDown(self):
+        main.LOG_PREFIX_APPLICATION = self.prefix
+        logger.logger.setLevel(self.level)
+
+    def test_rejected_config_leaves_logging_alone(self):
+        with open(self.triggers_path, 'w', encoding='utf-8') as triggers_file:
+            json.dump([{"MODE": "Delete", "MQTT_TOPIC": "test/device"}], triggers_file)
+        with self.assertRaises(SystemExit):
+            main.load_config(self.settings_path, self.triggers_path)
+        self.assertEqual(main.LOG_PREFIX_APPLICATION, self.prefix)
+        self.assertEqual(logger.logger.level, self.level)
+
+    def test_settings_apply_after_load(self):
+        with open(self.triggers_path, 'w', encoding='utf-8') as triggers_file:
+            json.dump(TRIGGERS, triggers_file)
+        config = main.load_config(self.settings_path, self.triggers_path)
+        self.assertEqual(main.LOG_PREFIX_APPLICATION, self.prefix)
+        self.assertEqual(logger.logger.level, self.level)
+
+        main.apply_log_settings(config)
+        self.assertEqual(main.LOG_PREFIX_APPLICATION, "[NEW]")
+        self.assertEqual(main.LOG_PREFIX_CALDAV, "[DAV]")
+        self.assertEqual(logger.logger.level, logger.logging.ERROR)
+
+
+
+### MAIN #################################################################################
+if __name__ == "__main__":
+    unittest.main()
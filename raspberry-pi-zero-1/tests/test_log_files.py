@@ -0,0 +1,55 @@
+### SECTION :: Module Imports ############################################################
+import gzip
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_dir)
+
+from utils.log_files import iter_lines_forward, iter_lines_reverse
+
+
+
+### CLASS :: Reverse Log Reading #########################################################
+class IterLinesReverseTest(unittest.TestCase):
+    """Archives are read newest first, gzip archives through a temporary file."""
+
+    def setUp(self):
+        self.log_dir = tempfile.mkdtemp(prefix="test_log_files_")
+        self.log_path = os.path.join(self.log_dir, "mqtt2caldav.log")
+        self.lines = [f"line {index} {'created' if index % 3 == 0 else 'received'}\n" for index in range(3000)]
+        with gzip.open(self.log_path + ".20261016-120000.gz", 'wt', encoding='utf-8') as archive:
+            archive.writelines(self.lines[:1000])
+        with open(self.log_path + ".20261017-120000", 'w', encoding='utf-8') as archive:
+            archive.writelines(self.lines[1000:2000])
+        with open(self.log_path, 'w', encoding='utf-8') as log_file:
+            log_file.writelines(self.lines[2000:])
+
+    def tearDown(self):
+        shutil.rmtree(self.log_dir, ignore_errors=True)
+
+    def test_reads_all_files_newest_first(self):
+        self.assertEqual(list(iter_lines_reverse(self.log_path)), self.lines[::-1])
+        self.assertEqual(list(iter_lines_reverse(self.log_path, use_mmap=True)), self.lines[::-1])
+        self.assertEqual(list(iter_lines_forward(self.log_path)), self.lines)
+
+    def test_filters_lines(self):
+        expected = [line for line in reversed(self.lines) if "created" in line]
+        self.assertEqual(list(iter_lines_reverse(self.log_path, contains="created")), expected)
+
+    def test_leaves_no_temporary_files(self):
+        reader = iter_lines_reverse(self.log_path)
+        for line in reader:
+            if line == self.lines[500]:
+                break
+        reader.close()
+        self.assertEqual(len(os.listdir(self.log_dir)), 3)
+
+
+
+### MAIN #################################################################################
+if __name__ == "__main__":
+    unittest.main()
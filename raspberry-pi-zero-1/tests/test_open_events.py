@@ -0,0 +1,38 @@
+### SECTION :: Module Imports ############################################################
+import os
+import sys
+import unittest
+
+project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_dir)
+
+from utils.open_events import OpenEvent, OpenEventTracker
+
+
+
+### CLASS :: Open Event ETags ############################################################
+class OpenEventTrackerTest(unittest.TestCase):
+    """Only events carrying the ETag of the last own write may be extended."""
+
+    def _event(self, etag):
+        return OpenEvent("http://server/calendar/event.ics", etag, "20261017T121000Z", "ical", "UTC")
+
+    def test_event_without_etag_is_not_tracked(self):
+        tracker = OpenEventTracker()
+        tracker.open("key", self._event('"1"'))
+        tracker.open("key", self._event(None))
+        self.assertIsNone(tracker.get("key"))
+
+    def test_extension_without_etag_stops_tracking(self):
+        tracker = OpenEventTracker()
+        tracker.open("key", self._event('"1"'))
+        tracker.extended("key", "20261017T122000Z", "ical", '"2"')
+        self.assertEqual(tracker.get("key").etag, '"2"')
+        tracker.extended("key", "20261017T123000Z", "ical", None)
+        self.assertIsNone(tracker.get("key"))
+
+
+
+### MAIN #################################################################################
+if __name__ == "__main__":
+    unittest.main()
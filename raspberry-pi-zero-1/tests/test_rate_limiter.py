@@ -0,0 +1,46 @@
+### SECTION :: Module Imports ############################################################
+import os
+import sys
+import threading
+import time
+import unittest
+
+project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_dir)
+
+from utils.rate_limiter import RequestLimiter
+
+
+
+### SECTION :: Configuration #############################################################
+SLOW_CALENDAR = "http://server/calendars/user/slow/"
+FAST_CALENDAR = "http://server/calendars/user/fast/"
+
+
+
+### CLASS :: Request Limiter #############################################################
+class RequestLimiterTest(unittest.TestCase):
+    """Waiting for a calendar's tokens must not hold the server's in-flight slot."""
+
+    def test_rate_wait_holds_no_server_slot(self):
+        limiter = RequestLimiter((0.0, 1, 1), (0.0, 1, 0), {SLOW_CALENDAR: (1.0, 1, 0)})
+        with limiter.acquire(SLOW_CALENDAR):
+            pass
+
+        # The next slow request sleeps about a second for its token
+        def slow_request():
+            with limiter.acquire(SLOW_CALENDAR):
+                pass
+        slow_thread = threading.Thread(target=slow_request)
+        slow_thread.start()
+        time.sleep(0.1)
+        with limiter.acquire(FAST_CALENDAR) as waited:
+            self.assertLess(waited, 0.5)
+        slow_thread.join()
+        self.assertGreater(limiter.stats()['rate_wait_seconds_total'], 0.5)
+
+
+
+### MAIN #################################################################################
+if __name__ == "__main__":
+    unittest.main()
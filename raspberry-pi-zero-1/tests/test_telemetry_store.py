@@ -0,0 +1,63 @@
+### SECTION :: Module Imports ############################################################
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_dir)
+
+from utils.telemetry_store import TelemetryStore
+
+
+
+### SECTION :: Configuration #############################################################
+WAIT_SECONDS = 10
+
+
+
+### CLASS :: Telemetry Store #############################################################
+class TelemetryStoreTest(unittest.TestCase):
+    """Readings are written by the flush thread, and silent series age out of the latest table."""
+
+    def setUp(self):
+        self.db_dir = tempfile.mkdtemp(prefix="test_telemetry_store_")
+        self.addCleanup(shutil.rmtree, self.db_dir, True)
+        self.db_path = os.path.join(self.db_dir, "telemetry.db")
+
+    def _wait_for_flushes(self, store, flushes):
+        deadline = time.monotonic() + WAIT_SECONDS
+        while store.stats()['telemetry_flushes'] < flushes and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return store.stats()['telemetry_flushes'] >= flushes
+
+    def test_record_does_not_wait_for_the_database(self):
+        store = TelemetryStore(self.db_path, max_buffered=1, flush_interval=60)
+        self.addCleanup(store.close)
+        blocker = sqlite3.connect(self.db_path, isolation_level=None)
+        blocker.execute("BEGIN EXCLUSIVE")
+        recorded = threading.Thread(target=store.record, args=("zigbee/sensor", {"battery": 80}))
+        recorded.start()
+        recorded.join(1)
+        self.assertFalse(recorded.is_alive())
+        blocker.execute("COMMIT")
+        blocker.close()
+        self.assertTrue(self._wait_for_flushes(store, 1))
+        self.assertEqual(store.below("battery", 100), [("zigbee/sensor", store.last_readings("battery")["zigbee/sensor"][0][0], 80.0)])
+
+    def test_latest_keeps_only_recent_series(self):
+        store = TelemetryStore(self.db_path, retention_days=30, flush_interval=60)
+        self.addCleanup(store.close)
+        store.record("zigbee/gone", {"battery": 10}, now=time.time() - 40 * 86400)
+        store.record("zigbee/sensor", {"battery": 15})
+        self.assertEqual([topic for topic, _, _ in store.below("battery", 20)], ["zigbee/sensor"])
+
+
+
+### MAIN #################################################################################
+if __name__ == "__main__":
+    unittest.main()
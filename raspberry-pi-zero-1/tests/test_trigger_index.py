@@ -0,0 +1,44 @@
+### SECTION :: Module Imports ############################################################
+import os
+import sys
+import unittest
+
+project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_dir)
+
+from utils.trigger_index import TriggerIndex, trigger_key
+
+
+
+### SECTION :: Configuration #############################################################
+TRIGGERS = [
+    {"MODE": "Create", "MQTT_TOPIC": "zigbee/+/action", "EVENT_SUMMARY": "Any Button"},
+    {"MODE": "Create", "MQTT_TOPIC": "zigbee/button/action", "EVENT_SUMMARY": "Button"},
+    {"MODE": "Delete", "MQTT_TOPIC": "zigbee/button/action"}
+]
+
+
+
+### CLASS :: Trigger Keys ################################################################
+class TriggerKeyTest(unittest.TestCase):
+    """Per-trigger state is keyed by position and content, never by object identity."""
+
+    def test_matches_carry_their_position(self):
+        index = TriggerIndex(TRIGGERS)
+        self.assertEqual([position for position, _ in index.match_positions("zigbee/button/action")], [0, 1, 2])
+        self.assertEqual(index.match("zigbee/other/action"), [TRIGGERS[0]])
+
+    def test_key_survives_a_reload_of_the_same_trigger(self):
+        reloaded = [dict(trigger) for trigger in TRIGGERS]
+        self.assertEqual(trigger_key(1, TRIGGERS[1]), trigger_key(1, reloaded[1]))
+
+    def test_key_changes_with_the_trigger(self):
+        edited = dict(TRIGGERS[1], EVENT_SUMMARY="Doorbell")
+        self.assertNotEqual(trigger_key(1, TRIGGERS[1]), trigger_key(1, edited))
+        self.assertNotEqual(trigger_key(1, TRIGGERS[1]), trigger_key(2, TRIGGERS[1]))
+
+
+
+### MAIN #################################################################################
+if __name__ == "__main__":
+    unittest.main()
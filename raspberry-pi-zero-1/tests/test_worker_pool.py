@@ -0,0 +1,46 @@
+### SECTION :: Module Imports ############################################################
+import os
+import sys
+import unittest
+
+project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_dir)
+
+from utils.worker_pool import POLICY_DROP_OLDEST, CaldavWorkerPool
+
+
+
+### CLASS :: Drop Oldest Policy ##########################################################
+class DropOldestTest(unittest.TestCase):
+    """The drop_oldest policy sheds queued jobs but never the shutdown sentinels."""
+
+    def _noop(self):
+        pass
+
+    def test_sheds_the_oldest_job(self):
+        pool = CaldavWorkerPool(1, 1, POLICY_DROP_OLDEST)
+        self.assertEqual(pool.submit(self._noop, (), "first"), (True, None))
+        accepted, shed_job = pool.submit(self._noop, (), "second")
+        self.assertTrue(accepted)
+        self.assertEqual(shed_job[2], "first")
+        self.assertEqual(pool.stats()['rejected_jobs'], 1)
+
+    def test_offer_never_sheds(self):
+        pool = CaldavWorkerPool(1, 1, POLICY_DROP_OLDEST)
+        self.assertTrue(pool.offer(self._noop, (), "first"))
+        self.assertFalse(pool.offer(self._noop, (), "second"))
+        self.assertEqual(pool._queue.get_nowait()[2], "first")
+        self.assertEqual(pool.stats()['rejected_jobs'], 0)
+
+    def test_keeps_the_shutdown_sentinel(self):
+        pool = CaldavWorkerPool(1, 1, POLICY_DROP_OLDEST)
+        # A sentinel queued by shutdown() while this submit was already past the stopping check
+        pool._queue.put_nowait(None)
+        self.assertEqual(pool.submit(self._noop, (), "late"), (False, None))
+        self.assertIsNone(pool._queue.get_nowait())
+
+
+
+### MAIN #################################################################################
+if __name__ == "__main__":
+    unittest.main()
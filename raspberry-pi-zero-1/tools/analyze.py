@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+VERSION = "20261017.1700"
+
+
+
+### SECTION :: Module Imports ############################################################
+import argparse
+import json
+import os
+import sys
+from collections import defaultdict, deque
+from datetime import datetime
+from itertools import islice
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(script_dir)
+sys.path.insert(0, project_dir)
+
+from utils.log_files import iter_lines_forward, iter_lines_reverse
+from utils.log_parser import parse_line
+
+
+
+### SECTION :: Configuration #############################################################
+LOG_FILE_PATH = os.path.join(project_dir, "logs", "mqtt2caldav.log")
+DEFAULT_ENTRIES_PER_DEVICE = 5
+DEFAULT_CREATED_EVENTS = 3
+# Pending Event Actioned lines kept per topic while waiting for the CalDAV result
+MAX_PENDING_PER_TOPIC = 100
+bar_char_filled = '▓'	# ░ ▒ ▓ █
+bar_char_empty = '░'	# ░ ▒ ▓ █
+
+
+
+### SECTION :: Line Matching #############################################################
+ERROR_LEVELS = ("warn", "error", "crit")
+COMPLETED_TITLES = ("Event Created", "Event Extended", "Event Deleted")
+
+
+
+### CLASS :: Log Analyzer ################################################################
+class LogAnalyzer:
+    """Collects every report from log lines fed to it in chronological order."""
+
+    def __init__(self, entries_per_device: int, created_events: int):
+        self.entries_per_device = entries_per_device
+        self.lines = 0
+        self.parsed_lines = 0
+        self.battery = defaultdict(lambda: deque(maxlen=entries_per_device))
+        self.linkquality = defaultdict(lambda: deque(maxlen=entries_per_device))
+        self.created = deque(maxlen=created_events)
+        self.topic_messages = defaultdict(int)
+        self.topic_first = {}
+        self.topic_last = {}
+        self.errors_by_level = defaultdict(int)
+        self.errors_by_title = defaultdict(int)
+        self.pending = defaultdict(deque)
+        self.latencies_ms = defaultdict(list)
+
+    def feed(self, line: str) -> None:
+        """Parses one log line and updates all reports."""
+        self.lines += 1
+        entry = parse_line(line)
+        if entry is None:
+            return
+        self.parsed_lines += 1
+        level, timestamp, millis, title = entry.level, entry.timestamp, entry.millis, entry.event
+
+        if level in ERROR_LEVELS:
+            self.errors_by_level[level] += 1
+            self.errors_by_title[title] += 1
+
+        if title == "Event Received":
+            topic = entry.get('topic')
+            if topic is None:
+                return
+            self.topic_messages[topic] += 1
+            if topic not in self.topic_first:
+                self.topic_first[topic] = timestamp
+            self.topic_last[topic] = timestamp
+            self._reading(self.battery, topic, timestamp, entry.get('battery'))
+            self._reading(self.linkquality, topic, timestamp, entry.get('linkquality'))
+
+        elif title == "Event Actioned":
+            pending = self.pending[entry.get('topic')]
+            pending.append((entry.get('event_mode', 'unknown'), _epoch_ms(timestamp, millis)))
+            if len(pending) > MAX_PENDING_PER_TOPIC:
+                pending.popleft()
+
+        elif title in COMPLETED_TITLES or title.startswith("Event Create Error") or title.startswith("Event Delete Error"):
+            pending = self.pending.get(entry.get('topic'))
+            event_path = entry.get('event_path')
+            if title == "Event Created" and event_path is not None:
+                self.created.append((timestamp, event_path))
+            if not pending:
+                return
+            # Errors only end a job once all attempts are used up
+            if title not in COMPLETED_TITLES and entry.get('reason') != "Failed after max attempts":
+                return
+            event_mode, started_ms = pending.popleft()
+            if title in COMPLETED_TITLES:
+                self.latencies_ms[event_mode].append(_epoch_ms(timestamp, millis) - started_ms)
+
+    @staticmethod
+    def _reading(readings, topic: str, timestamp: str, value) -> None:
+        # Whole numbers only, like the per-report tools
+        if isinstance(value, int) or (isinstance(value, str) and value.isdigit()):
+            readings[topic].append((timestamp, int(value)))
+
+    def report(self) -> dict:
+        """Returns all reports as one JSON-serializable dict."""
+        topic_rates = {}
+        for topic, count in sorted(self.topic_messages.items(), key=lambda item: -item[1]):
+            span_seconds = (_parse_timestamp(self.topic_last[topic]) - _parse_timestamp(self.topic_first[topic])).total_seconds()
+            topic_rates[topic] = {
+                "messages": count,
+                "first_seen": self.topic_first[topic],
+                "last_seen": self.topic_last[topic],
+                "messages_per_hour": round(count / span_seconds * 3600, 2) if span_seconds > 0 else None
+            }
+        return {
+            "lines": self.lines,
+            "parsed_lines": self.parsed_lines,
+            "battery": {topic: list(readings) for topic, readings in sorted(self.battery.items())},
+            "linkquality": {topic: list(readings) for topic, readings in sorted(self.linkquality.items())},
+            "created_events": [{"timestamp": timestamp, "event_path": path} for timestamp, path in reversed(self.created)],
+            "topic_rates": topic_rates,
+            "errors": {"by_level": dict(self.errors_by_level), "by_title": dict(sorted(self.errors_by_title.items(), key=lambda item: -item[1]))},
+            "caldav_latency_ms": {event_mode: _distribution(values) for event_mode, values in sorted(self.latencies_ms.items())}
+        }
+
+
+
+### FUNCTION :: Time Helpers #############################################################
+def _parse_timestamp(timestamp: str) -> datetime:
+    return datetime(int(timestamp[0:4]), int(timestamp[5:7]), int(timestamp[8:10]),
+                    int(timestamp[11:13]), int(timestamp[14:16]), int(timestamp[17:19]))
+
+
+def _epoch_ms(timestamp: str, millis: str) -> int:
+    return int(_parse_timestamp(timestamp).timestamp() * 1000) + int(millis)
+
+
+def _distribution(values: list) -> dict:
+    """Returns count, percentiles and max of latency samples."""
+    ordered = sorted(values)
+    def percentile(fraction):
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+    return {"count": len(ordered), "p50": percentile(0.5), "p90": percentile(0.9), "p99": percentile(0.99), "max": ordered[-1]}
+
+
+
+### FUNCTION :: Text Output ##############################################################
+def create_ascii_bar(value, filled_char, empty_char, max_level, bar_width=25):
+    """Generates a simple text-based bar for a reading."""
+    percentage = max(0, min(1, value / max_level))
+    filled_chars = int(percentage * bar_width)
+    return f"0 {filled_char * filled_chars}{empty_char * (bar_width - filled_chars)} {max_level}"
+
+
+def print_report(report: dict) -> None:
+    """Prints all reports as text."""
+    print(f"[LOG] {report['parsed_lines']} of {report['lines']} lines parsed")
+
+    for section, label, unit, max_level in (("battery", "Battery", "%", 100), ("linkquality", "Link Quality", "", 255)):
+        print(f"\n[{label.upper()}]")
+        if not report[section]:
+            print("  No readings found.")
+        topic_width = max((len(topic) for topic in report[section]), default=0) + 2
+        for topic, readings in report[section].items():
+            for timestamp, value in readings:
+                print(f"  {timestamp} | {topic.ljust(topic_width)} | {f'{label}: {value}{unit}'.ljust(18)} | {create_ascii_bar(value, bar_char_filled, bar_char_empty, max_level)}")
+
+    print("\n[CREATED EVENTS]")
+    for created in report['created_events']:
+        print(f"  {created['timestamp']} | {created['event_path']}")
+
+    print("\n[TOPIC RATES]")
+    for topic, rate in report['topic_rates'].items():
+        per_hour = f"{rate['messages_per_hour']:.1f}/h" if rate['messages_per_hour'] is not None else "-"
+        print(f"  {rate['messages']:>8} msgs | {per_hour:>10} | {topic}")
+
+    print("\n[ERRORS]")
+    print("  " + ", ".join(f"{level}={count}" for level, count in report['errors']['by_level'].items()) if report['errors']['by_level'] else "  None")
+    for title, count in report['errors']['by_title'].items():
+        print(f"  {count:>8} | {title}")
+
+    print("\n[CALDAV LATENCY]")
+    if not report['caldav_latency_ms']:
+        print("  No completed CalDAV jobs found.")
+    for event_mode, stats in report['caldav_latency_ms'].items():
+        print(f"  {event_mode:<7} count={stats['count']} p50={stats['p50']}ms p90={stats['p90']}ms p99={stats['p99']}ms max={stats['max']}ms")
+
+
+
+### FUNCTION :: Analyze Log ##############################################################
+def analyze(log_path: str, last_lines: int = 0, entries_per_device: int = DEFAULT_ENTRIES_PER_DEVICE,
+            created_events: int = DEFAULT_CREATED_EVENTS) -> dict:
+    """Runs all reports in one pass over the log file and its archives, optionally over the last lines only."""
+    analyzer = LogAnalyzer(entries_per_device, created_events)
+    if last_lines:
+        lines = reversed(list(islice(iter_lines_reverse(log_path), last_lines)))
+    else:
+        lines = iter_lines_forward(log_path)
+    for line in lines:
+        analyzer.feed(line)
+    return analyzer.report()
+
+
+
+### MAIN #################################################################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Single-pass mqtt2caldav log analysis")
+    parser.add_argument("log_file", nargs="?", default=LOG_FILE_PATH, help="log file, rotated archives are included")
+    parser.add_argument("--lines", type=int, default=0, help="analyze only the last N lines (default: all)")
+    parser.add_argument("--entries", type=int, default=DEFAULT_ENTRIES_PER_DEVICE, help="readings per device")
+    parser.add_argument("--created", type=int, default=DEFAULT_CREATED_EVENTS, help="created events to list")
+    parser.add_argument("--json", action="store_true", help="print the reports as JSON")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.log_file):
+        print(f"\n[ERROR] Log file not found at '{args.log_file}'", file=sys.stderr)
+        sys.exit(1)
+
+    analysis = analyze(args.log_file, args.lines, args.entries, args.created)
+    if args.json:
+        print(json.dumps(analysis, indent=2))
+    else:
+        print_report(analysis)
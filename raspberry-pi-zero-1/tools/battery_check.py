@@ -1,11 +1,20 @@
 #!/usr/bin/env python3
-VERSION = "20250903.1207"
+VERSION = "20261017.1400"
 
 
 
 ### SECTION :: Module Imports ############################################################
+import os
 import sys
 from collections import defaultdict
+from itertools import islice
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(script_dir)
+sys.path.insert(0, project_dir)
+
+from utils.log_files import iter_lines_reverse, log_paths
+from utils.log_parser import parse_line
 
 
 
@@ -49,31 +58,34 @@ else:
 devices = defaultdict(list)
 
 try:
-    with open(log_file_path, 'r') as f:
-        all_lines = f.readlines()
-        last_lines = all_lines[-log_lines_to_check:]
+    # Read newest lines first across the log file and its rotated archives
+    if not log_paths(log_file_path):
+        raise FileNotFoundError(log_file_path)
 
-    for line in reversed(last_lines):
-        if "[APP] Event Received |" in line and "battery='" in line:
+    for line in islice(iter_lines_reverse(log_file_path), log_lines_to_check):
+        if "Event Received" in line and "battery" in line:
             try:
+                entry = parse_line(line)
+                if entry is None or entry.prefix != "[APP]" or entry.event != "Event Received":
+                    continue
+
                 # Extract timestamp
-                parts = line.split()
-                timestamp = f"{parts[1]} {parts[2]}"
+                timestamp = f"{entry.timestamp}.{entry.millis}"
 
                 # Extract friendly name from MQTT topic
-                topic_part = line.split("mqtt_topic='mqtt/")[1]
-                friendly_name = topic_part.split("'")[0]
-                
+                topic = str(entry.get('topic', ''))
+                if not topic.startswith("mqtt/"):
+                    continue
+                friendly_name = topic[len("mqtt/"):]
+
                 # Extract battery value
-                battery_part = line.split("battery='")[1]
-                battery_value_str = battery_part.split("'")[0]
-                battery_value = int(battery_value_str)
+                battery_value = int(entry.get('battery'))
 
                 # Store the latest readings for this device
                 if len(devices[friendly_name]) < entries_to_show:
                     devices[friendly_name].append((timestamp, battery_value))
 
-            except (IndexError, ValueError):
+            except (IndexError, TypeError, ValueError):
                 continue
 
 except FileNotFoundError:
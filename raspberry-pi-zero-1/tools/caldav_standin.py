@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+VERSION = "20261017.2100"
+
+
+
+### SECTION :: Module Imports ############################################################
+import argparse
+import json
+import os
+import sys
+import time
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(script_dir)
+sys.path.insert(0, project_dir)
+
+from utils.caldav_standin import DEFAULT_CALENDARS, DEFAULT_FAULT_METHODS, CaldavStandin, FaultProfile
+
+
+
+### SECTION :: Configuration #############################################################
+DEFAULT_PORT = 5232
+STATS_INTERVAL_SECONDS = 10
+
+
+
+### MAIN #################################################################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="In-memory CalDAV stand-in server with fault injection")
+    parser.add_argument("--address", default="127.0.0.1", help="listen address")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"listen port, 0 picks a free port (default: {DEFAULT_PORT})")
+    parser.add_argument("--username", default="user", help="Basic auth username")
+    parser.add_argument("--password", default="password", help="Basic auth password")
+    parser.add_argument("--calendar", action="append", help=f"calendar name, repeatable (default: {', '.join(DEFAULT_CALENDARS)})")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="delay added to every faulted request")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="random delay of up to this added to the latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests answered with an error status")
+    parser.add_argument("--error-status", type=int, action="append", help="error status, repeatable, e.g. 401, 404, 429, 503 (default: 503)")
+    parser.add_argument("--reset-rate", type=float, default=0.0, help="share of requests answered by resetting the connection")
+    parser.add_argument("--retry-after", type=float, help="Retry-After seconds sent with 429 and 503")
+    parser.add_argument("--methods", default=",".join(DEFAULT_FAULT_METHODS), help="comma separated methods faults apply to")
+    parser.add_argument("--outage-after", type=float, help="start an outage after this many seconds")
+    parser.add_argument("--outage-seconds", type=float, default=60.0, help="length of the outage")
+    parser.add_argument("--quiet", action="store_true", help="print stats on exit only")
+    args = parser.parse_args()
+
+    faults = FaultProfile(args.latency_ms, args.jitter_ms, args.error_rate, args.error_status or (503,), args.reset_rate,
+                          args.retry_after, [method.strip() for method in args.methods.split(",") if method.strip()])
+    standin = CaldavStandin(args.username, args.password, args.calendar or DEFAULT_CALENDARS, faults)
+    base_url = standin.start(args.address, args.port)
+    print(f"CALDAV_SERVER_ADDRESS: {base_url}")
+    for calendar_name in args.calendar or DEFAULT_CALENDARS:
+        print(f"EVENT_CALENDAR:        {standin.calendar_url(calendar_name)}")
+
+    started = time.monotonic()
+    outage_pending = args.outage_after is not None
+    try:
+        while True:
+            time.sleep(1 if outage_pending else STATS_INTERVAL_SECONDS)
+            if outage_pending and time.monotonic() - started >= args.outage_after:
+                standin.outage(args.outage_seconds)
+                outage_pending = False
+                print(f"Outage started for {args.outage_seconds:g}s")
+            elif not args.quiet and not outage_pending:
+                print(json.dumps(standin.stats()))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        standin.stop()
+        print(json.dumps(standin.stats(), indent=2))
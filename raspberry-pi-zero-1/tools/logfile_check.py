@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-VERSION = "20250902.0950"
+VERSION = "20261017.1500"
 
 
 
@@ -21,6 +21,10 @@ script_dir = os.path.dirname(os.path.abspath(__file__))
 project_dir = os.path.dirname(script_dir)
 config_dir = os.path.join(project_dir, "config")
 sys.path.insert(0, config_dir)
+sys.path.insert(0, project_dir)
+
+from utils.log_files import iter_lines_reverse, log_paths
+from utils.log_parser import parse_line
 
 
 
@@ -59,26 +63,30 @@ except json.JSONDecodeError:
 def get_ics_urls_and_timestamps_from_log(log_file, num_urls):
     entries = []
     try:
-        with open(log_file, 'r') as f:
-            lines = f.readlines()
-            for line in reversed(lines):
-                match = re.search(r"(\d{4}-\d{2}-\d{2}\s\d{2}:\d{2}:\d{2}).*Event Created.*event_path='(https?://[^']+\.ics)'", line)
-                if match:
-                   date_time_str = match.group(1)
-                   url = match.group(2)
-                    # Normalize the URL: remove leading/trailing whitespace
-                   url = url.strip()
-
-                   try:
-                       result = urlparse(url)
-                       if all([result.scheme, result.netloc]):
-                          entries.append((url, date_time_str))
-                          if len(entries) >= num_urls:
-                              break
-                   except Exception as e:
-                      print(f"  Error: Invalid URL format: {url} ({e})", file=sys.stderr)
-                      continue
-            return entries
+        # Read newest lines first across the log file and its rotated archives
+        if not log_paths(log_file):
+            raise FileNotFoundError(log_file)
+        for line in iter_lines_reverse(log_file, contains="Event Created"):
+            entry = parse_line(line)
+            if entry is None or entry.event != "Event Created":
+                continue
+            event_path = str(entry.get('event_path', ''))
+            if re.match(r"https?://\S+\.ics$", event_path):
+               date_time_str = entry.timestamp
+               url = event_path
+                # Normalize the URL: remove leading/trailing whitespace
+               url = url.strip()
+
+               try:
+                   result = urlparse(url)
+                   if all([result.scheme, result.netloc]):
+                      entries.append((url, date_time_str))
+                      if len(entries) >= num_urls:
+                          break
+               except Exception as e:
+                  print(f"  Error: Invalid URL format: {url} ({e})", file=sys.stderr)
+                  continue
+        return entries
     except FileNotFoundError:
         print(f"  Error: Log file not found: {log_file}", file=sys.stderr)
         return []
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+VERSION = "20261017.1800"
+
+
+
+### SECTION :: Module Imports ############################################################
+import argparse
+import json
+import os
+import sys
+from datetime import datetime
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(script_dir)
+sys.path.insert(0, project_dir)
+
+from utils.constants import TELEMETRY_PATH
+from utils.telemetry_store import TelemetryStore
+
+
+
+### SECTION :: Configuration #############################################################
+DEFAULT_FIELD = "battery"
+DEFAULT_READINGS_PER_DEVICE = 5
+
+
+
+### FUNCTION :: Format Timestamp #########################################################
+def format_timestamp(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M:%S')
+
+
+
+### FUNCTION :: Query Store ##############################################################
+def query(store: TelemetryStore, args) -> dict:
+    """Runs the query selected on the command line."""
+    if args.below is not None:
+        return {"field": args.field, "below": args.below,
+                "devices": [{"mqtt_topic": topic, "timestamp": format_timestamp(ts), "value": value} for topic, ts, value in store.below(args.field, args.below)]}
+    if args.hourly:
+        return {"field": args.field, "mqtt_topic": args.hourly,
+                "hours": [{**row, "hour_start": format_timestamp(row['hour_start'])} for row in store.hourly(args.hourly, args.field)]}
+    return {"field": args.field,
+            "readings": {topic: [{"timestamp": format_timestamp(ts), "value": value} for ts, value in readings]
+                         for topic, readings in store.last_readings(args.field, args.last).items()}}
+
+
+
+### FUNCTION :: Text Output ##############################################################
+def print_result(result: dict) -> None:
+    """Prints a query result as text."""
+    if "devices" in result:
+        print(f"[{result['field'].upper()} BELOW {result['below']:g}]")
+        if not result['devices']:
+            print("  No devices found.")
+        for device in result['devices']:
+            print(f"  {device['timestamp']} | {device['mqtt_topic']} | {device['value']:g}")
+    elif "hours" in result:
+        print(f"[{result['field'].upper()} HOURLY] {result['mqtt_topic']}")
+        if not result['hours']:
+            print("  No readings found.")
+        for hour in result['hours']:
+            print(f"  {hour['hour_start']} | count={hour['count']} min={hour['min']:g} avg={hour['avg']:.1f} max={hour['max']:g}")
+    else:
+        print(f"[{result['field'].upper()}]")
+        if not result['readings']:
+            print("  No readings found.")
+        topic_width = max((len(topic) for topic in result['readings']), default=0) + 2
+        for topic, readings in result['readings'].items():
+            for reading in readings:
+                print(f"  {reading['timestamp']} | {topic.ljust(topic_width)} | {reading['value']:g}")
+
+
+
+### MAIN #################################################################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Query the mqtt2caldav telemetry store")
+    parser.add_argument("field", nargs="?", default=DEFAULT_FIELD, help=f"payload field (default: {DEFAULT_FIELD})")
+    parser.add_argument("--last", type=int, default=DEFAULT_READINGS_PER_DEVICE, help="readings per device")
+    parser.add_argument("--below", type=float, help="list devices whose latest reading is under this value")
+    parser.add_argument("--hourly", metavar="MQTT_TOPIC", help="hourly min, average and max of one device")
+    parser.add_argument("--db", default=TELEMETRY_PATH, help="telemetry store file")
+    parser.add_argument("--json", action="store_true", help="print the result as JSON")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        print(f"\n[ERROR] Telemetry store not found at '{args.db}', enable TELEMETRY_STORE in settings.json", file=sys.stderr)
+        sys.exit(1)
+
+    telemetry_store = TelemetryStore(args.db, read_only=True)
+    try:
+        result = query(telemetry_store, args)
+    finally:
+        telemetry_store.close()
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print_result(result)
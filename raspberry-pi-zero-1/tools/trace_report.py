@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+VERSION = "20261017.2000"
+
+
+
+### SECTION :: Module Imports ############################################################
+import argparse
+import json
+import os
+import sys
+from collections import defaultdict
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(script_dir)
+sys.path.insert(0, project_dir)
+
+from utils.constants import TRACE_PATH
+from utils.log_files import iter_lines_forward
+
+
+
+### SECTION :: Configuration #############################################################
+TOTAL_STAGE = "total"
+
+
+
+### FUNCTION :: Collect Stage Timings ####################################################
+def collect(trace_path: str, topic: str = None, event_mode: str = None) -> dict:
+    """Reads the trace file and its archives and returns the timings of each stage in pipeline order."""
+    stages = {}
+    totals = []
+    outcomes = defaultdict(int)
+    traces = 0
+    for line in iter_lines_forward(trace_path):
+        try:
+            trace = json.loads(line)
+        except ValueError:
+            # Last line cut short by a crash
+            continue
+        if topic and trace.get('topic') != topic:
+            continue
+        if event_mode and trace.get('event_mode') != event_mode:
+            continue
+        traces += 1
+        outcomes[trace.get('outcome')] += 1
+
+        # Stages Repeat When a Job Is Parked or Retried, Count Them Once per Trace
+        trace_stages = {}
+        for stage, duration_ms in trace.get('spans', []):
+            trace_stages[stage] = trace_stages.get(stage, 0.0) + duration_ms
+        for stage, duration_ms in trace_stages.items():
+            stages.setdefault(stage, []).append(duration_ms)
+        totals.append(trace.get('total_ms', 0.0))
+
+    report = {"traces": traces, "outcomes": dict(outcomes), "stages": {stage: summarize(values) for stage, values in stages.items()}}
+    if totals:
+        report["stages"][TOTAL_STAGE] = summarize(totals)
+    return report
+
+
+
+### FUNCTION :: Percentiles ##############################################################
+def summarize(values: list) -> dict:
+    """Returns the count and p50/p95/p99 of a list of milliseconds."""
+    ordered = sorted(values)
+
+    def percentile(fraction):
+        return round(ordered[min(len(ordered) - 1, int(fraction * len(ordered)))], 3)
+    return {"count": len(ordered), "p50": percentile(0.5), "p95": percentile(0.95), "p99": percentile(0.99)}
+
+
+
+### FUNCTION :: Text Output ##############################################################
+def print_report(report: dict) -> None:
+    """Prints the stage table."""
+    print(f"[TRACES] {report['traces']} | " + ", ".join(f"{outcome}={count}" for outcome, count in sorted(report['outcomes'].items(), key=lambda item: str(item[0]))))
+    if not report['stages']:
+        print("  No traces found.")
+        return
+    stage_width = max(len(stage) for stage in report['stages']) + 2
+    print(f"  {'stage'.ljust(stage_width)} {'count':>7} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10}")
+    for stage, summary in report['stages'].items():
+        print(f"  {stage.ljust(stage_width)} {summary['count']:>7} {summary['p50']:>10.3f} {summary['p95']:>10.3f} {summary['p99']:>10.3f}")
+
+
+
+### MAIN #################################################################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Per-stage latency percentiles of mqtt2caldav message traces")
+    parser.add_argument("trace_file", nargs="?", default=TRACE_PATH, help="trace file, rotated archives are included")
+    parser.add_argument("--topic", help="only traces of this MQTT topic")
+    parser.add_argument("--event-mode", choices=("create", "extend", "delete"), help="only traces of this event mode")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.trace_file):
+        print(f"\n[ERROR] Trace file not found at '{args.trace_file}', set TRACE_SAMPLE_RATE in settings.json", file=sys.stderr)
+        sys.exit(1)
+
+    trace_report = collect(args.trace_file, args.topic, args.event_mode)
+    if args.json:
+        print(json.dumps(trace_report, indent=2))
+    else:
+        print_report(trace_report)
@@ -0,0 +1,245 @@
+### SECTION :: Module Imports ############################################################
+import re
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+
+import caldav
+import requests
+from caldav.lib import error as caldav_error
+from caldav.lib.error import DAVError, NotFoundError
+from requests.adapters import HTTPAdapter
+
+# caldav 2 and later send requests through a niquests session
+try:
+    import niquests
+    from niquests.adapters import HTTPAdapter as NiquestsHTTPAdapter
+except ImportError:
+    niquests = None
+
+# Network errors of either HTTP library
+REQUEST_EXCEPTIONS = (requests.exceptions.RequestException,) + ((niquests.exceptions.RequestException,) if niquests is not None else ())
+
+
+
+### SECTION :: Retryable Server Responses ################################################
+# caldav 2 and later raise RateLimitError for 429 and for 503 with Retry-After
+CaldavRateLimitError = getattr(caldav_error, 'RateLimitError', None)
+STATUS_PATTERN = re.compile(r'\s*(\d{3})\b')
+
+
+def is_retryable_status(status: Optional[int]) -> bool:
+    """Returns True for 429 Too Many Requests and 5xx server errors."""
+    return status is not None and (status == 429 or 500 <= status <= 599)
+
+
+
+### FUNCTION :: Parse Retry-After Header #################################################
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Returns the Retry-After header value in seconds, given as seconds or an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+
+### CLASS :: Retryable Server Error ######################################################
+class RetryableServerError(DAVError):
+    """Raised for 429 and 5xx responses, carrying the server's Retry-After."""
+
+    def __init__(self, message: str, status: Optional[int], retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+
+### FUNCTION :: Classify Server Errors ###################################################
+def retryable_server_error(error: Exception) -> Optional[RetryableServerError]:
+    """Returns error as a RetryableServerError if it reports a 429 or 5xx response, otherwise None.
+
+    The registry raises RetryableServerError itself. caldav's save_event() and delete()
+    raise a plain DAVError whose reason starts with the status, and caldav 2 and later
+    raise RateLimitError with the parsed Retry-After.
+    """
+    if isinstance(error, RetryableServerError):
+        return error
+    if CaldavRateLimitError is not None and isinstance(error, CaldavRateLimitError):
+        return RetryableServerError(str(error), None, getattr(error, 'retry_after_seconds', None))
+    if isinstance(error, DAVError):
+        # caldav passes "<status> <reason>" as the first argument, which ends up in url
+        for text in (error.url, error.reason):
+            match = STATUS_PATTERN.match(str(text or ''))
+            if match and is_retryable_status(int(match.group(1))):
+                return RetryableServerError(str(error), int(match.group(1)))
+    return None
+
+
+
+### CLASS :: Event Changed Error #########################################################
+class EventChangedError(DAVError):
+    """Raised when a conditional PUT finds the event changed on the server (412)."""
+
+
+
+### CLASS :: CalDAV Client Registry ######################################################
+class CaldavClientRegistry:
+    """Thread-safe owner of the shared CalDAV client, its HTTP session and calendar handles.
+
+    The client keeps one HTTP session with a connection pool sized for the worker
+    threads, so PUT and DELETE requests reuse keep-alive connections. timeout is
+    passed to every client and applies to each request of either HTTP library. Calendar objects
+    are cached per EVENT_CALENDAR URL. reconnect() swaps in a fresh client without
+    principal or calendar discovery, and only once for all workers that saw the same
+    failing client.
+    """
+
+    def __init__(self, server_address: str, username: str, password: str, pool_size: int = 2,
+                 client: Optional[caldav.DAVClient] = None, timeout: Optional[float] = None):
+        self.server_address = server_address
+        self.username = username
+        self.password = password
+        self.pool_size = max(1, int(pool_size))
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._calendars: Dict[str, caldav.Calendar] = {}
+        self._reconnect_count = 0
+        self._request_counter = threading.local()
+        self._client = self._prepare(client if client is not None else self._new_client())
+
+    def _new_client(self) -> caldav.DAVClient:
+        """Creates a client. No request is sent until the first calendar operation."""
+        return caldav.DAVClient(url=self.server_address, username=self.username, password=self.password, timeout=self.timeout)
+
+    def _prepare(self, client: caldav.DAVClient) -> caldav.DAVClient:
+        """Sizes the keep-alive connection pool of the client session and counts its requests.
+
+        The adapter has to come from the same library as the session, niquests refuses
+        requests adapters. Sessions of any other type keep their default pool. A client
+        created without a timeout gets the registry's, DAVClient passes it to each request.
+        """
+        if self.timeout is not None and getattr(client, 'timeout', None) is None:
+            client.timeout = self.timeout
+        session = getattr(client, 'session', None)
+        adapter_class = None
+        if isinstance(session, requests.Session):
+            adapter_class = HTTPAdapter
+        elif niquests is not None and isinstance(session, niquests.Session):
+            adapter_class = NiquestsHTTPAdapter
+        if adapter_class is not None:
+            adapter = adapter_class(pool_connections=1, pool_maxsize=self.pool_size)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+        if session is not None and isinstance(getattr(session, 'hooks', None), dict):
+            session.hooks.setdefault('response', []).append(self._count_response)
+        return client
+
+    def _count_response(self, response, *args, **kwargs):
+        """Session response hook counting HTTP requests made by the current thread."""
+        self._request_counter.count = getattr(self._request_counter, 'count', 0) + 1
+        return response
+
+    def reset_request_count(self) -> None:
+        """Starts counting HTTP requests for the current thread from zero."""
+        self._request_counter.count = 0
+
+    def request_count(self) -> int:
+        """Returns the HTTP requests made by the current thread since the last reset."""
+        return getattr(self._request_counter, 'count', 0)
+
+    @property
+    def client(self) -> caldav.DAVClient:
+        """Returns the current client."""
+        with self._lock:
+            return self._client
+
+    def calendar(self, calendar_url: str) -> caldav.Calendar:
+        """Returns the cached calendar handle for a URL, creating it on first use."""
+        with self._lock:
+            event_calendar = self._calendars.get(calendar_url)
+            if event_calendar is None:
+                event_calendar = caldav.Calendar(client=self._client, url=calendar_url)
+                self._calendars[calendar_url] = event_calendar
+            return event_calendar
+
+    def reconnect(self, failed_client: Optional[caldav.DAVClient] = None) -> caldav.DAVClient:
+        """Replaces the client after a failure and returns the one to retry with.
+
+        If another worker already replaced failed_client, the current client is returned
+        as is, so concurrent retries do not each open a new session.
+        """
+        with self._lock:
+            if failed_client is None or failed_client is self._client:
+                # The stale session is left to other workers still using it
+                self._client = self._prepare(self._new_client())
+                self._calendars.clear()
+                self._reconnect_count += 1
+            return self._client
+
+    def put_event(self, client: caldav.DAVClient, calendar_url: str, uid: str, payload: str) -> str:
+        """PUTs an event straight to <calendar>/<uid>.ics and returns its URL.
+
+        If-None-Match: * makes the write create-only, so a replayed job whose first PUT
+        already succeeded gets 412 and is treated as done. The object is not fetched back.
+        """
+        return self.put_event_tagged(client, calendar_url, uid, payload)[0]
+
+    def put_event_tagged(self, client: caldav.DAVClient, calendar_url: str, uid: str, payload: str) -> Tuple[str, Optional[str]]:
+        """Same as put_event(), but also returns the ETag the server sent for the new object, if any."""
+        event_url = f"{str(calendar_url).rstrip('/')}/{uid}.ics"
+        response = client.put(event_url, payload, {"Content-Type": "text/calendar; charset=utf-8", "If-None-Match": "*"})
+        if response.status in (201, 204):
+            return event_url, self._etag(response)
+        if response.status == 412:
+            return event_url, None
+        self._raise_for_status("PUT", event_url, response)
+
+    def update_event(self, client: caldav.DAVClient, event_url: str, payload: str, etag: str) -> Optional[str]:
+        """Replaces an event only if it still has the given ETag and returns the new ETag, if sent.
+
+        Raises EventChangedError when the object was changed or replaced on the server.
+        """
+        response = client.put(event_url, payload, {"Content-Type": "text/calendar; charset=utf-8", "If-Match": etag})
+        if response.status in (200, 201, 204):
+            return self._etag(response)
+        if response.status == 412:
+            raise EventChangedError(f"PUT {event_url} returned 412")
+        self._raise_for_status("PUT", event_url, response)
+
+    @staticmethod
+    def _etag(response) -> Optional[str]:
+        """Returns the ETag header of a response. Weak ETags cannot be used with If-Match."""
+        headers = getattr(response, 'headers', None) or {}
+        etag = headers.get('ETag')
+        if not etag or etag.startswith('W/'):
+            return None
+        return etag
+
+    def delete_event(self, client: caldav.DAVClient, event_url: str) -> None:
+        """Sends a DELETE for an event URL."""
+        response = client.delete(event_url)
+        if response.status in (200, 202, 204):
+            return
+        self._raise_for_status("DELETE", event_url, response)
+
+    def _raise_for_status(self, method: str, url: str, response) -> None:
+        """Maps an unsuccessful CalDAV response to the matching exception."""
+        if response.status == 404:
+            raise NotFoundError(f"{method} {url} returned 404")
+        if is_retryable_status(response.status):
+            headers = getattr(response, 'headers', None) or {}
+            raise RetryableServerError(f"{method} {url} returned {response.status}", response.status, parse_retry_after(headers.get('Retry-After')))
+        raise DAVError(f"{method} {url} returned {response.status}")
+
+    def stats(self) -> Dict[str, int]:
+        """Returns a snapshot of registry counters."""
+        with self._lock:
+            return {"cached_calendars": len(self._calendars), "reconnect_count": self._reconnect_count}
@@ -0,0 +1,461 @@
+### SECTION :: Module Imports ############################################################
+import base64
+import hashlib
+import random
+import socket
+import struct
+import threading
+import time
+import xml.etree.ElementTree as ElementTree
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+from xml.sax.saxutils import escape
+
+DAV_NS = "DAV:"
+CALDAV_NS = "urn:ietf:params:xml:ns:caldav"
+CALSERVER_NS = "http://calendarserver.org/ns/"
+NAMESPACE_PREFIXES = {DAV_NS: "d", CALDAV_NS: "c", CALSERVER_NS: "cs"}
+DEFAULT_CALENDARS = ("automation", "personal")
+DEFAULT_FAULT_METHODS = ("OPTIONS", "PROPFIND", "REPORT", "GET", "HEAD", "PUT", "DELETE")
+
+
+
+### CLASS :: Fault Profile ###############################################################
+class FaultProfile:
+    """Latency and failures injected into the stand-in's responses.
+
+    Every request of a faulted method waits latency_ms plus up to jitter_ms. Of those,
+    reset_rate are answered by resetting the TCP connection and error_rate with one of
+    error_statuses picked at random. 429 and 503 responses carry Retry-After when
+    retry_after is set. An outage answers every faulted request with outage_status
+    until it ends.
+    """
+    __slots__ = ("latency_ms", "jitter_ms", "error_rate", "error_statuses", "reset_rate", "retry_after",
+                 "methods", "outage_until", "outage_status")
+
+    def __init__(self, latency_ms: float = 0.0, jitter_ms: float = 0.0, error_rate: float = 0.0,
+                 error_statuses: Iterable[int] = (503,), reset_rate: float = 0.0, retry_after: Optional[float] = None,
+                 methods: Iterable[str] = DEFAULT_FAULT_METHODS):
+        self.latency_ms = max(0.0, float(latency_ms))
+        self.jitter_ms = max(0.0, float(jitter_ms))
+        self.error_rate = min(1.0, max(0.0, float(error_rate)))
+        self.error_statuses = tuple(int(status) for status in error_statuses) or (503,)
+        self.reset_rate = min(1.0, max(0.0, float(reset_rate)))
+        self.retry_after = retry_after
+        self.methods = frozenset(method.upper() for method in methods)
+        self.outage_until = 0.0
+        self.outage_status = 503
+
+
+
+### CLASS :: CalDAV Stand-In #############################################################
+class CaldavStandin:
+    """In-memory CalDAV server for exercising the client code without a real server.
+
+    Serves one user with Basic authentication:
+        /principals/<user>/                 principal
+        /calendars/<user>/                  calendar home
+        /calendars/<user>/<calendar>/       calendars
+        /calendars/<user>/<calendar>/*.ics  events
+    PROPFIND answers the discovery the caldav library does in principal() and
+    calendars(). PUT honors If-None-Match: * and If-Match, REPORT answers
+    calendar-query and calendar-multiget, GET, HEAD and DELETE work on events.
+    Faults are read per request, so set_faults() and outage() apply to a running
+    server. Nothing is persisted.
+    """
+
+    def __init__(self, username: str = "user", password: str = "password", calendars: Iterable[str] = DEFAULT_CALENDARS,
+                 faults: Optional[FaultProfile] = None, auto_create: bool = True):
+        self.username = username
+        self.password = password
+        self.auto_create = auto_create
+        self.faults = faults or FaultProfile()
+        self._lock = threading.Lock()
+        self._calendars: Dict[str, Dict[str, Tuple[str, str]]] = {self.calendar_path(name): {} for name in calendars}
+        self._ctags: Dict[str, int] = {path: 0 for path in self._calendars}
+        self._requests: Dict[str, int] = {}
+        self._statuses: Dict[int, int] = {}
+        self._injected_errors = 0
+        self._injected_resets = 0
+        self._connections = 0
+        self._expected_auth = "Basic " + base64.b64encode(f"{username}:{password}".encode("utf-8")).decode("ascii")
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def principal_path(self) -> str:
+        return f"/principals/{self.username}/"
+
+    @property
+    def home_path(self) -> str:
+        return f"/calendars/{self.username}/"
+
+    def calendar_path(self, name: str) -> str:
+        return f"{self.home_path}{name.strip('/')}/"
+
+    @property
+    def url(self) -> str:
+        """Returns the base URL to use as CALDAV_SERVER_ADDRESS."""
+        if self._server is None:
+            raise RuntimeError("Stand-in not started")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def calendar_url(self, name: str) -> str:
+        """Returns the URL to use as EVENT_CALENDAR."""
+        return self.url.rstrip("/") + self.calendar_path(name)
+
+    def start(self, address: str = "127.0.0.1", port: int = 0) -> str:
+        """Serves from daemon threads and returns the base URL. Port 0 picks a free port."""
+        standin = self
+
+        class StandinRequestHandler(_RequestHandler):
+            server_standin = standin
+
+        self._server = ThreadingHTTPServer((address, int(port)), StandinRequestHandler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name="caldav-standin", daemon=True).start()
+        return self.url
+
+    def stop(self) -> None:
+        """Stops serving and closes the listening socket."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def set_faults(self, **settings) -> None:
+        """Replaces the fault profile, e.g. set_faults(latency_ms=200, error_rate=0.1)."""
+        faults = FaultProfile(**settings)
+        faults.outage_until, faults.outage_status = self.faults.outage_until, self.faults.outage_status
+        self.faults = faults
+
+    def outage(self, seconds: float, status: int = 503) -> None:
+        """Answers every faulted request with status for the next seconds. 0 ends an outage."""
+        self.faults.outage_status = int(status)
+        self.faults.outage_until = time.monotonic() + max(0.0, float(seconds))
+
+    def events(self, calendar: Optional[str] = None) -> Dict[str, str]:
+        """Returns event path to iCalendar text, of one calendar or all."""
+        with self._lock:
+            paths = [self.calendar_path(calendar)] if calendar is not None else list(self._calendars)
+            return {event_path: ical for path in paths for event_path, (_, ical) in self._calendars.get(path, {}).items()}
+
+    def stats(self) -> Dict[str, object]:
+        """Returns request counters per method and status, accepted connections, injected faults and stored events."""
+        with self._lock:
+            return {
+                "requests": dict(self._requests),
+                "connections": self._connections,
+                "statuses": dict(self._statuses),
+                "injected_errors": self._injected_errors,
+                "injected_resets": self._injected_resets,
+                "calendars": len(self._calendars),
+                "events": sum(len(objects) for objects in self._calendars.values())
+            }
+
+    def reset_stats(self) -> None:
+        """Clears request, connection and fault counters, stored events are kept."""
+        with self._lock:
+            self._requests.clear()
+            self._statuses.clear()
+            self._injected_errors = self._injected_resets = self._connections = 0
+
+    def _count_connection(self) -> None:
+        with self._lock:
+            self._connections += 1
+
+    def _count(self, method: str, status: Optional[int]) -> None:
+        with self._lock:
+            self._requests[method] = self._requests.get(method, 0) + 1
+            if status is None:
+                self._injected_resets += 1
+            else:
+                self._statuses[status] = self._statuses.get(status, 0) + 1
+
+    def _pick_fault(self, method: str) -> Tuple[float, Optional[str], Optional[int]]:
+        """Returns the delay in seconds and the fault ("reset" or "status") for one request."""
+        faults = self.faults
+        if method not in faults.methods:
+            return 0.0, None, None
+        delay = (faults.latency_ms + random.random() * faults.jitter_ms) / 1000
+        if faults.outage_until > time.monotonic():
+            with self._lock:
+                self._injected_errors += 1
+            return delay, "status", faults.outage_status
+        if faults.reset_rate and random.random() < faults.reset_rate:
+            return delay, "reset", None
+        if faults.error_rate and random.random() < faults.error_rate:
+            with self._lock:
+                self._injected_errors += 1
+            return delay, "status", random.choice(faults.error_statuses)
+        return delay, None, None
+
+    @staticmethod
+    def _calendar_of(event_path: str) -> str:
+        """Returns the calendar path of an event path."""
+        return event_path.rsplit("/", 1)[0] + "/"
+
+    def _calendar(self, calendar_path: str, create: bool = False) -> Optional[Dict[str, Tuple[str, str]]]:
+        """Returns the objects of a calendar. Caller holds the lock."""
+        objects = self._calendars.get(calendar_path)
+        if objects is None and create and self.auto_create and calendar_path.startswith(self.home_path) \
+                and calendar_path.count("/") == self.home_path.count("/") + 1:
+            objects = self._calendars[calendar_path] = {}
+            self._ctags[calendar_path] = 0
+        return objects
+
+    def put(self, path: str, ical: str, if_match: Optional[str], if_none_match: Optional[str]) -> Tuple[int, Optional[str]]:
+        """Stores an event. Returns the status and the new ETag."""
+        calendar_path = self._calendar_of(path)
+        with self._lock:
+            objects = self._calendar(calendar_path, create=True)
+            if objects is None:
+                return 409, None
+            existing = objects.get(path)
+            if if_none_match == "*" and existing is not None:
+                return 412, None
+            if if_match is not None and (existing is None or (if_match != "*" and if_match != existing[0])):
+                return 412, None
+            etag = '"' + hashlib.sha1(ical.encode("utf-8")).hexdigest()[:16] + '"'
+            objects[path] = (etag, ical)
+            self._ctags[calendar_path] += 1
+            return (204 if existing is not None else 201), etag
+
+    def get(self, path: str) -> Optional[Tuple[str, str]]:
+        """Returns (ETag, iCalendar text) of an event."""
+        with self._lock:
+            return (self._calendars.get(self._calendar_of(path)) or {}).get(path)
+
+    def delete(self, path: str) -> int:
+        """Removes an event or a calendar. Returns the status."""
+        with self._lock:
+            if path in self._calendars:
+                del self._calendars[path]
+                del self._ctags[path]
+                return 204
+            calendar_path = self._calendar_of(path)
+            objects = self._calendars.get(calendar_path)
+            if objects is None or objects.pop(path, None) is None:
+                return 404
+            self._ctags[calendar_path] += 1
+            return 204
+
+    def _resource_props(self, path: str) -> Optional[Dict[str, str]]:
+        """Returns the known properties of a resource as Clark notation name to XML content."""
+        if path in ("/", ""):
+            return {f"{{{DAV_NS}}}resourcetype": "<d:collection/>",
+                    f"{{{DAV_NS}}}current-user-principal": _href(self.principal_path)}
+        principal_props = {f"{{{DAV_NS}}}current-user-principal": _href(self.principal_path),
+                           f"{{{CALDAV_NS}}}calendar-home-set": _href(self.home_path),
+                           f"{{{DAV_NS}}}principal-URL": _href(self.principal_path)}
+        if path == self.principal_path:
+            return {f"{{{DAV_NS}}}resourcetype": "<d:principal/>",
+                    f"{{{DAV_NS}}}displayname": escape(self.username), **principal_props}
+        if path == self.home_path:
+            return {f"{{{DAV_NS}}}resourcetype": "<d:collection/>", **principal_props}
+        with self._lock:
+            if path in self._calendars:
+                return {f"{{{DAV_NS}}}resourcetype": "<d:collection/><c:calendar/>",
+                        f"{{{DAV_NS}}}displayname": escape(path.rstrip("/").rsplit("/", 1)[-1]),
+                        f"{{{CALDAV_NS}}}supported-calendar-component-set": '<c:comp name="VEVENT"/>',
+                        f"{{{CALSERVER_NS}}}getctag": str(self._ctags[path]),
+                        f"{{{DAV_NS}}}getetag": f'"{self._ctags[path]}"',
+                        **principal_props}
+            stored = (self._calendars.get(self._calendar_of(path)) or {}).get(path)
+            if stored is not None:
+                return {f"{{{DAV_NS}}}resourcetype": "",
+                        f"{{{DAV_NS}}}getetag": escape(stored[0]),
+                        f"{{{DAV_NS}}}getcontenttype": "text/calendar; charset=utf-8",
+                        f"{{{CALDAV_NS}}}calendar-data": escape(stored[1])}
+        return None
+
+    def _children(self, path: str) -> List[str]:
+        """Returns the paths of the members of a collection."""
+        if path == self.home_path:
+            with self._lock:
+                return sorted(self._calendars)
+        with self._lock:
+            return sorted(self._calendars.get(path, {}))
+
+    def propfind(self, path: str, depth: str, body: bytes) -> Optional[str]:
+        """Returns the multistatus body of a PROPFIND, or None if the resource does not exist."""
+        props = self._resource_props(path)
+        if props is None:
+            return None
+        requested = _requested_props(body)
+        responses = [_propstat_response(path, props, requested)]
+        if depth == "1":
+            for child_path in self._children(path):
+                child_props = self._resource_props(child_path)
+                if child_props is not None:
+                    responses.append(_propstat_response(child_path, child_props, requested))
+        return _multistatus(responses)
+
+    def report(self, path: str, body: bytes) -> Optional[str]:
+        """Returns the multistatus body of a calendar-query or calendar-multiget REPORT."""
+        with self._lock:
+            objects = dict(self._calendars.get(path) or {})
+            if path not in self._calendars:
+                return None
+        try:
+            root = ElementTree.fromstring(body or b"<empty/>")
+        except ElementTree.ParseError:
+            root = ElementTree.Element("empty")
+        requested = _requested_props(body) or [f"{{{DAV_NS}}}getetag", f"{{{CALDAV_NS}}}calendar-data"]
+
+        # Multiget Lists Hrefs, Query Filters on UID Text Matches Only
+        if root.tag == f"{{{CALDAV_NS}}}calendar-multiget":
+            event_paths = [urlsplit(unquote(href.text or "")).path for href in root.iter(f"{{{DAV_NS}}}href")]
+        else:
+            uid_matches = [match.text or "" for prop_filter in root.iter(f"{{{CALDAV_NS}}}prop-filter")
+                           if prop_filter.get("name", "").upper() == "UID" for match in prop_filter.iter(f"{{{CALDAV_NS}}}text-match")]
+            event_paths = [event_path for event_path, (_, ical) in sorted(objects.items())
+                           if all(f"UID:{uid}" in ical for uid in uid_matches)]
+        responses = []
+        for event_path in event_paths:
+            props = self._resource_props(event_path)
+            if props is None:
+                responses.append(f"<d:response>{_href(event_path)}<d:status>HTTP/1.1 404 Not Found</d:status></d:response>")
+            else:
+                responses.append(_propstat_response(event_path, props, requested))
+        return _multistatus(responses)
+
+
+
+### CLASS :: Request Handler #############################################################
+class _RequestHandler(BaseHTTPRequestHandler):
+    """Maps WebDAV requests onto a CaldavStandin, applying its faults first."""
+    protocol_version = "HTTP/1.1"
+    server_standin: CaldavStandin = None
+
+    def setup(self):
+        super().setup()
+        self.server_standin._count_connection()
+
+    def do_OPTIONS(self):
+        self._handle(lambda path, body: (200, {"DAV": "1, 2, 3, calendar-access", "Allow": "OPTIONS, PROPFIND, REPORT, GET, HEAD, PUT, DELETE"}, b""))
+
+    def do_PROPFIND(self):
+        def propfind(path, body):
+            multistatus = self.server_standin.propfind(path, self.headers.get("Depth", "0"), body)
+            if multistatus is None:
+                return 404, {}, b""
+            return 207, {"Content-Type": "application/xml; charset=utf-8"}, multistatus.encode("utf-8")
+        self._handle(propfind)
+
+    def do_REPORT(self):
+        def report(path, body):
+            multistatus = self.server_standin.report(path, body)
+            if multistatus is None:
+                return 404, {}, b""
+            return 207, {"Content-Type": "application/xml; charset=utf-8"}, multistatus.encode("utf-8")
+        self._handle(report)
+
+    def do_GET(self):
+        def get(path, body):
+            stored = self.server_standin.get(path)
+            if stored is None:
+                return 404, {}, b""
+            return 200, {"ETag": stored[0], "Content-Type": "text/calendar; charset=utf-8"}, stored[1].encode("utf-8")
+        self._handle(get)
+
+    def do_HEAD(self):
+        def head(path, body):
+            stored = self.server_standin.get(path)
+            if stored is None:
+                return 404, {}, b""
+            return 200, {"ETag": stored[0], "Content-Type": "text/calendar; charset=utf-8"}, b""
+        self._handle(head)
+
+    def do_PUT(self):
+        def put(path, body):
+            status, etag = self.server_standin.put(path, body.decode("utf-8", errors="replace"), self.headers.get("If-Match"),
+                                                   self.headers.get("If-None-Match"))
+            return status, ({"ETag": etag} if etag else {}), b""
+        self._handle(put)
+
+    def do_DELETE(self):
+        self._handle(lambda path, body: (self.server_standin.delete(path), {}, b""))
+
+    def _handle(self, respond) -> None:
+        standin = self.server_standin
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        delay, fault, fault_status = standin._pick_fault(self.command)
+        if delay:
+            time.sleep(delay)
+
+        # Reset Connection Without Response
+        if fault == "reset":
+            standin._count(self.command, None)
+            self.close_connection = True
+            try:
+                self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+                self.connection.close()
+            except OSError:
+                pass
+            return
+
+        if self.headers.get("Authorization") != standin._expected_auth:
+            status, headers, content = 401, {"WWW-Authenticate": 'Basic realm="mqtt2caldav stand-in"'}, b""
+        elif fault == "status":
+            status, headers, content = fault_status, {}, b""
+            if fault_status == 401:
+                headers["WWW-Authenticate"] = 'Basic realm="mqtt2caldav stand-in"'
+            if fault_status in (429, 503) and standin.faults.retry_after is not None:
+                headers["Retry-After"] = f"{standin.faults.retry_after:g}"
+        else:
+            status, headers, content = respond(urlsplit(unquote(self.path)).path, body)
+        standin._count(self.command, status)
+
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        if content and self.command != "HEAD":
+            self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        # Requests are counted in stats()
+        pass
+
+
+
+### FUNCTION :: Multistatus Rendering ####################################################
+def _href(path: str) -> str:
+    return f"<d:href>{escape(path)}</d:href>"
+
+
+def _requested_props(body: bytes) -> List[str]:
+    """Returns the Clark notation names inside the <prop> of a request body, empty for allprop."""
+    if not body:
+        return []
+    try:
+        root = ElementTree.fromstring(body)
+    except ElementTree.ParseError:
+        return []
+    prop = root.find(f"{{{DAV_NS}}}prop")
+    return [child.tag for child in prop] if prop is not None else []
+
+
+def _element(name: str, content: str) -> str:
+    namespace, _, local_name = name[1:].partition("}")
+    prefix = NAMESPACE_PREFIXES.get(namespace)
+    if prefix is None:
+        return f'<x:{local_name} xmlns:x="{escape(namespace)}">{content}</x:{local_name}>'
+    return f"<{prefix}:{local_name}>{content}</{prefix}:{local_name}>"
+
+
+def _propstat_response(path: str, props: Dict[str, str], requested: List[str]) -> str:
+    names = requested or list(props)
+    found = "".join(_element(name, props[name]) for name in names if name in props)
+    missing = "".join(_element(name, "") for name in names if name not in props)
+    propstats = f"<d:propstat><d:prop>{found}</d:prop><d:status>HTTP/1.1 200 OK</d:status></d:propstat>"
+    if missing:
+        propstats += f"<d:propstat><d:prop>{missing}</d:prop><d:status>HTTP/1.1 404 Not Found</d:status></d:propstat>"
+    return f"<d:response>{_href(path)}{propstats}</d:response>"
+
+
+def _multistatus(responses: List[str]) -> str:
+    namespaces = " ".join(f'xmlns:{prefix}="{namespace}"' for namespace, prefix in NAMESPACE_PREFIXES.items())
+    return f'<?xml version="1.0" encoding="utf-8"?>\n<d:multistatus {namespaces}>{"".join(responses)}</d:multistatus>'
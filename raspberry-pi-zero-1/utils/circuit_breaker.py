@@ -0,0 +1,146 @@
+### SECTION :: Module Imports ############################################################
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from utils import logger
+from utils.retry_scheduler import KIND_TIMER, RetryScheduler
+
+
+
+### SECTION :: Breaker States ############################################################
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+# acquire_or_park() Results
+ADMITTED = "admitted"
+PARKED = "parked"
+BACKLOG_FULL = "backlog_full"
+
+
+
+### CLASS :: Circuit Breaker #############################################################
+class CircuitBreaker:
+    """Process-wide circuit breaker for the CalDAV server.
+
+    Closed: every job runs. After failure_threshold consecutive retryable failures the
+    breaker opens and jobs are parked instead of hitting the server. Once reset_timeout
+    (or a longer Retry-After) has passed, the breaker is half-open and exactly one parked
+    job runs as the probe. Its success closes the breaker and releases the whole backlog,
+    its failure opens the breaker again. The probe and the released backlog are handed
+    over on threads of their own, so their callbacks may wait for room in a full job
+    queue without holding up the scheduler or the worker that reported the success.
+    At most max_parked jobs are held, further jobs are refused and stay in the outbox.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float, scheduler: RetryScheduler, max_parked: int = 1000,
+                 log_prefix: str = "[DAV]"):
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.reset_timeout = max(0.0, float(reset_timeout))
+        self.scheduler = scheduler
+        self.max_parked = max(1, int(max_parked))
+        self.log_prefix = log_prefix
+        self._lock = threading.Lock()
+        self._state = STATE_CLOSED
+        self._consecutive_failures = 0
+        self._open_until = 0.0
+        self._probe_in_flight = False
+        self._probe_started = 0.0
+        self._parked: List[Callable[[], Any]] = []
+        self._open_count = 0
+        self._refused_count = 0
+
+    @property
+    def state(self) -> str:
+        """Returns the current breaker state."""
+        with self._lock:
+            return self._state
+
+    def acquire_or_park(self, callback: Callable[[], Any]) -> str:
+        """Returns ADMITTED if a request may be sent now, PARKED if callback waits until the breaker lets
+        work through, or BACKLOG_FULL if max_parked jobs are already waiting."""
+        with self._lock:
+            if self._state == STATE_CLOSED:
+                return ADMITTED
+            now = time.monotonic()
+            if self._state == STATE_OPEN and now >= self._open_until:
+                self._state = STATE_HALF_OPEN
+                self._probe_in_flight = False
+            if self._state == STATE_HALF_OPEN and not self._probe_pending(now):
+                self._probe_in_flight = True
+                self._probe_started = now
+                # Watchdog in case the probe never reports back, e.g. when it was shed
+                self.scheduler.schedule(self.reset_timeout, self._release_probe, KIND_TIMER)
+                return ADMITTED
+            if len(self._parked) >= self.max_parked:
+                self._refused_count += 1
+                return BACKLOG_FULL
+            self._parked.append(callback)
+            return PARKED
+
+    def _probe_pending(self, now: float) -> bool:
+        """Returns True while a probe is running and has not timed out. Caller holds the lock."""
+        return self._probe_in_flight and now - self._probe_started < self.reset_timeout
+
+    def record_success(self) -> None:
+        """Closes the breaker and releases parked jobs in the order they were parked."""
+        with self._lock:
+            self._consecutive_failures = 0
+            if self._state == STATE_CLOSED:
+                return
+            self._state = STATE_CLOSED
+            self._probe_in_flight = False
+            released, self._parked = self._parked, []
+        if released:
+            threading.Thread(target=self._release_parked, args=(released,), name="caldav-breaker-release", daemon=True).start()
+
+    def _release_parked(self, released: List[Callable[[], Any]]) -> None:
+        """Runs released callbacks one after the other on the release thread."""
+        for callback in released:
+            try:
+                callback()
+
+            # Handle Errors Escaping the Callback
+            except Exception as e:
+                log_data = {"exception_type": type(e).__name__, "details": str(e)}
+                logger.error("%s Breaker Release Error | %s", self.log_prefix, logger.format_log_data(log_data))
+
+    def record_failure(self, retry_after: Optional[float] = None) -> bool:
+        """Counts a retryable failure. Returns True if this failure opened the breaker."""
+        with self._lock:
+            self._consecutive_failures += 1
+            if self._state == STATE_OPEN:
+                return False
+            if self._state == STATE_CLOSED and self._consecutive_failures < self.failure_threshold:
+                return False
+            open_seconds = max(self.reset_timeout, retry_after or 0.0)
+            self._state = STATE_OPEN
+            self._probe_in_flight = False
+            self._open_until = time.monotonic() + open_seconds
+            self._open_count += 1
+        self.scheduler.schedule(open_seconds, self._release_probe, KIND_TIMER)
+        return True
+
+    def _release_probe(self) -> None:
+        """Lets one parked job through once the open period or a stalled probe has timed out."""
+        with self._lock:
+            if self._state == STATE_CLOSED or not self._parked:
+                return
+            if self._state == STATE_HALF_OPEN and self._probe_pending(time.monotonic()):
+                return
+            probe = self._parked.pop(0)
+        # The probe calls acquire_or_park() again, which moves the breaker to half-open. It may
+        # wait for queue space, so it runs on its own thread instead of the scheduler's
+        threading.Thread(target=self._release_parked, args=([probe],), name="caldav-breaker-probe", daemon=True).start()
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns a snapshot of breaker counters."""
+        with self._lock:
+            return {
+                "breaker_state": self._state,
+                "consecutive_failures": self._consecutive_failures,
+                "parked_jobs": len(self._parked),
+                "refused_jobs": self._refused_count,
+                "open_count": self._open_count
+            }
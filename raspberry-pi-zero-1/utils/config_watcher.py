@@ -0,0 +1,75 @@
+### SECTION :: Module Imports ############################################################
+import os
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+
+### CLASS :: Config Watcher ##############################################################
+class ConfigWatcher:
+    """Daemon thread that runs a reload callback on request or when the config files change.
+
+    request() only sets an event, so it is safe to call from a signal handler while the
+    main thread holds paho's locks. With an interval the files are checked by size and
+    modification time, and a change is reloaded once it has been stable for one
+    interval, so an editor that is still writing is not picked up half way.
+    """
+
+    def __init__(self, paths: List[str], reload: Callable[[str], None], interval: float = 0.0):
+        self.paths = list(paths)
+        self.reload = reload
+        self.interval = max(0.0, float(interval))
+        self._request_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._loaded = self._signatures()
+
+    def start(self) -> None:
+        """Starts the watching thread."""
+        self._thread = threading.Thread(target=self._run, name="config-watcher", daemon=True)
+        self._thread.start()
+
+    def request(self) -> None:
+        """Asks for a reload, e.g. from the SIGHUP handler."""
+        self._request_event.set()
+
+    def stop(self) -> None:
+        """Stops watching after the current reload."""
+        self._stop_event.set()
+        self._request_event.set()
+
+    def _signatures(self) -> Dict[str, Optional[Tuple[int, int]]]:
+        signatures = {}
+        for path in self.paths:
+            try:
+                stat = os.stat(path)
+                signatures[path] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                signatures[path] = None
+        return signatures
+
+    def _run(self) -> None:
+        pending = None
+        while not self._stop_event.is_set():
+            requested = self._request_event.wait(self.interval or None)
+            if self._stop_event.is_set():
+                return
+            self._request_event.clear()
+            current = self._signatures()
+
+            # Reload Changed Files Once They Stop Changing
+            reason = "signal" if requested else None
+            if reason is None and current != self._loaded:
+                if current == pending:
+                    reason = "file_change"
+                pending = current
+            if reason is None:
+                continue
+            try:
+                self.reload(reason)
+            except Exception:
+                # The callback logs its own errors, the running config stays in place
+                pass
+            # A failed reload is not retried until the files change again
+            self._loaded = current
+            pending = None
@@ -16,6 +16,14 @@ LOG_DIR = os.path.join(ROOT_DIR, 'logs')
 LOG_FILE_NAME = "mqtt2caldav.log"
 LOCK_FILE_NAME = "mqtt2caldav.lock"
 LOCK_FILE_PATH = os.path.abspath(os.path.join(LOG_DIR, LOCK_FILE_NAME))
+EVENT_INDEX_FILE_NAME = "mqtt2caldav.db"
+EVENT_INDEX_PATH = os.path.abspath(os.path.join(LOG_DIR, EVENT_INDEX_FILE_NAME))
+OUTBOX_FILE_NAME = "mqtt2caldav.outbox"
+OUTBOX_PATH = os.path.abspath(os.path.join(LOG_DIR, OUTBOX_FILE_NAME))
+TELEMETRY_FILE_NAME = "mqtt2caldav-telemetry.db"
+TELEMETRY_PATH = os.path.abspath(os.path.join(LOG_DIR, TELEMETRY_FILE_NAME))
+TRACE_FILE_NAME = "mqtt2caldav-trace.jsonl"
+TRACE_PATH = os.path.abspath(os.path.join(LOG_DIR, TRACE_FILE_NAME))
 
 CONFIG_DIR_NAME = "config"
 SETTINGS_FILE_NAME = "settings.json"
@@ -0,0 +1,68 @@
+### SECTION :: Module Imports ############################################################
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional
+
+
+
+### CLASS :: Debounce Window #############################################################
+class _Window:
+    """Open coalescing window of one topic and trigger."""
+    __slots__ = ("expires_at", "suppressed")
+
+    def __init__(self, expires_at: float):
+        self.expires_at = expires_at
+        self.suppressed = 0
+
+
+
+### CLASS :: Trigger Debouncer ###########################################################
+class TriggerDebouncer:
+    """Coalesces repeated matches of the same trigger on the same topic.
+
+    The first match opens a window of EVENT_DEBOUNCE_SECONDS and is processed as
+    usual. Further matches inside the window are suppressed, so a burst becomes a
+    single event. The window is not extended by repeats. Expired windows are swept
+    once sweep_interval seconds have passed, keeping one small entry per active key.
+    """
+
+    def __init__(self, sweep_interval: float = 60.0):
+        self.sweep_interval = max(1.0, float(sweep_interval))
+        self._lock = threading.Lock()
+        self._windows: Dict[Hashable, _Window] = {}
+        self._next_sweep = time.monotonic() + self.sweep_interval
+        self._suppressed_total = 0
+        self._coalesced_total = 0
+
+    def admit(self, key: Hashable, window_seconds: float, now: Optional[float] = None) -> int:
+        """Returns 0 if the match may be processed, otherwise its count of suppressed repeats in the open window."""
+        if window_seconds <= 0:
+            return 0
+        if now is None:
+            now = time.monotonic()
+        with self._lock:
+            if now >= self._next_sweep:
+                self._sweep_locked(now)
+            window = self._windows.get(key)
+            if window is not None and now < window.expires_at:
+                window.suppressed += 1
+                self._suppressed_total += 1
+                if window.suppressed == 1:
+                    self._coalesced_total += 1
+                return window.suppressed
+            self._windows[key] = _Window(now + window_seconds)
+            return 0
+
+    def _sweep_locked(self, now: float) -> None:
+        """Drops expired windows. Caller holds the lock."""
+        self._windows = {key: window for key, window in self._windows.items() if now < window.expires_at}
+        self._next_sweep = now + self.sweep_interval
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns a snapshot of debounce counters."""
+        with self._lock:
+            return {
+                "open_windows": len(self._windows),
+                "suppressed_events": self._suppressed_total,
+                "coalesced_events": self._coalesced_total
+            }
@@ -0,0 +1,125 @@
+### SECTION :: Module Imports ############################################################
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from utils.log_files import iter_lines_forward, log_paths
+from utils.log_parser import parse_line
+
+
+
+### SECTION :: Schema ####################################################################
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    event_url TEXT NOT NULL UNIQUE,
+    mqtt_topic TEXT,
+    event_trigger TEXT,
+    event_calendar TEXT,
+    created_at REAL NOT NULL,
+    deleted_at REAL
+);
+CREATE INDEX IF NOT EXISTS events_open ON events (id) WHERE deleted_at IS NULL;
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+
+### CLASS :: Event Index #################################################################
+class EventIndex:
+    """SQLite index of created and deleted CalDAV event URLs.
+
+    Replaces scanning mqtt2caldav.log for the last created event. The connection is
+    shared between the MQTT thread and the CalDAV workers and guarded by a lock.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def record_created(self, event_url: str, topic: str, trigger: str, calendar: str, created_at: Optional[float] = None) -> None:
+        """Stores a newly created event URL."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO events (event_url, mqtt_topic, event_trigger, event_calendar, created_at, deleted_at) "
+                "VALUES (?, ?, ?, ?, ?, NULL)",
+                (event_url, topic, trigger, calendar, created_at if created_at is not None else time.time())
+            )
+
+    def record_deleted(self, event_url: str, deleted_at: Optional[float] = None) -> None:
+        """Marks an event URL as deleted."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE events SET deleted_at = ? WHERE event_url = ? AND deleted_at IS NULL",
+                (deleted_at if deleted_at is not None else time.time(), event_url)
+            )
+
+    def last_created(self) -> Optional[str]:
+        """Returns the most recently created event URL that has not been deleted."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT event_url FROM events WHERE deleted_at IS NULL ORDER BY id DESC LIMIT 1"
+            ).fetchone()
+        return row[0] if row else None
+
+    def get_meta(self, key: str) -> Optional[str]:
+        """Returns a stored metadata value."""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        """Stores a metadata value."""
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def import_log(self, log_file_path: str, created_marker: str, deleted_marker: str) -> int:
+        """Imports Event Created and Event Deleted lines from a log file and its archives once. Returns the number of lines imported."""
+        if self.get_meta("log_imported") or not log_paths(log_file_path):
+            return 0
+
+        imported = 0
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                for line in iter_lines_forward(log_file_path):
+                    if "event_path" not in line:
+                        continue
+                    entry = parse_line(line)
+                    event_url = entry.get('event_path') if entry is not None else None
+                    if not event_url:
+                        continue
+
+                    marker = f"{entry.prefix} {entry.event}"
+                    if marker == created_marker:
+                        topic = entry.get('topic')
+                        self._conn.execute(
+                            "INSERT OR REPLACE INTO events (event_url, mqtt_topic, created_at, deleted_at) VALUES (?, ?, ?, NULL)",
+                            (event_url, topic, time.time())
+                        )
+                        imported += 1
+                    elif marker == deleted_marker:
+                        self._conn.execute(
+                            "UPDATE events SET deleted_at = ? WHERE event_url = ? AND deleted_at IS NULL",
+                            (time.time(), event_url)
+                        )
+                        imported += 1
+                self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('log_imported', ?)", (str(time.time()),))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return imported
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        with self._lock:
+            self._conn.close()
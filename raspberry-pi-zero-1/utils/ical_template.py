@@ -0,0 +1,132 @@
+### SECTION :: Module Imports ############################################################
+import re
+from typing import Any, Dict, List
+
+
+
+### SECTION :: Text Escaping #############################################################
+# Matches backslash sequences users already escaped in triggers.json ('\\,' in the README)
+_TEXT_SPECIAL = re.compile(r"\\[\\;,nN]|[;,\n]|\\")
+_LIST_SPECIAL = re.compile(r"\\[\\;,nN]|[;\n]|\\")
+
+
+def _escape(value: str, pattern: "re.Pattern[str]") -> str:
+    """Escapes RFC 5545 TEXT characters that are not escaped already."""
+    def _replace(match: "re.Match[str]") -> str:
+        token = match.group(0)
+        if len(token) == 2:
+            return token
+        if token == "\n":
+            return "\\n"
+        return "\\" + token
+    return pattern.sub(_replace, value)
+
+
+def escape_text(value: str) -> str:
+    """Escapes a TEXT value such as SUMMARY, LOCATION or DESCRIPTION."""
+    return _escape(str(value), _TEXT_SPECIAL)
+
+
+def escape_text_list(value: str) -> str:
+    """Escapes a comma separated TEXT list such as CATEGORIES, keeping the commas."""
+    return _escape(str(value), _LIST_SPECIAL)
+
+
+
+### FUNCTION :: Fold Content Line ########################################################
+def fold_line(line: str, limit: int = 75) -> str:
+    """Folds a content line into chunks of at most limit octets (RFC 5545, 3.1)."""
+    encoded = line.encode('utf-8')
+    if len(encoded) <= limit:
+        return line
+
+    chunks: List[str] = []
+    start = 0
+    width = limit
+    while start < len(encoded):
+        end = min(start + width, len(encoded))
+        # Never split a multi-byte UTF-8 sequence
+        while end < len(encoded) and (encoded[end] & 0xC0) == 0x80:
+            end -= 1
+        chunks.append(encoded[start:end].decode('utf-8'))
+        start = end
+        width = limit - 1
+    return "\n ".join(chunks)
+
+
+
+### CLASS :: Event Template ##############################################################
+class EventTemplate:
+    """VCALENDAR payload for one trigger with all static properties pre-rendered.
+
+    Only DTSTART, DTEND, DTSTAMP, CREATED and UID are filled in per event. Lines are
+    terminated with '\\n' like the payloads the application has always sent.
+    """
+    __slots__ = ("_head", "_dtend", "_dtstamp", "_created", "_uid", "_tail")
+
+    def __init__(self, event_details: Dict[str, Any]):
+        timezone = event_details['event_timezone']
+        static_lines = [
+            fold_line(f"LOCATION:{escape_text(event_details['event_location'])}"),
+            fold_line(f"DESCRIPTION:{escape_text(event_details['event_description'])}")
+        ]
+        if event_details.get('event_url'):
+            static_lines.append(fold_line(f"URL;VALUE=URI:{event_details['event_url']}"))
+        static_lines.append(fold_line(f"SUMMARY:{escape_text(event_details['event_summary'])}"))
+        if event_details.get('event_geo'):
+            static_lines.append(fold_line(f"GEO:{event_details['event_geo']}"))
+        static_lines.append(fold_line(f"TRANSP:{event_details['event_transp']}"))
+        if event_details.get('event_categories'):
+            static_lines.append(fold_line(f"CATEGORIES:{escape_text_list(event_details['event_categories'])}"))
+
+        alarm = ""
+        if event_details.get('event_trigger'):
+            alarm = "BEGIN:VALARM\n" \
+                    f"TRIGGER:-PT{int(event_details['event_trigger'])}M\n" \
+                    "ATTACH;VALUE=URI:Chord\n" \
+                    "ACTION:AUDIO\n" \
+                    "END:VALARM\n"
+
+        self._head = "BEGIN:VCALENDAR\n" \
+                     "VERSION:2.0\n" \
+                     "PRODID:-//MQTT//EN\n" \
+                     "CALSCALE:GREGORIAN\n" \
+                     "BEGIN:VEVENT\n" \
+                     f"DTSTART;TZID={timezone}:"
+        self._dtend = f"\nDTEND;TZID={timezone}:"
+        self._dtstamp = "\nDTSTAMP:"
+        self._created = "\n" + "\n".join(static_lines) + "\nCREATED:"
+        self._uid = "\nUID:"
+        self._tail = "\n" + alarm + "END:VEVENT\nEND:VCALENDAR\n"
+
+    def render(self, start_time: str, end_time: str, uid: str) -> str:
+        """Returns the VCALENDAR payload for one event."""
+        return self._head + start_time + self._dtend + end_time + self._dtstamp + start_time + \
+            self._created + start_time + self._uid + uid + self._tail
+
+
+
+### FUNCTION :: Compile Trigger Template #################################################
+def compile_trigger_template(trigger: Dict[str, Any]) -> EventTemplate:
+    """Builds the event template for a create trigger from its triggers.json entry."""
+    return EventTemplate({
+        'event_timezone': trigger['EVENT_TIMEZONE'],
+        'event_location': trigger['EVENT_LOCATION'],
+        'event_description': trigger['EVENT_DESCRIPTION'],
+        'event_url': trigger['EVENT_URL'],
+        'event_summary': trigger['EVENT_SUMMARY'],
+        'event_geo': trigger['EVENT_GEO'],
+        'event_transp': trigger['EVENT_TRANSP'],
+        'event_categories': trigger['EVENT_CATEGORIES'],
+        'event_trigger': trigger['EVENT_TRIGGER']
+    })
+
+
+
+### FUNCTION :: Replace Event End ########################################################
+def replace_event_end(ical: str, timezone: str, old_end: str, new_end: str) -> str:
+    """Returns a rendered VCALENDAR payload with its DTEND moved from old_end to new_end."""
+    old_line = f"\nDTEND;TZID={timezone}:{old_end}\n"
+    if old_line not in ical:
+        raise ValueError(f"DTEND {old_end} not found in event payload")
+    return ical.replace(old_line, f"\nDTEND;TZID={timezone}:{new_end}\n", 1)
@@ -0,0 +1,96 @@
+### SECTION :: Module Imports ############################################################
+import glob
+import gzip
+import os
+import re
+import shutil
+import tempfile
+from typing import IO, Iterator, List, Optional
+
+from utils.reverse_reader import read_file_lines_reverse, read_lines_reverse
+
+
+
+### SECTION :: Archive Naming ############################################################
+# Archives are named <log file>.<YYYYmmdd-HHMMSS>[.gz], so sorting by name sorts by age
+ARCHIVE_TIMESTAMP_FORMAT = "%Y%m%d-%H%M%S"
+_ARCHIVE_SUFFIX = re.compile(r"\.(\d{8}-\d{6})(?:-(\d+))?(\.gz)?$")
+
+
+def archive_sort_key(path: str):
+    """Orders archives by timestamp and sequence number, oldest first."""
+    match = _ARCHIVE_SUFFIX.search(path)
+    if match is None:
+        return ("", 0)
+    return (match.group(1), int(match.group(2) or 0))
+
+
+
+### FUNCTION :: List Log Archives ########################################################
+def archive_paths(log_path: str) -> List[str]:
+    """Returns the rotated archives of a log file, newest first.
+
+    An archive still being compressed exists both plain and as .gz; the plain file is
+    listed until compression finished.
+    """
+    archives = {}
+    for path in glob.glob(glob.escape(log_path) + ".*"):
+        if _ARCHIVE_SUFFIX.search(path) is None or path.endswith(".tmp"):
+            continue
+        plain_path = path[:-3] if path.endswith(".gz") else path
+        if plain_path not in archives or not path.endswith(".gz"):
+            archives[plain_path] = path
+    return sorted(archives.values(), key=archive_sort_key, reverse=True)
+
+
+def log_paths(log_path: str) -> List[str]:
+    """Returns the active log file followed by its archives, newest first."""
+    paths = [log_path] if os.path.exists(log_path) else []
+    return paths + archive_paths(log_path)
+
+
+
+### FUNCTION :: Open Log File ############################################################
+def open_log(path: str) -> IO[str]:
+    """Opens a plain or gzip compressed log file for reading text."""
+    if path.endswith(".gz"):
+        return gzip.open(path, 'rt', encoding='utf-8', errors='replace')
+    return open(path, 'r', encoding='utf-8', errors='replace')
+
+
+
+### FUNCTION :: Read Log Lines ###########################################################
+def iter_lines_forward(log_path: str) -> Iterator[str]:
+    """Yields the lines of the archives and the active log file, oldest first."""
+    for path in reversed(log_paths(log_path)):
+        try:
+            with open_log(path) as log_file:
+                yield from log_file
+        except FileNotFoundError:
+            # Pruned by rotation while listing
+            continue
+
+
+def iter_lines_reverse(log_path: str, contains: Optional[str] = None, use_mmap: bool = False) -> Iterator[str]:
+    """Yields the lines of the active log file and its archives, newest first.
+
+    Plain files are read backwards in blocks, so a caller that stops after the lines
+    it needs never reads the rest. gzip archives cannot be read backwards, each is
+    stream-decompressed into an unnamed temporary file next to the log and read
+    backwards from there, so memory stays at one block whatever the archive size.
+    With contains, only lines including that text are yielded.
+    """
+    contains_bytes = contains.encode('utf-8') if contains is not None else None
+    for path in log_paths(log_path):
+        try:
+            if not path.endswith(".gz"):
+                yield from read_lines_reverse(path, use_mmap=use_mmap, contains=contains_bytes)
+                continue
+            # Same file system as the logs, /tmp is often RAM backed
+            with tempfile.TemporaryFile(dir=os.path.dirname(os.path.abspath(path))) as plain_file:
+                with gzip.open(path, 'rb') as archive:
+                    shutil.copyfileobj(archive, plain_file)
+                plain_file.flush()
+                yield from read_file_lines_reverse(plain_file, use_mmap=use_mmap, contains=contains_bytes)
+        except FileNotFoundError:
+            continue
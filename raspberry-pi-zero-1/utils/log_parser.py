@@ -0,0 +1,104 @@
+### SECTION :: Module Imports ############################################################
+import json
+import re
+from typing import Any, Dict, Optional
+
+
+
+### SECTION :: Line Patterns #############################################################
+# info  2026-10-17 12:00:00.000 [APP] Event Received | mqtt_topic='mqtt/x', battery='87'
+TEXT_LINE_PATTERN = re.compile(r"^(\w+)\s+(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\.(\d{3}) (\[[^\]]+\]) ([^|]*?)\s*(?:\| ?(.*))?$")
+# Values may contain quotes, a value only ends at ', key=' or at the end of the line
+TEXT_FIELD_PATTERN = re.compile(r"(\w+)='(.*?)'(?=, \w+='|\s*$)")
+TEXT_VALUE_END_PATTERN = re.compile(r"'(?=, \w+='|\s*$)")
+# Stable field names of the JSON-lines format for keys that differ in the text format
+TEXT_FIELD_ALIASES = {"mqtt_topic": "topic"}
+TEXT_FIELD_NAMES = {stable: text for text, stable in TEXT_FIELD_ALIASES.items()}
+# Top-level keys of a JSON-lines record, every other field is nested under "data"
+JSON_STABLE_FIELDS = ("topic", "action", "event_path", "latency_ms")
+_field_keys: Dict[str, str] = {}
+
+
+
+### CLASS :: Log Entry ###################################################################
+class LogEntry:
+    """One parsed log line, from either the text or the JSON-lines format.
+
+    Fields use the stable JSON-lines names ("topic" rather than "mqtt_topic"). Text
+    fields are only split when asked for, so reading one field of a long line costs
+    a single search. Values are strings in the text format and JSON types otherwise.
+    """
+    __slots__ = ("level", "timestamp", "millis", "prefix", "event", "_data", "_fields")
+
+    def __init__(self, level: str, timestamp: str, millis: str, prefix: str, event: str,
+                 data: Optional[str] = None, fields: Optional[Dict[str, Any]] = None):
+        self.level = level
+        self.timestamp = timestamp
+        self.millis = millis
+        self.prefix = prefix
+        self.event = event
+        self._data = data
+        self._fields = fields
+
+    @property
+    def fields(self) -> Dict[str, Any]:
+        """Returns all fields of the line."""
+        if self._fields is None:
+            self._fields = {TEXT_FIELD_ALIASES.get(key, key): value for key, value in TEXT_FIELD_PATTERN.findall(self._data or "")}
+        return self._fields
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Returns one field of the line."""
+        if self._fields is not None:
+            return self._fields.get(name, default)
+        if not self._data:
+            return default
+        key = _field_keys.get(name)
+        if key is None:
+            key = _field_keys.setdefault(name, f"{TEXT_FIELD_NAMES.get(name, name)}='")
+        start = self._data.find(key)
+        while start > 0 and self._data[start - 2:start] != ", ":
+            start = self._data.find(key, start + 1)
+        if start < 0:
+            return default
+        start += len(key)
+        end = TEXT_VALUE_END_PATTERN.search(self._data, start)
+        return self._data[start:end.start()] if end is not None else default
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the line as a JSON-serializable dict."""
+        return {"level": self.level, "timestamp": f"{self.timestamp}.{self.millis}", "prefix": self.prefix,
+                "event": self.event, "fields": self.fields}
+
+
+
+### FUNCTION :: Parse Log Line ###########################################################
+def parse_line(line: str) -> Optional[LogEntry]:
+    """Parses a log line written in either format, returns None if it is not a log line."""
+    if line[:1] == "{":
+        return parse_json_line(line)
+    return parse_text_line(line)
+
+
+def parse_text_line(line: str) -> Optional[LogEntry]:
+    """Parses a 'level timestamp [PREFIX] Event | key='value', ...' line."""
+    match = TEXT_LINE_PATTERN.match(line)
+    if match is None:
+        return None
+    level, timestamp, millis, prefix, event, data = match.groups()
+    return LogEntry(level, timestamp, millis, prefix, event, data=data)
+
+
+def parse_json_line(line: str) -> Optional[LogEntry]:
+    """Parses a JSON-lines record written with LOG_FORMAT "json"."""
+    try:
+        record = json.loads(line)
+        timestamp, _, millis = record["ts"].partition(".")
+    except (ValueError, KeyError, AttributeError, TypeError):
+        return None
+    fields = dict(record.get("data") or {})
+    for name in JSON_STABLE_FIELDS:
+        if name in record:
+            fields[name] = record[name]
+    return LogEntry(record.get("level", ""), timestamp, millis or "000", record.get("prefix", ""),
+                    record.get("event", ""), fields=fields)
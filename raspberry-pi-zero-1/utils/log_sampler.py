@@ -0,0 +1,129 @@
+### SECTION :: Module Imports ############################################################
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.trigger_index import TriggerIndex
+
+LEVEL_OFF = logging.CRITICAL + 10
+_LEVELS = {"DEBUG": logging.DEBUG, "INFO": logging.INFO, "WARN": logging.WARNING, "WARNING": logging.WARNING, "OFF": LEVEL_OFF}
+
+
+
+### CLASS :: Sampling Rule ###############################################################
+class SamplingRule:
+    """Log sampling settings of one LOG_SAMPLING entry."""
+    __slots__ = ("topic", "level", "sample_every", "max_per_minute", "change_fields")
+
+    def __init__(self, rule: Dict[str, Any]):
+        self.topic = rule['MQTT_TOPIC']
+        level_name = str(rule.get('LOG_LEVEL', 'INFO')).upper()
+        if level_name not in _LEVELS:
+            raise ValueError(f"Invalid LOG_LEVEL '{rule.get('LOG_LEVEL')}' for '{self.topic}'")
+        self.level = _LEVELS[level_name]
+        self.sample_every = max(1, int(rule.get('SAMPLE_EVERY', 1) or 1))
+        self.max_per_minute = max(0, int(rule.get('MAX_LINES_PER_MINUTE', 0) or 0))
+        change_fields = rule.get('LOG_ON_CHANGE', [])
+        if isinstance(change_fields, str):
+            change_fields = [field.strip() for field in change_fields.split(',') if field.strip()]
+        self.change_fields: Tuple[str, ...] = tuple(change_fields)
+
+
+
+### CLASS :: Topic Sampling State ########################################################
+class _TopicState:
+    """Counters of one topic."""
+    __slots__ = ("seen", "window_start", "window_lines", "last_values", "suppressed")
+
+    def __init__(self):
+        self.seen = 0
+        self.window_start = 0.0
+        self.window_lines = 0
+        self.last_values: Optional[Tuple[Any, ...]] = None
+        self.suppressed = 0
+
+
+
+### CLASS :: Topic Log Sampler ###########################################################
+class TopicLogSampler:
+    """Decides per topic whether and at which level an 'Event Received' line is written.
+
+    The first LOG_SAMPLING rule whose MQTT_TOPIC (wildcards allowed) matches a topic
+    applies. A line is written only if it passes every setting of the rule: 1 in
+    SAMPLE_EVERY messages, at most MAX_LINES_PER_MINUTE lines and, with LOG_ON_CHANGE,
+    only when one of the listed payload fields changed. Suppressed lines are counted
+    per topic and handed out by due_counts() every flush_interval seconds.
+    """
+
+    def __init__(self, rules: List[Dict[str, Any]], flush_interval: float = 60.0):
+        self.rules = [SamplingRule(rule) for rule in rules]
+        self.flush_interval = max(1.0, float(flush_interval))
+        self._index = TriggerIndex([{'MQTT_TOPIC': rule.topic, 'rule': rule} for rule in self.rules])
+        self._lock = threading.Lock()
+        self._rule_cache: Dict[str, Optional[SamplingRule]] = {}
+        self._states: Dict[str, _TopicState] = {}
+        self._next_flush = time.monotonic() + self.flush_interval
+        self._suppressed_total = 0
+
+    def _rule_for(self, topic: str) -> Optional[SamplingRule]:
+        """Returns the first rule matching a topic. Caller holds the lock."""
+        if topic not in self._rule_cache:
+            matches = self._index.match(topic)
+            self._rule_cache[topic] = matches[0]['rule'] if matches else None
+        return self._rule_cache[topic]
+
+    def level_for(self, topic: str, payload: Dict[str, Any], default_level: int = logging.INFO) -> Optional[int]:
+        """Returns the level to log a received message at, or None if the line is suppressed."""
+        if not self.rules:
+            return default_level
+        with self._lock:
+            rule = self._rule_for(topic)
+            if rule is None:
+                return default_level
+            state = self._states.get(topic)
+            if state is None:
+                state = self._states[topic] = _TopicState()
+            state.seen += 1
+
+            write_line = rule.level != LEVEL_OFF and (state.seen - 1) % rule.sample_every == 0
+            if write_line and rule.change_fields:
+                values = tuple(payload.get(field) for field in rule.change_fields)
+                write_line = values != state.last_values
+                state.last_values = values
+            if write_line and rule.max_per_minute:
+                now = time.monotonic()
+                if now - state.window_start >= 60.0:
+                    state.window_start = now
+                    state.window_lines = 0
+                write_line = state.window_lines < rule.max_per_minute
+                if write_line:
+                    state.window_lines += 1
+
+            if not write_line:
+                state.suppressed += 1
+                self._suppressed_total += 1
+                return None
+            return rule.level
+
+    def due_counts(self) -> List[Tuple[str, int]]:
+        """Returns and resets suppressed counts per topic once flush_interval has passed."""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._next_flush:
+                return []
+            self._next_flush = now + self.flush_interval
+        return self.flush()
+
+    def flush(self) -> List[Tuple[str, int]]:
+        """Returns and resets suppressed counts per topic."""
+        with self._lock:
+            counts = [(topic, state.suppressed) for topic, state in self._states.items() if state.suppressed]
+            for state in self._states.values():
+                state.suppressed = 0
+            return counts
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns a snapshot of sampler counters."""
+        with self._lock:
+            return {"sampling_rules": len(self.rules), "sampled_topics": len(self._states), "suppressed_lines": self._suppressed_total}
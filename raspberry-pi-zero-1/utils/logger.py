@@ -1,8 +1,19 @@
 ### SECTION :: Module Imports ############################################################
+import atexit
+import gzip
+import json
 import os
+import queue
+import shutil
 import sys
+import threading
+import time
 import logging
+import logging.handlers
+from typing import Any, Dict, List, Optional
 from utils.constants import LOG_DIR, LOG_FILE_NAME, APP_NAME
+from utils.log_files import ARCHIVE_TIMESTAMP_FORMAT, archive_paths
+from utils.log_parser import JSON_STABLE_FIELDS, TEXT_FIELD_ALIASES
 
 
 
@@ -17,16 +28,218 @@ log_fn = os.path.join(LOG_DIR, LOG_FILE_NAME)
 class LowercaseLevelFormatter(logging.Formatter):
     """Custom formatter to use lowercase level names and shortened 'warning' and 'critical'"""
     def format(self, record):
+        record.levelname_padded = f"{self.short_level(record):<5}"
+        return super().format(record)
+
+    @staticmethod
+    def short_level(record) -> str:
         levelname = record.levelname
         if levelname == "WARNING":
-            levelname = "warn"
+            return "warn"
         elif levelname == "CRITICAL":
-            levelname = "crit"
+            return "crit"
+        return levelname.lower()
+
+
+
+### CLASS :: JSON Lines Formatter ########################################################
+class JsonLinesFormatter(LowercaseLevelFormatter):
+    """Formats records as one JSON object per line with stable field names.
+
+    {"ts": "2026-10-17 12:00:00.000", "level": "info", "prefix": "[DAV]", "event": "Event Created",
+     "topic": "mqtt/x", "action": "single", "event_path": "https://...", "latency_ms": 85, "data": {...}}
+
+    topic, action, event_path and latency_ms are top-level keys when the record has
+    them, every other log data field is nested under "data". The log data is the
+    LazyLogData logging argument of the record. Text after the '|' of records without
+    one is kept as data.message.
+    """
+    def format(self, record):
+        head, _, tail = record.getMessage().partition(" | ")
+        prefix, _, event = head.partition(" ") if head.startswith("[") else ("", "", head)
+        entry: Dict[str, Any] = {"ts": f"{self.formatTime(record, self.datefmt)}.{int(record.msecs):03d}", "level": self.short_level(record),
+                                 "prefix": prefix, "event": event.strip()}
+
+        log_data = next((arg for arg in (record.args or ()) if isinstance(arg, LazyLogData)), None)
+        if log_data is not None:
+            data = {TEXT_FIELD_ALIASES.get(key, key): value for key, value in log_data.data.items()}
         else:
-            levelname = levelname.lower()
+            data = {"message": tail.strip()} if tail.strip() else {}
+        for name in JSON_STABLE_FIELDS:
+            if name in data:
+                entry[name] = data.pop(name)
+        if data:
+            entry["data"] = data
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
 
-        record.levelname_padded = f"{levelname:<5}"
-        return super().format(record)
+
+
+### CLASS :: Batched File Handler ########################################################
+class BatchedFileHandler(logging.FileHandler):
+    """File handler that flushes to disk once every batch_size records instead of every record.
+
+    With batch_size 1 it behaves like a plain FileHandler. flush_now() writes out a
+    partial batch and is called by the async listener whenever its queue runs empty.
+    """
+    def __init__(self, filename: str, batch_size: int = 1, encoding: Optional[str] = None):
+        super().__init__(filename, encoding=encoding)
+        self.batch_size = max(1, int(batch_size))
+        self._unflushed = 0
+
+    def flush(self):
+        self._unflushed += 1
+        if self._unflushed >= self.batch_size:
+            self.flush_now()
+
+    def flush_now(self):
+        self._unflushed = 0
+        super().flush()
+
+    def close(self):
+        self.flush_now()
+        super().close()
+
+
+
+### CLASS :: Rotating Gzip File Handler ##################################################
+class RotatingGzipFileHandler(BatchedFileHandler):
+    """Batched file handler that rotates by size and age into gzip archives.
+
+    The active file is renamed to <file>.<YYYYmmdd-HHMMSS> and compressed to .gz by a
+    background thread, so the logging thread never waits for gzip. Only the newest
+    backup_count archives are kept. With max_bytes and max_age_seconds at 0 the file
+    is never rotated. The age limit counts from when the file was opened.
+    """
+    def __init__(self, filename: str, batch_size: int = 1, encoding: Optional[str] = None,
+                 max_bytes: int = 0, max_age_seconds: float = 0, backup_count: int = 0):
+        super().__init__(filename, batch_size=batch_size, encoding=encoding)
+        self.max_bytes = 0
+        self.max_age_seconds = 0.0
+        self.backup_count = 0
+        self._rollover_at = 0.0
+        self.configure(max_bytes, max_age_seconds, backup_count)
+
+    def configure(self, max_bytes: int, max_age_seconds: float, backup_count: int) -> None:
+        """Sets rotation limits and compresses archives a previous run left uncompressed."""
+        self.max_bytes = max(0, int(max_bytes))
+        self.max_age_seconds = max(0.0, float(max_age_seconds))
+        self.backup_count = max(0, int(backup_count))
+        self._rollover_at = time.time() + self.max_age_seconds
+        leftovers = [path for path in archive_paths(self.baseFilename) if not path.endswith(".gz")]
+        if leftovers and (self.max_bytes or self.max_age_seconds):
+            threading.Thread(target=self._compress, args=(leftovers,), name="log-compress", daemon=True).start()
+
+    def emit(self, record):
+        try:
+            if self._should_rollover():
+                self.do_rollover()
+        except Exception:
+            self.handleError(record)
+        super().emit(record)
+
+    def _should_rollover(self) -> bool:
+        if self.stream is None:
+            return False
+        if self.max_bytes and self.stream.tell() >= self.max_bytes:
+            return True
+        return bool(self.max_age_seconds) and time.time() >= self._rollover_at and self.stream.tell() > 0
+
+    def do_rollover(self) -> None:
+        """Closes the active file, renames it to a timestamped archive and starts compression."""
+        self.flush_now()
+        self.stream.close()
+        self.stream = None
+        archive_base = f"{self.baseFilename}.{time.strftime(ARCHIVE_TIMESTAMP_FORMAT)}"
+        archive_path, sequence = archive_base, 0
+        while os.path.exists(archive_path) or os.path.exists(archive_path + ".gz"):
+            sequence += 1
+            archive_path = f"{archive_base}-{sequence}"
+        os.rename(self.baseFilename, archive_path)
+        self.stream = self._open()
+        self._rollover_at = time.time() + self.max_age_seconds
+        threading.Thread(target=self._compress, args=([archive_path],), name="log-compress", daemon=True).start()
+
+    def _compress(self, paths: List[str]) -> None:
+        """Gzips archives and prunes the oldest beyond backup_count."""
+        for path in paths:
+            try:
+                with open(path, 'rb') as source, gzip.open(path + ".gz.tmp", 'wb') as target:
+                    shutil.copyfileobj(source, target, 1024 * 1024)
+                os.replace(path + ".gz.tmp", path + ".gz")
+                os.remove(path)
+            except OSError as e:
+                print(f"warn  {time.strftime('%Y-%m-%d %H:%M:%S')} [SYS] Log Archive Error | file_path='{path}', details='{e}'", file=sys.stderr)
+        if self.backup_count:
+            for path in archive_paths(self.baseFilename)[self.backup_count:]:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+
+
+### CLASS :: Bounded Queue Handler #######################################################
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that hands records over unformatted and sheds them when the queue is full.
+
+    Formatting, including format_log_data(), happens on the listener thread. Dropped
+    records are counted and reported by the listener once the queue has room again.
+    """
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]"):
+        super().__init__(log_queue)
+        self.dropped_records = 0
+
+    def prepare(self, record):
+        return record
+
+    def enqueue(self, record):
+        try:
+            if record.levelno >= logging.WARNING:
+                # Warnings and errors wait briefly for room rather than being lost
+                self.queue.put(record, timeout=1.0)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped_records += 1
+
+
+
+### CLASS :: Batching Queue Listener #####################################################
+class BatchingQueueListener(logging.handlers.QueueListener):
+    """Queue listener that flushes batched file handlers whenever the queue runs empty."""
+    def __init__(self, log_queue, queue_handler: BoundedQueueHandler, *handlers):
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.queue_handler = queue_handler
+        self._reported_drops = 0
+
+    def dequeue(self, block):
+        try:
+            return self.queue.get_nowait()
+        except queue.Empty:
+            self._report_drops()
+            self.flush_handlers()
+            return self.queue.get(block)
+
+    def enqueue_sentinel(self):
+        # Wait for room, the queue may be full when the application stops
+        self.queue.put(self._sentinel)
+
+    def flush_handlers(self):
+        for handler in self.handlers:
+            if isinstance(handler, BatchedFileHandler):
+                handler.flush_now()
+            else:
+                handler.flush()
+
+    def _report_drops(self):
+        dropped = self.queue_handler.dropped_records - self._reported_drops
+        if dropped <= 0:
+            return
+        self._reported_drops += dropped
+        record = logging.LogRecord(APP_NAME, logging.WARNING, __file__, 0, "[SYS] Log Records Dropped     | %s", (format_log_data({"dropped_records": dropped, "reason": "Log queue full"}),), None)
+        self.handle(record)
 
 
 
@@ -41,7 +254,7 @@ logger = logging.getLogger(APP_NAME)
 logger.setLevel(logging.INFO)
 
 # Create File Handler
-file_handler = logging.FileHandler(log_fn, encoding='utf-8')
+file_handler = RotatingGzipFileHandler(log_fn, encoding='utf-8')
 file_handler.setFormatter(formatter)
 
 # Create Stream Handler
@@ -74,18 +287,122 @@ def set_log_level(level_str: str):
          print(f"warn  {timestamp}: [APP] Invalid LOG_LEVEL set, defaulting to INFO.")
 
 
+### FUNCTION :: Set Log Format ###########################################################
+LOG_FORMATS = ("text", "json")
+_json_format = False
+json_formatter = JsonLinesFormatter(datefmt='%Y-%m-%d %H:%M:%S')
+
+def set_log_format(log_format: str) -> None:
+    """Writes the log file as text or as JSON lines, console output stays text."""
+    global _json_format
+    _json_format = log_format.lower() == "json"
+    with file_handler.lock:
+        file_handler.setFormatter(json_formatter if _json_format else formatter)
+
+
+### FUNCTION :: Set Log Rotation #########################################################
+def set_log_rotation(max_bytes: int, max_age_seconds: float, backup_count: int) -> None:
+    """Applies rotation limits to the application log file."""
+    with file_handler.lock:
+        file_handler.configure(max_bytes, max_age_seconds, backup_count)
+
+
+### FUNCTION :: Start Async Logging ######################################################
+_listener: Optional[BatchingQueueListener] = None
+
+def start_async_logging(queue_size: int = 10000, batch_size: int = 64, target_logger: logging.Logger = logger) -> BatchingQueueListener:
+    """Moves the handlers of a logger behind a bounded queue drained by a listener thread."""
+    global _listener
+    handlers: List[logging.Handler] = list(target_logger.handlers)
+    for handler in handlers:
+        target_logger.removeHandler(handler)
+        if isinstance(handler, BatchedFileHandler):
+            handler.batch_size = max(1, int(batch_size))
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=max(1, int(queue_size)))
+    queue_handler = BoundedQueueHandler(log_queue)
+    target_logger.addHandler(queue_handler)
+    listener = BatchingQueueListener(log_queue, queue_handler, *handlers)
+    listener.start()
+    if target_logger is logger:
+        _listener = listener
+    return listener
+
+
+### FUNCTION :: Stop Async Logging #######################################################
+def stop_async_logging(listener: Optional[BatchingQueueListener] = None, target_logger: logging.Logger = logger) -> None:
+    """Writes out queued records and puts the handlers back on the logger."""
+    global _listener
+    if listener is None:
+        listener, _listener = _listener, None
+    if listener is None:
+        return
+    target_logger.removeHandler(listener.queue_handler)
+    listener.stop()
+    listener._report_drops()
+    listener.flush_handlers()
+    for handler in listener.handlers:
+        if isinstance(handler, BatchedFileHandler):
+            handler.batch_size = 1
+        target_logger.addHandler(handler)
+
+atexit.register(stop_async_logging)
+
+
+### CLASS :: Lazy Log Data ###############################################################
+class LazyLogData:
+    """Log data rendered as key='value' pairs only when the record is actually written."""
+    __slots__ = ("data",)
+
+    def __init__(self, data: Dict[str, Any]):
+        self.data = dict(data)
+
+    def __str__(self) -> str:
+        return ", ".join([f"{key}='{value}'" for key, value in self.data.items()])
+
+
+### FUNCTION :: Format Log Data ##########################################################
+def format_log_data(data: Dict[str, Any]) -> LazyLogData:
+    """Formats a dictionary into a key='value' string.
+
+    Rendering is deferred: pass the result as a logging argument, e.g.
+    logger.debug("%s Title | %s", prefix, format_log_data(data)), and it is only
+    formatted if the level is enabled, on the async listener thread. The JSON-lines
+    format reads the fields from that argument, so it is not embedded in an f-string.
+    Fields set with set_log_context() on the calling thread are appended.
+    """
+    context = getattr(_log_context, "fields", None)
+    if context:
+        return LazyLogData({**data, **context})
+    return LazyLogData(data)
+
+
+### FUNCTION :: Set Log Context ##########################################################
+_log_context = threading.local()
+
+def set_log_context(fields: Optional[Dict[str, Any]]) -> None:
+    """Sets fields appended to the log data of every line logged by the calling thread, None to clear them."""
+    _log_context.fields = fields or None
+
+
 ### SECTION :: Level-Based Logging Functions #############################################
-def info(msg):
-    logger.info(msg)
+def info(msg, *args):
+    logger.info(msg, *args)
+
+def warn(msg, *args):
+    logger.warning(msg, *args)
+
+def error(msg, *args):
+    logger.error(msg, *args)
 
-def warn(msg):
-    logger.warning(msg)
+def debug(msg, *args):
+    logger.debug(msg, *args)
 
-def error(msg):
-    logger.error(msg)
+def critical(msg, *args):
+    logger.critical(msg, *args)
 
-def debug(msg):
-    logger.debug(msg)
+def log(level: int, msg, *args):
+    logger.log(level, msg, *args)
 
-def critical(msg):
-    logger.critical(msg)
+def is_enabled(level: int) -> bool:
+    """Returns True if records of a level would be written."""
+    return logger.isEnabledFor(level)
@@ -0,0 +1,157 @@
+### SECTION :: Module Imports ############################################################
+import bisect
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Seconds, from a local MQTT callback to a slow CalDAV server
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LabelKey = Tuple[Tuple[str, str], ...]
+Sample = Tuple[str, Dict[str, str], float]
+
+
+
+### CLASS :: Metrics #####################################################################
+class Metrics:
+    """Counters, gauges and histograms rendered in the Prometheus text exposition format.
+
+    Metrics are declared once with describe() and updated with inc(), set() and
+    observe(). Values that already live elsewhere, such as worker pool stats(), are
+    read by collectors only when the metrics are rendered.
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._types: Dict[str, str] = {}
+        self._help: Dict[str, str] = {}
+        self._values: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, List[float]]] = {}
+        self._collectors: List[Tuple[str, Callable[[], Iterable[Sample]]]] = []
+
+    def describe(self, name: str, metric_type: str, help_text: str) -> None:
+        """Declares a counter, gauge or histogram."""
+        if metric_type not in ("counter", "gauge", "histogram"):
+            raise ValueError(f"Unknown metric type '{metric_type}'")
+        with self._lock:
+            self._types[name] = metric_type
+            self._help[name] = help_text
+            if metric_type == "histogram":
+                self._histograms.setdefault(name, {})
+            else:
+                self._values.setdefault(name, {})
+
+    def add_collector(self, name: str, collector: Callable[[], Iterable[Sample]]) -> None:
+        """Adds a callback returning (sample name, labels, value) for a declared gauge or counter at render time."""
+        with self._lock:
+            self._collectors.append((name, collector))
+
+    def inc(self, name: str, labels: Optional[Dict[str, str]] = None, amount: float = 1) -> None:
+        """Adds to a counter."""
+        key = _label_key(labels)
+        with self._lock:
+            series = self._values[name]
+            series[key] = series.get(key, 0) + amount
+
+    def set(self, name: str, value: float, labels: Optional[Dict[str, str]] = None) -> None:
+        """Sets a gauge."""
+        key = _label_key(labels)
+        with self._lock:
+            self._values[name][key] = value
+
+    def observe(self, name: str, value: float, labels: Optional[Dict[str, str]] = None) -> None:
+        """Adds a sample to a histogram."""
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms[name]
+            # Per-bucket counts, then +Inf, sum and count
+            counts = series.get(key)
+            if counts is None:
+                counts = series[key] = [0.0] * (len(self.buckets) + 3)
+            counts[bisect.bisect_left(self.buckets, value)] += 1
+            counts[-2] += value
+            counts[-1] += 1
+
+    def render(self) -> str:
+        """Returns every metric in the text exposition format."""
+        with self._lock:
+            collectors = list(self._collectors)
+        collected: Dict[str, List[Sample]] = {}
+        for name, collector in collectors:
+            try:
+                collected.setdefault(name, []).extend(collector())
+            except Exception:
+                # A failing collector must not break the scrape
+                continue
+
+        lines = []
+        with self._lock:
+            for name, metric_type in self._types.items():
+                lines.append(f"# HELP {name} {self._help[name]}")
+                lines.append(f"# TYPE {name} {metric_type}")
+                if metric_type == "histogram":
+                    for key, counts in self._histograms[name].items():
+                        cumulative = 0.0
+                        for bound, count in zip(self.buckets + (float("inf"),), counts):
+                            cumulative += count
+                            lines.append(f"{name}_bucket{_format_labels(key + (('le', _format_value(bound)),))} {_format_value(cumulative)}")
+                        lines.append(f"{name}_sum{_format_labels(key)} {_format_value(counts[-2])}")
+                        lines.append(f"{name}_count{_format_labels(key)} {_format_value(counts[-1])}")
+                    continue
+                for key, value in self._values[name].items():
+                    lines.append(f"{name}{_format_labels(key)} {_format_value(value)}")
+                for sample_name, labels, value in collected.get(name, ()):
+                    lines.append(f"{sample_name}{_format_labels(_label_key(labels))} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+
+### FUNCTION :: Label Formatting #########################################################
+def _label_key(labels: Optional[Dict[str, str]]) -> LabelKey:
+    if not labels:
+        return ()
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _format_labels(key: LabelKey) -> str:
+    if not key:
+        return ""
+    escaped = (value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"') for _, value in key)
+    return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(key, escaped)) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+
+### FUNCTION :: Start Metrics Server #####################################################
+def start_metrics_server(metrics: Metrics, address: str = "127.0.0.1", port: int = 9464) -> ThreadingHTTPServer:
+    """Serves GET /metrics from a daemon thread. Call shutdown() on the returned server to stop it."""
+
+    class MetricsRequestHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = metrics.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            # Scrapes are not application events
+            pass
+
+    server = ThreadingHTTPServer((address, int(port)), MetricsRequestHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
@@ -0,0 +1,88 @@
+### SECTION :: Module Imports ############################################################
+import threading
+from typing import Any, Dict, Optional
+
+
+
+### CLASS :: Open Event ##################################################################
+class OpenEvent:
+    """Calendar object of an extend trigger that later matches may still extend."""
+    __slots__ = ("url", "etag", "end_time", "ical", "timezone")
+
+    def __init__(self, url: str, etag: Optional[str], end_time: str, ical: str, timezone: str):
+        self.url = url
+        self.etag = etag
+        self.end_time = end_time
+        self.ical = ical
+        self.timezone = timezone
+
+
+
+### CLASS :: Open Event Tracker ##########################################################
+class OpenEventTracker:
+    """In-memory URL, ETag and DTEND of the latest event per extend key.
+
+    Only events with the ETag of this service's own last write are tracked. Without it
+    an edit made on the server in the meantime could not be detected, so the next
+    match of the key creates a new event instead.
+
+    A key holds at most one event, so the table is bounded by the number of extend
+    triggers and topics. lock(key) only makes jobs of one key run one at a time, it
+    does not order them: workers may take two queued jobs of a key out of message
+    order. That is harmless because every match of a trigger has the same duration,
+    so an older job ends no later than the newer one and is skipped as already covered.
+    The event then starts at the newer message, at most one queue wait late.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._events: Dict[str, OpenEvent] = {}
+        self._extended_total = 0
+        self._opened_total = 0
+
+    def lock(self, key: str) -> threading.Lock:
+        """Returns the lock guarding one extend key."""
+        with self._lock:
+            key_lock = self._key_locks.get(key)
+            if key_lock is None:
+                key_lock = self._key_locks[key] = threading.Lock()
+            return key_lock
+
+    def get(self, key: str) -> Optional[OpenEvent]:
+        """Returns the tracked event of a key, if any."""
+        with self._lock:
+            return self._events.get(key)
+
+    def open(self, key: str, event: OpenEvent) -> None:
+        """Starts tracking a newly created event, replacing the previous one."""
+        with self._lock:
+            if not event.etag:
+                self._events.pop(key, None)
+                return
+            self._events[key] = event
+            self._opened_total += 1
+
+    def extended(self, key: str, end_time: str, ical: str, etag: Optional[str]) -> None:
+        """Records a successful extension of the tracked event."""
+        with self._lock:
+            event = self._events.get(key)
+            if event is None:
+                return
+            if not etag:
+                del self._events[key]
+                return
+            event.end_time = end_time
+            event.ical = ical
+            event.etag = etag
+            self._extended_total += 1
+
+    def forget(self, key: str) -> None:
+        """Stops tracking the event of a key."""
+        with self._lock:
+            self._events.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns a snapshot of tracker counters."""
+        with self._lock:
+            return {"open_events": len(self._events), "opened_events": self._opened_total, "extended_events": self._extended_total}
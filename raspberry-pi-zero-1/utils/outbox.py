@@ -0,0 +1,138 @@
+### SECTION :: Module Imports ############################################################
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List
+
+
+
+### CLASS :: CalDAV Write Outbox #########################################################
+class Outbox:
+    """Append-only JSON-lines journal of CalDAV jobs that have not completed yet.
+
+    Every job is written as {"id": n, "job": {...}} before it is queued and an
+    {"ack": n} record is appended once it finished or was given up on. Records are
+    written to the OS immediately, so they survive a process restart. fsync is
+    batched: it runs once fsync_batch records are unsynced or fsync_interval seconds
+    after the first unsynced record, bounding what a power loss can take with it.
+    """
+
+    def __init__(self, journal_path: str, fsync_batch: int = 32, fsync_interval: float = 0.5, compact_after: int = 1000):
+        self.journal_path = journal_path
+        self.fsync_batch = max(1, int(fsync_batch))
+        self.fsync_interval = max(0.0, float(fsync_interval))
+        self.compact_after = max(1, int(compact_after))
+        self._lock = threading.Lock()
+        self._pending: Dict[int, Dict[str, Any]] = {}
+        self._next_id = 1
+        self._unsynced = 0
+        self._acks_since_compact = 0
+        self._fsync_count = 0
+        self._closed = False
+        self._sync_event = threading.Event()
+
+        self._load()
+        self._file = open(self.journal_path, 'a', encoding='utf-8')
+        self._compact_locked()
+
+        self._sync_thread = threading.Thread(target=self._sync_loop, name="outbox-fsync", daemon=True)
+        self._sync_thread.start()
+
+    def _load(self) -> None:
+        """Rebuilds the pending set from an existing journal."""
+        if not os.path.exists(self.journal_path):
+            return
+        with open(self.journal_path, 'r', encoding='utf-8') as journal:
+            for line in journal:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn final line from a power loss is expected, skip it
+                    continue
+                if 'ack' in record:
+                    self._pending.pop(record['ack'], None)
+                elif 'id' in record:
+                    self._pending[record['id']] = record['job']
+                    self._next_id = max(self._next_id, record['id'] + 1)
+
+    def _write_locked(self, record: Dict[str, Any]) -> None:
+        """Writes a record and fsyncs once the batch is full. Caller holds the lock."""
+        self._file.write(json.dumps(record, separators=(',', ':')) + "\n")
+        self._file.flush()
+        self._unsynced += 1
+        if self._unsynced >= self.fsync_batch:
+            self._fsync_locked()
+        else:
+            self._sync_event.set()
+
+    def _fsync_locked(self) -> None:
+        """Forces unsynced records to disk. Caller holds the lock."""
+        if self._unsynced:
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
+            self._fsync_count += 1
+
+    def _sync_loop(self) -> None:
+        """Flushes partially filled batches after fsync_interval seconds."""
+        while not self._closed:
+            self._sync_event.wait()
+            self._sync_event.clear()
+            time.sleep(self.fsync_interval)
+            with self._lock:
+                if not self._closed:
+                    self._fsync_locked()
+
+    def _compact_locked(self) -> None:
+        """Rewrites the journal with pending jobs only. Caller holds the lock."""
+        temp_path = self.journal_path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as temp_file:
+            for job_id, job in self._pending.items():
+                temp_file.write(json.dumps({"id": job_id, "job": job}, separators=(',', ':')) + "\n")
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        self._file.close()
+        os.replace(temp_path, self.journal_path)
+        self._file = open(self.journal_path, 'a', encoding='utf-8')
+        self._unsynced = 0
+        self._acks_since_compact = 0
+
+    def append(self, job: Dict[str, Any]) -> int:
+        """Persists a job and returns its id."""
+        with self._lock:
+            job_id = self._next_id
+            self._next_id += 1
+            self._pending[job_id] = job
+            self._write_locked({"id": job_id, "job": job})
+            return job_id
+
+    def ack(self, job_id: int) -> None:
+        """Marks a job as finished."""
+        with self._lock:
+            if self._closed or self._pending.pop(job_id, None) is None:
+                return
+            self._write_locked({"ack": job_id})
+            self._acks_since_compact += 1
+            if self._acks_since_compact >= self.compact_after and len(self._pending) < self.compact_after:
+                self._compact_locked()
+
+    def pending(self) -> List[Dict[str, Any]]:
+        """Returns unfinished jobs in the order they were appended, each with its 'id'."""
+        with self._lock:
+            return [{"id": job_id, "job": job} for job_id, job in sorted(self._pending.items())]
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns a snapshot of journal counters."""
+        with self._lock:
+            return {"pending_jobs": len(self._pending), "unsynced_records": self._unsynced, "fsync_count": self._fsync_count}
+
+    def close(self) -> None:
+        """Syncs and closes the journal."""
+        with self._lock:
+            if self._closed:
+                return
+            self._fsync_locked()
+            self._closed = True
+            self._file.close()
+        self._sync_event.set()
+
@@ -0,0 +1,133 @@
+### SECTION :: Module Imports ############################################################
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+LimitSpec = Tuple[float, int, int]
+
+
+
+### CLASS :: Token Bucket ################################################################
+class TokenBucket:
+    """Token bucket allowing rate requests per second with bursts of up to burst requests.
+
+    reserve() always takes a token and lets the balance go negative, so callers are
+    served in the order they reserved and sleep for the returned time.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+
+    def _refill_locked(self, now: float) -> None:
+        """Adds the tokens earned since the last update. Caller holds the lock."""
+        self._tokens = min(float(self.burst), self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Takes one token and returns the seconds to wait before using it."""
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            self._refill_locked(time.monotonic())
+            self._tokens -= 1.0
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def wait_seconds(self) -> float:
+        """Returns the wait a request reserving now would get."""
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            self._refill_locked(time.monotonic())
+            return 0.0 if self._tokens >= 1 else (1.0 - self._tokens) / self.rate
+
+
+
+### CLASS :: Request Limit ###############################################################
+class _Limit:
+    """Token bucket and in-flight cap of one server or calendar."""
+    __slots__ = ("bucket", "slots", "max_in_flight")
+
+    def __init__(self, spec: LimitSpec):
+        rate, burst, max_in_flight = spec
+        self.bucket = TokenBucket(rate, burst)
+        self.max_in_flight = max(0, int(max_in_flight))
+        self.slots = threading.BoundedSemaphore(self.max_in_flight) if self.max_in_flight else None
+
+
+
+### CLASS :: CalDAV Request Limiter ######################################################
+class RequestLimiter:
+    """Rate and concurrency limits for CalDAV requests, per server and per calendar.
+
+    A spec is (requests per second, burst, max in flight), 0 meaning unlimited.
+    Calendars without their own spec share calendar_default. acquire() sleeps until
+    the tokens are due and then blocks until an in-flight slot is free, so excess work
+    waits in the calling worker instead of failing, and a worker waiting for tokens
+    holds no slot another calendar could use.
+    """
+
+    def __init__(self, server_spec: LimitSpec, calendar_default: LimitSpec, calendar_specs: Optional[Dict[str, LimitSpec]] = None):
+        self._lock = threading.Lock()
+        self._server = _Limit(server_spec)
+        self._calendar_default = calendar_default
+        self._calendar_specs = {self.calendar_key(url): spec for url, spec in (calendar_specs or {}).items()}
+        self._calendars: Dict[str, _Limit] = {}
+        self._waited_seconds = 0.0
+
+    @staticmethod
+    def calendar_key(url: str) -> str:
+        """Normalizes a calendar URL, or the calendar of an event URL ending in .ics."""
+        url = str(url).rstrip('/')
+        if url.endswith('.ics'):
+            url = url.rsplit('/', 1)[0]
+        return url
+
+    def _calendar(self, key: str) -> _Limit:
+        """Returns the limit of a calendar, creating it on first use."""
+        with self._lock:
+            limit = self._calendars.get(key)
+            if limit is None:
+                limit = self._calendars[key] = _Limit(self._calendar_specs.get(key, self._calendar_default))
+            return limit
+
+    @contextmanager
+    def acquire(self, url: str) -> Iterator[float]:
+        """Holds a server and a calendar slot for one request and yields the seconds spent waiting."""
+        calendar = self._calendar(self.calendar_key(url))
+        started = time.monotonic()
+        delay = max(self._server.bucket.reserve(), calendar.bucket.reserve())
+        if delay > 0:
+            time.sleep(delay)
+        # Always take the server slot first so two workers cannot deadlock
+        held = []
+        try:
+            for limit in (self._server, calendar):
+                if limit.slots is not None:
+                    limit.slots.acquire()
+                    held.append(limit)
+            waited = time.monotonic() - started
+            with self._lock:
+                self._waited_seconds += waited
+            yield waited
+        finally:
+            for limit in reversed(held):
+                limit.slots.release()
+
+    def wait_seconds(self) -> Dict[str, float]:
+        """Returns the current wait of every bucket, keyed 'server' or by calendar URL."""
+        with self._lock:
+            calendars = list(self._calendars.items())
+        waits = {"server": round(self._server.bucket.wait_seconds(), 3)}
+        for key, limit in calendars:
+            waits[key] = round(limit.bucket.wait_seconds(), 3)
+        return waits
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns a snapshot of limiter counters."""
+        with self._lock:
+            return {"limited_calendars": len(self._calendars), "rate_wait_seconds_total": round(self._waited_seconds, 3)}
@@ -0,0 +1,82 @@
+### SECTION :: Module Imports ############################################################
+import heapq
+import itertools
+import random
+import threading
+import time
+from typing import Any, Callable, List, Optional, Tuple
+
+from utils import logger
+
+# Kinds of scheduled callbacks, pending() counts them separately
+KIND_RETRY = "retry"
+KIND_TIMER = "timer"
+
+
+
+### FUNCTION :: Jittered Backoff #########################################################
+def jittered_backoff(base_delay: float, attempt: int, max_delay: float) -> float:
+    """Returns a delay between half and all of base_delay * 2^attempt, capped at max_delay."""
+    ceiling = min(max_delay, base_delay * (2 ** attempt))
+    return random.uniform(ceiling / 2, ceiling)
+
+
+
+### CLASS :: Retry Scheduler #############################################################
+class RetryScheduler:
+    """Single timer thread running callbacks from a heap ordered by due time.
+
+    Replaces one sleeping thread per retry. Callbacks run on the scheduler thread and
+    should only hand work over without waiting, e.g. by offering a job to the worker
+    pool. Job retries and internal timers such as the circuit breaker's are scheduled
+    with their own kind, so pending() can report retries alone.
+    """
+
+    def __init__(self, log_prefix: str = "[DAV]"):
+        self.log_prefix = log_prefix
+        self._heap: List[Tuple[float, int, str, Callable[[], Any]]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="caldav-retry-scheduler", daemon=True)
+
+    def start(self) -> None:
+        """Starts the timer thread."""
+        self._thread.start()
+
+    def schedule(self, delay: float, callback: Callable[[], Any], kind: str = KIND_RETRY) -> None:
+        """Runs callback after delay seconds."""
+        with self._condition:
+            heapq.heappush(self._heap, (time.monotonic() + max(0.0, delay), next(self._sequence), kind, callback))
+            self._condition.notify()
+
+    def pending(self, kind: Optional[str] = KIND_RETRY) -> int:
+        """Returns the number of scheduled callbacks of a kind, of every kind with None."""
+        with self._condition:
+            if kind is None:
+                return len(self._heap)
+            return sum(1 for entry in self._heap if entry[2] == kind)
+
+    def _run(self) -> None:
+        """Waits for the earliest due callback and runs it."""
+        while True:
+            with self._condition:
+                while not self._stopping and (not self._heap or self._heap[0][0] > time.monotonic()):
+                    timeout = self._heap[0][0] - time.monotonic() if self._heap else None
+                    self._condition.wait(timeout)
+                if self._stopping:
+                    return
+                _, _, _, callback = heapq.heappop(self._heap)
+            try:
+                callback()
+
+            # Handle Errors Escaping the Callback
+            except Exception as e:
+                log_data = {"exception_type": type(e).__name__, "details": str(e)}
+                logger.error("%s Retry Scheduler Error | %s", self.log_prefix, logger.format_log_data(log_data))
+
+    def shutdown(self) -> None:
+        """Stops the timer thread, callbacks not yet due are discarded."""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
@@ -0,0 +1,93 @@
+### SECTION :: Module Imports ############################################################
+import mmap
+import os
+from typing import BinaryIO, Iterator, Optional
+
+DEFAULT_BLOCK_SIZE = 64 * 1024
+
+
+
+### FUNCTION :: Read Lines Backwards #####################################################
+def read_lines_reverse(path: str, block_size: int = DEFAULT_BLOCK_SIZE, use_mmap: bool = False,
+                       contains: Optional[bytes] = None) -> Iterator[str]:
+    """Yields the lines of a plain text file from the last to the first.
+
+    The file is read from the end in fixed-size blocks (or scanned through mmap), so
+    the cost depends on how far back the caller reads, not on the file size. Stop
+    iterating to stop reading. With contains, lines without that byte string are
+    skipped before they are decoded. Lines keep their trailing newline like
+    readlines().
+    """
+    with open(path, 'rb') as log_file:
+        yield from read_file_lines_reverse(log_file, block_size, use_mmap, contains)
+
+
+def read_file_lines_reverse(log_file: BinaryIO, block_size: int = DEFAULT_BLOCK_SIZE, use_mmap: bool = False,
+                            contains: Optional[bytes] = None) -> Iterator[str]:
+    """Like read_lines_reverse() for a file already opened in binary mode, e.g. an unnamed temporary file."""
+    file_size = os.fstat(log_file.fileno()).st_size
+    if file_size == 0:
+        return
+    if use_mmap:
+        yield from _mmap_lines_reverse(log_file, file_size, contains)
+    else:
+        yield from _block_lines_reverse(log_file, file_size, max(1024, int(block_size)), contains)
+
+
+def _decode(line: bytes, contains: Optional[bytes]) -> Optional[str]:
+    """Decodes a line unless it is filtered out by contains."""
+    if contains is not None and contains not in line:
+        return None
+    return line.decode('utf-8', errors='replace')
+
+
+def _block_lines_reverse(log_file, file_size: int, block_size: int, contains: Optional[bytes]) -> Iterator[str]:
+    """Reads blocks backwards and splits them into lines, carrying the partial first line to the next block."""
+    position = file_size
+    partial = b""
+    # Only the final line of the file may lack a newline
+    terminated = False
+    while position > 0:
+        read_size = min(block_size, position)
+        position -= read_size
+        log_file.seek(position)
+        pieces = (log_file.read(read_size) + partial).split(b"\n")
+        partial = pieces[0]
+        last = len(pieces) - 1
+        for index in range(last, 0, -1):
+            if index == last and not terminated:
+                terminated = True
+                if not pieces[index]:
+                    continue
+                line_text = _decode(pieces[index], contains)
+            else:
+                line_text = _decode(pieces[index] + b"\n", contains)
+            if line_text is not None:
+                yield line_text
+        if last > 0:
+            terminated = True
+    if terminated or partial:
+        line_text = _decode(partial + b"\n" if terminated else partial, contains)
+        if line_text is not None:
+            yield line_text
+
+
+def _mmap_lines_reverse(log_file, file_size: int, contains: Optional[bytes]) -> Iterator[str]:
+    """Walks newline positions backwards through a read-only memory map."""
+    with mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        end = file_size
+        if mapped[end - 1:end] == b"\n":
+            search_end = end - 1
+        else:
+            search_end = end
+        while search_end >= 0:
+            start = mapped.rfind(b"\n", 0, search_end) + 1
+            line = mapped[start:end]
+            if line:
+                line_text = _decode(line, contains)
+                if line_text is not None:
+                    yield line_text
+            if start == 0:
+                break
+            end = start
+            search_end = start - 1
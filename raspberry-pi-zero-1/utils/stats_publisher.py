@@ -0,0 +1,130 @@
+### SECTION :: Module Imports ############################################################
+import os
+import resource
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Optional
+
+
+
+### CLASS :: Service Stats ###############################################################
+class ServiceStats:
+    """Thread-safe counters behind the periodic status document.
+
+    Totals count from start. Rates and latency percentiles cover the interval since
+    the previous snapshot(), so every published document describes its own window.
+    """
+
+    def __init__(self, latency_samples: int = 1000):
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self._window_start = self._started
+        self._messages = 0
+        self._succeeded = 0
+        self._failed = 0
+        self._window_messages = 0
+        self._window_succeeded = 0
+        self._window_failed = 0
+        self._latencies_ms = deque(maxlen=max(1, int(latency_samples)))
+
+    def message_received(self) -> None:
+        """Counts a received MQTT message."""
+        with self._lock:
+            self._messages += 1
+            self._window_messages += 1
+
+    def caldav_result(self, succeeded: bool) -> None:
+        """Counts a finished CalDAV job attempt."""
+        with self._lock:
+            if succeeded:
+                self._succeeded += 1
+                self._window_succeeded += 1
+            else:
+                self._failed += 1
+                self._window_failed += 1
+
+    def caldav_latency(self, latency_ms: float) -> None:
+        """Adds the latency of a successful CalDAV write."""
+        with self._lock:
+            self._latencies_ms.append(latency_ms)
+
+    def uptime_seconds(self) -> float:
+        """Returns the seconds since the stats were created."""
+        return time.monotonic() - self._started
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Returns totals, window rates and write latency percentiles, then starts a new window."""
+        now = time.monotonic()
+        with self._lock:
+            window_seconds = max(now - self._window_start, 1e-6)
+            latencies = sorted(self._latencies_ms)
+            attempts = self._window_succeeded + self._window_failed
+            snapshot = {
+                "messages_total": self._messages,
+                "messages_per_second": round(self._window_messages / window_seconds, 3),
+                "caldav_success_total": self._succeeded,
+                "caldav_failure_total": self._failed,
+                "caldav_success_per_minute": round(self._window_succeeded / window_seconds * 60, 2),
+                "caldav_failure_per_minute": round(self._window_failed / window_seconds * 60, 2),
+                "caldav_success_ratio": round(self._window_succeeded / attempts, 3) if attempts else None,
+                "write_latency_ms_p50": _percentile(latencies, 0.5),
+                "write_latency_ms_p95": _percentile(latencies, 0.95),
+            }
+            self._window_start = now
+            self._window_messages = self._window_succeeded = self._window_failed = 0
+            self._latencies_ms.clear()
+        return snapshot
+
+
+
+### CLASS :: Stats Publisher #############################################################
+class StatsPublisher:
+    """Daemon thread that publishes a status document every interval seconds."""
+
+    def __init__(self, interval: float, build_document: Callable[[], Dict[str, Any]], publish: Callable[[Dict[str, Any]], None]):
+        self.interval = max(1.0, float(interval))
+        self.build_document = build_document
+        self.publish = publish
+        self._stop_event = threading.Event()
+        self._publish_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Starts the publishing thread."""
+        self._thread = threading.Thread(target=self._run, name="stats-publisher", daemon=True)
+        self._thread.start()
+
+    def publish_now(self) -> None:
+        """Builds and publishes a document outside the schedule, e.g. right after connecting."""
+        with self._publish_lock:
+            self.publish(self.build_document())
+
+    def stop(self) -> None:
+        """Stops publishing after the current document."""
+        self._stop_event.set()
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.publish_now()
+            except Exception:
+                # Publishing resumes on the next interval, the broker may be reconnecting
+                continue
+
+
+
+### FUNCTION :: Process Memory ###########################################################
+def resident_memory_bytes() -> int:
+    """Returns the current resident set size, or the peak where /proc is not available."""
+    try:
+        with open("/proc/self/statm", 'r') as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _percentile(ordered: list, fraction: float) -> Optional[float]:
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
@@ -0,0 +1,218 @@
+### SECTION :: Module Imports ############################################################
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from utils import logger
+
+DEFAULT_FIELDS = ("battery", "linkquality", "voltage", "temperature")
+
+
+
+### SECTION :: Schema ####################################################################
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS readings (
+    mqtt_topic TEXT NOT NULL,
+    field TEXT NOT NULL,
+    ts REAL NOT NULL,
+    value REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS readings_series ON readings (mqtt_topic, field, ts);
+CREATE TABLE IF NOT EXISTS latest (
+    mqtt_topic TEXT NOT NULL,
+    field TEXT NOT NULL,
+    ts REAL NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (mqtt_topic, field)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS hourly (
+    mqtt_topic TEXT NOT NULL,
+    field TEXT NOT NULL,
+    hour INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    min_value REAL NOT NULL,
+    max_value REAL NOT NULL,
+    sum_value REAL NOT NULL,
+    PRIMARY KEY (mqtt_topic, field, hour)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS hourly_age ON hourly (hour);
+"""
+
+
+
+### CLASS :: Telemetry Store #############################################################
+class TelemetryStore:
+    """SQLite store of numeric payload fields seen on MQTT, bounded in size.
+
+    Each (topic, field) series keeps its newest max_readings raw readings. Every
+    reading is also folded into an hourly min/max/avg row, kept for retention_days.
+    The latest value of each series has its own table, so threshold queries such as
+    "battery under 20" read one row per device, and series silent for retention_days
+    drop out of it. record() only buffers readings, a flush thread writes them in one
+    transaction every flush_interval seconds or once max_buffered have accumulated, so
+    the MQTT thread never waits for SQLite.
+    """
+
+    def __init__(self, db_path: str, fields: Iterable[str] = DEFAULT_FIELDS, max_readings: int = 1000,
+                 retention_days: float = 90, flush_interval: float = 10.0, max_buffered: int = 500,
+                 read_only: bool = False, log_prefix: str = "[APP]"):
+        self.db_path = db_path
+        self.fields = tuple(fields)
+        self.max_readings = max(1, int(max_readings))
+        self.retention_days = max(0.0, float(retention_days))
+        self.flush_interval = max(0.0, float(flush_interval))
+        self.max_buffered = max(1, int(max_buffered))
+        self.log_prefix = log_prefix
+        # _lock guards the buffer and counters, _db_lock the connection
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        self._buffer: List[Tuple[str, str, float, float]] = []
+        self._pruned_hour = 0
+        self._recorded = 0
+        self._flushes = 0
+        self._closed = False
+        self._flush_event = threading.Event()
+        self._flush_thread: Optional[threading.Thread] = None
+        if read_only:
+            self._conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, check_same_thread=False, isolation_level=None)
+        else:
+            self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+            self._flush_thread = threading.Thread(target=self._flush_loop, name="telemetry-flush", daemon=True)
+            self._flush_thread.start()
+
+    def record(self, topic: str, payload: Dict[str, Any], now: Optional[float] = None) -> int:
+        """Buffers the numeric configured fields of a payload. Returns the number of readings taken."""
+        timestamp = now if now is not None else time.time()
+        readings = []
+        for field in self.fields:
+            value = payload.get(field)
+            # bool is an int subclass, a contact sensor's true/false is not a reading
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                readings.append((topic, field, timestamp, float(value)))
+        if not readings:
+            return 0
+        with self._lock:
+            self._buffer.extend(readings)
+            self._recorded += len(readings)
+            if len(self._buffer) >= self.max_buffered or not self.flush_interval:
+                self._flush_event.set()
+        return len(readings)
+
+    def _flush_loop(self) -> None:
+        """Writes the buffer every flush_interval seconds, or early once max_buffered is reached."""
+        while not self._closed:
+            self._flush_event.wait(self.flush_interval or None)
+            self._flush_event.clear()
+            try:
+                with self._db_lock:
+                    if not self._closed:
+                        self._flush_db_locked()
+
+            # Handle Telemetry Write Errors, the Taken Readings Are Lost
+            except Exception as e:
+                log_data = {"telemetry_file": self.db_path, "exception_type": type(e).__name__, "details": str(e)}
+                logger.error("%s Telemetry Store Error | %s", self.log_prefix, logger.format_log_data(log_data))
+
+    def flush(self) -> int:
+        """Writes buffered readings. Returns the number of readings written."""
+        with self._db_lock:
+            return self._flush_db_locked()
+
+    def _flush_db_locked(self) -> int:
+        """Writes buffered readings and prunes touched series. Caller holds the database lock."""
+        with self._lock:
+            buffered, self._buffer = self._buffer, []
+        if not buffered:
+            return 0
+        self._conn.execute("BEGIN")
+        try:
+            self._conn.executemany("INSERT INTO readings (mqtt_topic, field, ts, value) VALUES (?, ?, ?, ?)", buffered)
+            self._conn.executemany(
+                "INSERT INTO latest (mqtt_topic, field, ts, value) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (mqtt_topic, field) DO UPDATE SET ts = excluded.ts, value = excluded.value WHERE excluded.ts >= latest.ts",
+                buffered
+            )
+            self._conn.executemany(
+                "INSERT INTO hourly (mqtt_topic, field, hour, count, min_value, max_value, sum_value) VALUES (?, ?, ?, 1, ?, ?, ?) "
+                "ON CONFLICT (mqtt_topic, field, hour) DO UPDATE SET count = count + 1, min_value = MIN(min_value, excluded.min_value), "
+                "max_value = MAX(max_value, excluded.max_value), sum_value = sum_value + excluded.sum_value",
+                [(topic, field, int(timestamp // 3600), value, value, value) for topic, field, timestamp, value in buffered]
+            )
+            for topic, field in {(topic, field) for topic, field, _, _ in buffered}:
+                self._conn.execute(
+                    "DELETE FROM readings WHERE mqtt_topic = ? AND field = ? AND ts < "
+                    "(SELECT ts FROM readings WHERE mqtt_topic = ? AND field = ? ORDER BY ts DESC LIMIT 1 OFFSET ?)",
+                    (topic, field, topic, field, self.max_readings - 1)
+                )
+            current_hour = int(time.time() // 3600)
+            if self.retention_days and current_hour != self._pruned_hour:
+                oldest_hour = current_hour - int(self.retention_days * 24)
+                self._conn.execute("DELETE FROM hourly WHERE hour < ?", (oldest_hour,))
+                self._conn.execute("DELETE FROM latest WHERE ts < ?", (oldest_hour * 3600,))
+                self._pruned_hour = current_hour
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        with self._lock:
+            self._flushes += 1
+        return len(buffered)
+
+    def last_readings(self, field: str, count: int = 5, topic: Optional[str] = None) -> Dict[str, List[Tuple[float, float]]]:
+        """Returns the newest readings of a field per topic as (timestamp, value), oldest first."""
+        with self._db_lock:
+            self._flush_db_locked()
+            if topic is not None:
+                topics = [topic]
+            else:
+                topics = [row[0] for row in self._conn.execute("SELECT mqtt_topic FROM latest WHERE field = ? ORDER BY mqtt_topic", (field,))]
+            readings = {}
+            for series_topic in topics:
+                rows = self._conn.execute(
+                    "SELECT ts, value FROM readings WHERE mqtt_topic = ? AND field = ? ORDER BY ts DESC LIMIT ?",
+                    (series_topic, field, max(1, int(count)))
+                ).fetchall()
+                if rows:
+                    readings[series_topic] = rows[::-1]
+        return readings
+
+    def below(self, field: str, threshold: float) -> List[Tuple[str, float, float]]:
+        """Returns (topic, timestamp, value) of every topic whose latest reading of a field is under threshold."""
+        with self._db_lock:
+            self._flush_db_locked()
+            return self._conn.execute(
+                "SELECT mqtt_topic, ts, value FROM latest WHERE field = ? AND value < ? ORDER BY value, mqtt_topic",
+                (field, threshold)
+            ).fetchall()
+
+    def hourly(self, topic: str, field: str, since: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Returns the hourly min, max and average of a series, oldest first."""
+        with self._db_lock:
+            self._flush_db_locked()
+            rows = self._conn.execute(
+                "SELECT hour, count, min_value, max_value, sum_value FROM hourly WHERE mqtt_topic = ? AND field = ? AND hour >= ? ORDER BY hour",
+                (topic, field, int((since or 0) // 3600))
+            ).fetchall()
+        return [{"hour_start": hour * 3600, "count": count, "min": low, "max": high, "avg": total / count}
+                for hour, count, low, high, total in rows]
+
+    def stats(self) -> Dict[str, int]:
+        """Returns counters for shutdown and status logging."""
+        with self._lock:
+            return {"telemetry_recorded": self._recorded, "telemetry_buffered": len(self._buffer), "telemetry_flushes": self._flushes}
+
+    def close(self) -> None:
+        """Stops the flush thread, writes buffered readings and closes the database connection."""
+        self._closed = True
+        self._flush_event.set()
+        if self._flush_thread is not None:
+            self._flush_thread.join()
+        with self._db_lock:
+            try:
+                self._flush_db_locked()
+            finally:
+                self._conn.close()
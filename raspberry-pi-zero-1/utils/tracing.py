@@ -0,0 +1,125 @@
+### SECTION :: Module Imports ############################################################
+import itertools
+import json
+import logging
+import os
+import random
+import threading
+import time
+from typing import Any, List, Optional, Tuple
+
+from utils.constants import APP_NAME
+from utils.logger import RotatingGzipFileHandler, set_log_context
+
+
+
+### CLASS :: Trace #######################################################################
+class Trace:
+    """Stage timings of one MQTT message, from the paho callback to the CalDAV response.
+
+    Stages are laps: lap(stage) records the time since the previous lap, so the
+    stages of a trace add up to its total. The trace is handed from the MQTT thread
+    to a CalDAV worker with the job and only ever timed by one thread at a time.
+    Unsampled traces only carry their id for log lines.
+    """
+    __slots__ = ("trace_id", "topic", "sampled", "started", "spans", "handed_off", "_last_ns")
+
+    def __init__(self, trace_id: str, topic: str, sampled: bool):
+        self.trace_id = trace_id
+        self.topic = topic
+        self.sampled = sampled
+        self.started = time.time()
+        self.spans: List[Tuple[str, float]] = []
+        self.handed_off = False
+        self._last_ns = time.perf_counter_ns()
+
+    def lap(self, stage: str) -> None:
+        """Records the time since the previous lap as stage."""
+        if not self.sampled:
+            return
+        now_ns = time.perf_counter_ns()
+        self.spans.append((stage, (now_ns - self._last_ns) / 1e6))
+        self._last_ns = now_ns
+
+    def add_span(self, stage: str, duration_ms: float) -> None:
+        """Records a stage measured elsewhere, e.g. the paho receive time."""
+        if self.sampled:
+            self.spans.append((stage, duration_ms))
+
+
+
+### CLASS :: Tracer ######################################################################
+class Tracer:
+    """Creates traces and writes the sampled ones as JSON lines to a rotating trace file.
+
+    Every message gets a trace id, which is added to the log lines of the thread the
+    trace is active on. Only one in 1/sample_rate traces records timings.
+    """
+
+    def __init__(self, trace_path: str, sample_rate: float, max_bytes: int = 5 * 1024 * 1024, backup_count: int = 3):
+        self.trace_path = trace_path
+        self.sample_rate = min(1.0, max(0.0, float(sample_rate)))
+        self._id_prefix = os.urandom(2).hex()
+        self._counter = itertools.count(1)
+        self._written = 0
+        self._lock = threading.Lock()
+        self._handler = RotatingGzipFileHandler(trace_path, batch_size=16, encoding='utf-8', max_bytes=max_bytes, backup_count=backup_count)
+        self._handler.setFormatter(logging.Formatter('%(message)s'))
+        self._logger = logging.getLogger(f"{APP_NAME}.trace")
+        self._logger.setLevel(logging.INFO)
+        self._logger.propagate = False
+        self._logger.addHandler(self._handler)
+
+    def start(self, topic: str) -> Trace:
+        """Starts the trace of a received message."""
+        trace_id = f"{self._id_prefix}{next(self._counter):08x}"
+        return Trace(trace_id, topic, random.random() < self.sample_rate)
+
+    def finish(self, trace: Trace, outcome: str, event_mode: Optional[str] = None) -> None:
+        """Writes a sampled trace."""
+        if not trace.sampled:
+            return
+        record: dict = {
+            "trace_id": trace.trace_id,
+            "ts": time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(trace.started)) + f".{int(trace.started * 1000) % 1000:03d}",
+            "topic": trace.topic,
+            "event_mode": event_mode,
+            "outcome": outcome,
+            "total_ms": round(sum(duration for _, duration in trace.spans), 3),
+            "spans": [[stage, round(duration, 3)] for stage, duration in trace.spans]
+        }
+        self._logger.info(json.dumps(record))
+        with self._lock:
+            self._written += 1
+
+    def stats(self) -> dict:
+        """Returns counters for shutdown logging."""
+        with self._lock:
+            return {"trace_file": self.trace_path, "sample_rate": self.sample_rate, "traces_written": self._written}
+
+    def close(self) -> None:
+        """Writes out buffered traces and closes the trace file."""
+        self._logger.removeHandler(self._handler)
+        self._handler.close()
+
+
+
+### FUNCTION :: Active Trace #############################################################
+_active = threading.local()
+
+def activate(trace: Optional[Trace]) -> None:
+    """Makes trace the active trace of the calling thread and tags its log lines with the trace id."""
+    _active.trace = trace
+    set_log_context({"trace_id": trace.trace_id} if trace is not None else None)
+
+
+def active() -> Optional[Trace]:
+    """Returns the active trace of the calling thread."""
+    return getattr(_active, "trace", None)
+
+
+def lap(stage: str) -> None:
+    """Records a lap on the active trace of the calling thread, if there is one."""
+    trace = getattr(_active, "trace", None)
+    if trace is not None:
+        trace.lap(stage)
@@ -0,0 +1,129 @@
+### SECTION :: Module Imports ############################################################
+from typing import Any, Dict, List, Optional, Tuple
+
+TriggerKey = Tuple[int, Optional[str], str, Optional[str]]
+
+
+
+### FUNCTION :: Trigger Key ##############################################################
+def trigger_key(position: int, trigger: Dict[str, Any]) -> TriggerKey:
+    """Returns a key for per-trigger state that stays stable across config reloads.
+
+    A reloaded trigger only keeps the key when it is still at the same position with
+    the same topic, mode and summary, so state never carries over to another trigger.
+    """
+    return position, trigger.get('MQTT_TOPIC'), str(trigger.get('MODE', '')).lower(), trigger.get('EVENT_SUMMARY')
+
+
+
+### CLASS :: Wildcard Trie Node ##########################################################
+class _TopicNode:
+    """Single topic level in the wildcard subscription trie."""
+    __slots__ = ("children", "plus", "hash_triggers", "triggers")
+
+    def __init__(self):
+        self.children: Dict[str, "_TopicNode"] = {}
+        self.plus: Optional["_TopicNode"] = None
+        self.hash_triggers: List[Tuple[int, Dict[str, Any]]] = []
+        self.triggers: List[Tuple[int, Dict[str, Any]]] = []
+
+
+
+### CLASS :: Trigger Dispatch Index ######################################################
+class TriggerIndex:
+    """Maps MQTT topics to their configured triggers.
+
+    Exact topics are resolved with a single dictionary lookup, subscriptions containing
+    '+' or '#' are stored in a trie walked once per topic level. Matches are returned in
+    the order the triggers appear in triggers.json.
+    """
+
+    def __init__(self, triggers: List[Dict[str, Any]]):
+        self.exact: Dict[str, List[Tuple[int, Dict[str, Any]]]] = {}
+        self.root = _TopicNode()
+        self.wildcard_count = 0
+
+        for position, trigger in enumerate(triggers):
+            topic = trigger.get('MQTT_TOPIC')
+            if not isinstance(topic, str):
+                continue
+            if '+' in topic or '#' in topic:
+                self._insert_wildcard(topic, position, trigger)
+            else:
+                self.exact.setdefault(topic, []).append((position, trigger))
+
+    def _insert_wildcard(self, topic: str, position: int, trigger: Dict[str, Any]) -> None:
+        """Adds a wildcard subscription to the trie."""
+        node = self.root
+        levels = topic.split('/')
+        for depth, level in enumerate(levels):
+            if level == '#':
+                if depth != len(levels) - 1:
+                    raise ValueError(f"Invalid MQTT_TOPIC '{topic}': '#' must be the last level")
+                node.hash_triggers.append((position, trigger))
+                self.wildcard_count += 1
+                return
+            if level == '+':
+                if node.plus is None:
+                    node.plus = _TopicNode()
+                node = node.plus
+            else:
+                if '+' in level or '#' in level:
+                    raise ValueError(f"Invalid MQTT_TOPIC '{topic}': wildcards must occupy a whole level")
+                node = node.children.setdefault(level, _TopicNode())
+        node.triggers.append((position, trigger))
+        self.wildcard_count += 1
+
+    def match(self, topic: str) -> List[Dict[str, Any]]:
+        """Returns all triggers subscribed to the given topic."""
+        return [trigger for _, trigger in self.match_positions(topic)]
+
+    def match_positions(self, topic: str) -> List[Tuple[int, Dict[str, Any]]]:
+        """Returns (position in triggers.json, trigger) for all triggers subscribed to the given topic."""
+        exact_matches = self.exact.get(topic)
+        if not self.wildcard_count:
+            return exact_matches or []
+
+        matches: List[Tuple[int, Dict[str, Any]]] = list(exact_matches) if exact_matches else []
+        levels = topic.split('/')
+        # Topics starting with '$' are never matched by leading wildcards (MQTT 3.1.1, 4.7.2)
+        skip_root_wildcards = topic.startswith('$')
+        nodes = [self.root]
+        for depth, level in enumerate(levels):
+            next_nodes = []
+            for node in nodes:
+                if not (skip_root_wildcards and depth == 0):
+                    matches.extend(node.hash_triggers)
+                    if node.plus is not None:
+                        next_nodes.append(node.plus)
+                child = node.children.get(level)
+                if child is not None:
+                    next_nodes.append(child)
+            if not next_nodes:
+                break
+            nodes = next_nodes
+        else:
+            for node in nodes:
+                matches.extend(node.triggers)
+                # 'sport/#' also matches the parent level 'sport'
+                matches.extend(node.hash_triggers)
+
+        matches.sort(key=lambda item: item[0])
+        return matches
+
+    def topics(self) -> List[str]:
+        """Returns every distinct subscription topic in the index."""
+        topics = list(self.exact.keys())
+
+        def _walk(node: _TopicNode, prefix: List[str]) -> None:
+            if node.triggers:
+                topics.append('/'.join(prefix))
+            if node.hash_triggers:
+                topics.append('/'.join(prefix + ['#']))
+            if node.plus is not None:
+                _walk(node.plus, prefix + ['+'])
+            for level, child in node.children.items():
+                _walk(child, prefix + [level])
+
+        _walk(self.root, [])
+        return topics
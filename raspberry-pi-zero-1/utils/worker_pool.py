@@ -0,0 +1,158 @@
+### SECTION :: Module Imports ############################################################
+import queue
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from utils import logger
+
+
+
+### SECTION :: Queue Full Policies #######################################################
+POLICY_REJECT_NEW = "reject_new"
+POLICY_DROP_OLDEST = "drop_oldest"
+QUEUE_FULL_POLICIES = [POLICY_REJECT_NEW, POLICY_DROP_OLDEST]
+
+Job = Tuple[Callable[..., Any], Tuple[Any, ...], str]
+
+
+
+### CLASS :: CalDAV Worker Pool ##########################################################
+class CaldavWorkerPool:
+    """Fixed-size pool of worker threads draining a bounded CalDAV job queue.
+
+    When the queue is full, 'reject_new' refuses the incoming job and 'drop_oldest'
+    discards the longest waiting job to make room. Either way the rejection counter
+    is incremented and submit() returns the job that was shed. Jobs submitted after
+    shutdown() are refused without being shed, so the caller can keep them for later.
+    """
+
+    def __init__(self, worker_count: int, queue_size: int, policy: str, log_prefix: str = "[DAV]"):
+        self.worker_count = max(1, int(worker_count))
+        self.queue_size = max(1, int(queue_size))
+        self.policy = policy if policy in QUEUE_FULL_POLICIES else POLICY_REJECT_NEW
+        self.log_prefix = log_prefix
+        self._queue: "queue.Queue[Optional[Job]]" = queue.Queue(maxsize=self.queue_size)
+        self._lock = threading.Lock()
+        self._active_workers = 0
+        self._rejected_jobs = 0
+        self._completed_jobs = 0
+        self._threads = []
+        self._stopping = False
+
+    def start(self) -> None:
+        """Starts the worker threads."""
+        for i in range(self.worker_count):
+            thread = threading.Thread(target=self._run, name=f"caldav-worker-{i + 1}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, func: Callable[..., Any], args: Tuple[Any, ...], label: str = "", block: bool = False) -> Tuple[bool, Optional[Job]]:
+        """Queues a job. Returns (accepted, shed_job) where shed_job is the job dropped by the queue full policy, if any.
+
+        With block=True the call waits for queue space instead of applying the policy.
+        While the pool is stopping the job is refused and shed_job is None.
+        """
+        job = (func, args, label)
+        if self._stopping:
+            with self._lock:
+                self._rejected_jobs += 1
+            return False, None
+
+        try:
+            if block:
+                self._queue.put(job)
+            else:
+                self._queue.put_nowait(job)
+            return True, None
+        except queue.Full:
+            pass
+
+        if self.policy == POLICY_DROP_OLDEST:
+            try:
+                dropped_job = self._queue.get_nowait()
+                self._queue.task_done()
+            except queue.Empty:
+                # Workers made room in the meantime, nothing was dropped
+                dropped_job = None
+            else:
+                if dropped_job is None:
+                    # Took a shutdown sentinel, put it back so its worker still exits
+                    self._queue.put(None)
+                    with self._lock:
+                        self._rejected_jobs += 1
+                    return False, None
+                with self._lock:
+                    self._rejected_jobs += 1
+            try:
+                self._queue.put_nowait(job)
+                return True, dropped_job
+            except queue.Full:
+                with self._lock:
+                    self._rejected_jobs += 1
+                return False, job
+
+        with self._lock:
+            self._rejected_jobs += 1
+        return False, job
+
+    def offer(self, func: Callable[..., Any], args: Tuple[Any, ...], label: str = "") -> bool:
+        """Queues a job if there is room right now. Returns False on a full queue or while stopping, nothing is shed."""
+        if self._stopping:
+            return False
+        try:
+            self._queue.put_nowait((func, args, label))
+            return True
+        except queue.Full:
+            return False
+
+    @property
+    def stopping(self) -> bool:
+        """Returns True once shutdown() was called."""
+        return self._stopping
+
+    def _run(self) -> None:
+        """Worker loop executing queued jobs until a stop sentinel is received."""
+        while True:
+            job = self._queue.get()
+            if job is None:
+                self._queue.task_done()
+                return
+            func, args, label = job
+            with self._lock:
+                self._active_workers += 1
+            try:
+                func(*args)
+
+            # Handle Errors Escaping the Job Function
+            except Exception as e:
+                log_data = {"job": label, "exception_type": type(e).__name__, "details": str(e)}
+                logger.error("%s Worker Job Error   | %s", self.log_prefix, logger.format_log_data(log_data))
+            finally:
+                with self._lock:
+                    self._active_workers -= 1
+                    self._completed_jobs += 1
+                self._queue.task_done()
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns a snapshot of pool counters."""
+        with self._lock:
+            return {
+                "queue_depth": self._queue.qsize(),
+                "queue_size": self.queue_size,
+                "active_workers": self._active_workers,
+                "worker_count": self.worker_count,
+                "completed_jobs": self._completed_jobs,
+                "rejected_jobs": self._rejected_jobs
+            }
+
+    def shutdown(self, timeout: float) -> bool:
+        """Stops accepting jobs and waits up to timeout seconds for workers to finish. Returns True if drained."""
+        self._stopping = True
+        for _ in self._threads:
+            try:
+                self._queue.put(None, timeout=timeout)
+            except queue.Full:
+                return False
+        for thread in self._threads:
+            thread.join(timeout)
+        return not any(thread.is_alive() for thread in self._threads)